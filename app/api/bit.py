@@ -1,17 +1,33 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from app.models import WordEvent, WordSuggestion, StateBit
+from app.keyboard.beam import BeamDecoder
+from app.keyboard.decoder import HuffmanDecoder
 from app.keyboard.textual_toy import AutocorrectEngine
+from app.keyboard.vector_engine import MAX_CLOSE, VectorAutocorrectEngine
 
 
 async def handle(
     bit: StateBit,
     current_bits: str,
-    autocorrect: AutocorrectEngine,
+    autocorrect: Union[AutocorrectEngine, VectorAutocorrectEngine],
+    decoder: HuffmanDecoder,
+    beam: Optional[BeamDecoder] = None,
+    likelihood: Optional[float] = None,
 ) -> Tuple[str, Optional[WordEvent]]:
-    """Process a bit and return updated state and optional word event"""
+    """Process a bit and return updated state and optional word event.
+
+    decoder tracks current_bits incrementally: one push per clench, one pop per
+    backspace, so no bit is decoded twice. With a beam decoder, its words (which
+    weigh each bit by likelihood, P(bit is 1)) take over from autocorrect, unless
+    the bits decode exactly to a dictionary word."""
     if bit in (StateBit.LEFT_CLENCH, StateBit.RIGHT_CLENCH):
         new_bits = current_bits + str(bit.value)
-        suggestions = await autocorrect.get_suggestions(new_bits)
+        decoder.push(str(bit.value))
+        suggestions = await autocorrect.get_suggestions(new_bits, decoder=decoder)
+        if beam is not None:
+            beam.push(str(bit.value), likelihood)
+            if not decoder.is_word:
+                suggestions = beam.suggestions(MAX_CLOSE) or suggestions
 
         print(suggestions)
 
@@ -20,28 +36,46 @@ async def handle(
                 bits=new_bits,
                 suggestions=[],
                 complete_word=suggestions[0],
+                decoded=decoder.word,
+                is_word=decoder.is_word,
             )
 
         return new_bits, WordEvent(
             bits=new_bits,
             suggestions=suggestions,
             complete_word=None,
+            decoded=decoder.word,
+            is_word=decoder.is_word,
         )
 
     elif bit == StateBit.NOD:
-        # Accept current word, reset state
+        # Accept current word, reset state. The engine conditions its priors on it.
+        # An exact word is taken as typed; otherwise the beam's best guess
+        exact = beam is None or decoder.is_word
+        guess = [] if exact else beam.suggestions(1)
+        accepted = autocorrect.accept(guess[0] if guess else decoder.result)
+        decoder.reset()
+        if beam is not None:
+            beam.reset()
         return "", WordEvent(
             bits=current_bits,
             suggestions=[],
             complete_word=None,
+            accepted=accepted,
         )
 
     elif bit == StateBit.SHAKE:
         # Backspace
+        decoder.pop()
+        autocorrect.pop()
+        if beam is not None:
+            beam.pop()
         return current_bits[:-1] if current_bits else "", WordEvent(
             bits=current_bits,
             suggestions=[],
             complete_word=None,
+            decoded=decoder.word,
+            is_word=decoder.is_word,
         )
 
     return current_bits, WordEvent(
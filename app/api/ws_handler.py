@@ -1,18 +1,59 @@
 """WebSocket event router and handler."""
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from fastapi import WebSocket, WebSocketDisconnect
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 from app.models import BitEvent, StateBit
+from app.keyboard.adaptive import AdaptiveCodebook, Codebook, word_codebook
+from app.keyboard.beam import BeamDecoder
+from app.keyboard.decoder import HuffmanDecoder
 from app.keyboard.textual_toy import AutocorrectEngine
+from app.keyboard.utils import make_beam_decoder, make_decoder
+from app.keyboard.vector_engine import VectorAutocorrectEngine
 from app.api.bit import handle
+from app.config.settings import settings
 
 
 @dataclass
 class WebSocketHandler:
-    autocorrect = AutocorrectEngine()
+    autocorrect: Union[AutocorrectEngine, VectorAutocorrectEngine] = field(
+        default_factory=lambda: (
+            VectorAutocorrectEngine()
+            if settings.autocorrect_engine == "vector"
+            else AutocorrectEngine()
+        )
+    )
     current_bits = ""
     websocket: Optional[WebSocket] = None
+    decoder: HuffmanDecoder = field(default_factory=make_decoder)
+    beam: Optional[BeamDecoder] = field(
+        default_factory=lambda: (
+            make_beam_decoder(settings.beam_width, settings.bit_confidence)
+            if settings.beam_width
+            else None
+        )
+    )
+    adaptive: Optional[AdaptiveCodebook] = field(
+        default_factory=lambda: (
+            AdaptiveCodebook(settings.typing_history_path, settings.codebook_margin)
+            if settings.adaptive_codebook and settings.codebook == "char"
+            else None
+        )
+    )
+
+    def __post_init__(self):
+        self.codebook = self.adaptive.current if self.adaptive is not None else None
+        if settings.codebook == "word":
+            self.use_codebook(word_codebook())
+
+    def use_codebook(self, book: Codebook) -> None:
+        """Switch every per-session index to book. Only call between words."""
+        self.codebook = book
+        self.decoder = book.decoder()
+        self.autocorrect.use_codebook(book)
+        if self.beam is not None:
+            self.beam.trie = book.trie
+            self.beam.reset()
 
     async def handle_connection(self, websocket: WebSocket):
         """Handle incoming WebSocket connection and route events."""
@@ -46,7 +87,17 @@ class WebSocketHandler:
                 StateBit(bit_event.bit),
                 self.current_bits,
                 self.autocorrect,
+                self.decoder,
+                self.beam,
+                bit_event.likelihood,
             )
+
+            # Between words, adopt the user's latest codebook if it was rebuilt
+            if self.adaptive is not None and word_event.accepted:
+                self.adaptive.observe(word_event.accepted)
+                if self.adaptive.current is not self.codebook:
+                    self.use_codebook(self.adaptive.current)
+                    word_event.codes = self.codebook.codes
             return asdict(word_event)
 
         return None  # Unhandled event type
@@ -6,10 +6,19 @@ import time
 import pickle
 import numpy as np
 from pathlib import Path
-from app.services.bci import bci_session, process_board_data
+from app.services.acquisition import Acquisition
+from app.services.bci import (
+    BoardProfile,
+    GestureClassifier,
+    bci_session,
+    eeg_filter,
+    load_gesture_model,
+    process_board_data,
+)
+from app.services.calibration import collect
 from app.config.settings import settings
 from app.models import StateBit, BitEvent, GreekWaves
-from app.keyboard.constants import HUFFMAN
+from app.keyboard.constants import HUFFMAN, HUFFMAN_CODEC
 from dataclasses import asdict
 from tqdm import tqdm
 from typing import List, Tuple
@@ -28,9 +37,8 @@ def generate_mock_events(
         List of BitEvents corresponding to the Huffman encoding of the word
     """
     # Convert word to bit sequence using Huffman encoding
-    bit_sequence = []
-    for char in word.lower():
-        bit_sequence.extend([int(b) for b in HUFFMAN[char]])
+    (code,) = HUFFMAN_CODEC.encode_bits([word.lower()])
+    bit_sequence = [int(b) for b in code]
 
     print(f"Requested seq: {bit_sequence}")
 
@@ -118,27 +126,22 @@ def test_mock_events():
 # test_mock_events()
 
 
-def loop_forever_bci(fetch_data, baseline, ws, delay):
-    """Run BCI processing loop with configurable data source."""
-    i = 0
+def loop_forever_bci(
+    acquisition: Acquisition, classifier: GestureClassifier, ws, window: int, hop: int
+):
+    """Classify windows of window samples every hop samples as they arrive."""
     pbar = tqdm(unit=" bits")
-    last_check = time.time()
-    last_bit = StateBit.NOTHING
-
-    while True:
-        if time.time() - last_check < delay:
-            continue
 
-        event_data = process_board_data(fetch_data(i), baseline, last_bit)
-        last_bit = event_data.bit
-        if event_data.bit != StateBit.NOTHING:
+    classifier.set_baseline(acquisition.next_window(window, window))
+    while (data := acquisition.next_window(window, hop)) is not None:
+        bit = classifier.update(data, acquisition.cursor)
+        if bit != StateBit.NOTHING:
+            event_data = process_board_data(data, bit, classifier)
             ws.send(json.dumps({"event": "bit", "data": asdict(event_data)}))
             pbar.update(1)
             pbar.set_postfix(bit=event_data.bit.value)
         else:
             pbar.set_postfix(bit="-1")
-        i += 1
-        last_check = time.time()
 
 
 try:
@@ -148,12 +151,9 @@ try:
         mock_events = generate_mock_events()
         i = 0
         pbar = tqdm(unit=" bits")
-        last_check = time.time()
 
         while True:
-            if time.time() - last_check < 0.1:  # Fixed 0.1s delay for simulation
-                continue
-
+            time.sleep(0.1)  # Fixed 0.1s delay for simulation
             event = mock_events[i % len(mock_events)]
             if event.bit != StateBit.NOTHING:
                 ws.send(json.dumps({"event": "bit", "data": asdict(event)}))
@@ -162,16 +162,37 @@ try:
             else:
                 pbar.set_postfix(bit="-1")
             i += 1
-            last_check = time.time()
     else:
-        with bci_session() as board:
-            baseline_data = board.get_board_data()
-            loop_forever_bci(
-                fetch_data=lambda _: board.get_board_data(),
-                baseline=baseline_data,
-                ws=ws,
-                delay=1,
+        profile = BoardProfile.load()
+        window = profile.samples(settings.window_seconds)
+        with bci_session() as board, Acquisition(
+            board,
+            n_channels=profile.n_rows,
+            capacity=profile.samples(settings.buffer_seconds),
+            transform=eeg_filter(profile),
+        ) as acquisition:
+            classifier = GestureClassifier(
+                profile,
+                window,
+                hold=settings.debounce_hops,
+                refractory=profile.samples(settings.refractory_seconds),
+                model=(
+                    None if settings.mode == "collect" else load_gesture_model(profile)
+                ),
             )
+            hop = profile.samples(settings.hop_seconds)
+            if settings.mode == "collect":
+                collect(
+                    acquisition,
+                    classifier,
+                    window,
+                    hop,
+                    settings.calibration_path,
+                    seconds=settings.calibration_seconds,
+                    rounds=settings.calibration_rounds,
+                )
+            else:
+                loop_forever_bci(acquisition, classifier, ws=ws, window=window, hop=hop)
 finally:
     ws.abort()
     pass
@@ -1,4 +1,4 @@
-from typing import Literal
+from typing import List, Literal, Tuple
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from brainflow.board_shim import BoardIds
 from pathlib import Path
@@ -31,12 +31,59 @@ class Settings(BaseSettings):
     TTS_MODEL_ID: str = "eleven_multilingual_v2"
 
     # App settings
-    mode: Literal["inference", "collect", "simulate"] = "collect"
+    # "collect" records calibration windows for app.services.calibration
+    mode: Literal["inference", "collect", "simulate"] = "inference"
+    # Suggestion engine: Levenshtein (AutocorrectEngine) or aligned mismatch
+    # distance (VectorAutocorrectEngine), both scored over all words with numpy.
+    # Only Levenshtein recovers from a dropped or doubled bit mid-word
+    autocorrect_engine: Literal["stream", "vector"] = "stream"
+    # Soft-bit beam search over BitEvent likelihoods, 0 to disable. Wider beams
+    # cost more CPU per bit but recover more misread bits
+    beam_width: int = 0
+    bit_confidence: float = 0.9  # P(bit is right) for bits without a likelihood
+    # Code chars only, or also the commonest words (huffman_words.json)
+    codebook: Literal["char", "word"] = "char"
+    # Rebuild the Huffman code from the user's typing once it saves codebook_margin
+    # bits per char, keeping their char counts in typing_history_path. Char only.
+    # One user: every session reads and overwrites the same history file
+    adaptive_codebook: bool = False
+    codebook_margin: float = 0.05
+    typing_history_path: Path = PROJECT_DIR / "keyboard" / "typing_history.json"
 
     # https://brainflow.readthedocs.io/en/stable/UserAPI.html#python-api-reference
     # arrays in mV. DC offset 22.5mV. sample rate 125Hz
     board_id: int = BoardIds.CYTON_DAISY_BOARD.value
     serial_port: str = "/dev/cu.usbserial-DP05IK99"
+    # Gesture signals, as indices into the board's EEG and accelerometer channels
+    left_clench_channel: int = 1
+    right_clench_channel: int = 9
+    nod_accel_axis: int = 2
+    shake_accel_axis: int = 0
+    # Gestures are classified over window_seconds of samples every hop_seconds,
+    # read from a ring buffer holding the last buffer_seconds. One counts once
+    # seen for debounce_hops hops in a row, refractory_seconds after the last
+    window_seconds: float = 0.25
+    hop_seconds: float = 0.05
+    buffer_seconds: float = 10.0
+    debounce_hops: int = 2
+    refractory_seconds: float = 0.3
+    # Causal filters applied to EEG rows as samples arrive, [] to disable notches.
+    # Off until the clench thresholds below are retuned on filtered data
+    filter_eeg: bool = False
+    bandpass_hz: Tuple[float, float] = (3.0, 45.0)
+    notch_hz: List[float] = [50.0, 60.0]
+    # Then Savitzky-Golay smoothing over savgol_window samples, 0 to disable
+    savgol_window: int = 0
+    savgol_order: int = 3
+    # Welch segment length for the GreekWaves band powers
+    band_power_seconds: float = 2.0
+
+    # Gesture model fitted by app.services.calibration, used instead of the
+    # thresholds below once it exists
+    calibration_path: Path = PROJECT_DIR / "services" / "calibration.npz"
+    gesture_model_path: Path = PROJECT_DIR / "services" / "gesture_model.npz"
+    calibration_seconds: float = 4.0  # Per gesture prompt
+    calibration_rounds: int = 3
 
     # Calibration thresholds
     # For Joe Li over-ear BCI, 12am
@@ -0,0 +1,164 @@
+"""Per-user Huffman codebook, rebuilt from what the user actually types.
+
+The static codebook comes from LETTER_FREQUENCIES. AdaptiveCodebook counts the
+chars of every accepted word on top of those frequencies and, when a code built
+from the counts would save at least ``margin`` bits per char, builds it together
+with every index derived from it in a worker thread. The finished Codebook is
+published with a single reference assignment, and sessions pick it up between
+words, so no word is ever decoded with a mix of two codes.
+"""
+
+import json
+from collections import Counter
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+import numpy as np
+
+from app.keyboard.artifact import pack_codes
+from app.keyboard.constants import (
+    FREQ_CODE_BLOCKS,
+    FREQ_CODE_LENGTHS,
+    FREQ_WORDS,
+    HUFFMAN,
+    HUFFMAN_TRIE,
+    WORD_HUFFMAN,
+    WORDS,
+)
+from app.keyboard.decoder import HuffmanDecoder, HuffmanTrie
+from app.keyboard.huffman import (
+    K,
+    LETTER_FREQUENCIES,
+    average_code_length,
+    build_huffman_tree,
+    tree_codes,
+)
+from app.keyboard.vector_engine import LevenshteinScorer, freq_scorer
+
+
+@dataclass(frozen=True)
+class Codebook:
+    """A Huffman code and everything derived from it, swapped as one unit."""
+
+    codes: Dict[str, str]
+    trie: HuffmanTrie
+    freq_blocks: np.ndarray  # FREQ_WORDS codes, see pack_codes
+    freq_lengths: np.ndarray
+    scorer: LevenshteinScorer
+
+    @classmethod
+    def build(cls, codes: Dict[str, str]) -> "Codebook":
+        blocks, lengths = pack_codes(FREQ_WORDS, codes)
+        return cls(
+            codes,
+            HuffmanTrie(codes),
+            blocks,
+            lengths,
+            LevenshteinScorer(blocks, lengths),
+        )
+
+    def decoder(self) -> HuffmanDecoder:
+        return HuffmanDecoder(self.trie, WORDS)
+
+
+# Rebuilds for every session, one at a time, so none leaves a thread behind
+_REBUILDS = ThreadPoolExecutor(max_workers=1, thread_name_prefix="codebook")
+
+
+@lru_cache(maxsize=None)
+def word_codebook() -> Codebook:
+    """Codebook of huffman_words.json, shared by every session using it."""
+    assert (
+        WORD_HUFFMAN is not None
+    ), "Build it with: python -m app.keyboard.huffman --words"
+    return Codebook.build(WORD_HUFFMAN)
+
+
+def expected_length(codes: Mapping[str, str], counts: Mapping[str, float]) -> float:
+    """Mean code length in bits per char typed with the given char counts."""
+    total = sum(counts.values())
+    return sum(len(codes[c]) * n for c, n in counts.items()) / total
+
+
+class AdaptiveCodebook:
+    """Tracks a user's char counts and rebuilds their codebook when it pays off.
+
+    The counts start as LETTER_FREQUENCIES scaled to ``prior_chars`` chars, so a
+    few words cannot reshuffle the code, and are saved to ``history_path`` to
+    carry over between sessions. There is one history file and sessions do not
+    merge their counts, so only one user is supported: concurrent sessions each
+    overwrite it with their own counts. Candidate codes are checked every
+    ``check_every`` accepted words by their code lengths alone, which is cheap; the
+    tree is only built once a rebuild is due.
+    """
+
+    def __init__(
+        self,
+        history_path: Optional[Path] = None,
+        margin: float = 0.05,
+        check_every: int = 20,
+        prior_chars: float = 2000,
+    ):
+        self.history_path = history_path
+        self.margin = margin
+        self.check_every = check_every
+        self.current = Codebook(
+            HUFFMAN,
+            HUFFMAN_TRIE,
+            FREQ_CODE_BLOCKS,
+            FREQ_CODE_LENGTHS,
+            freq_scorer(),
+        )
+
+        scale = prior_chars / sum(LETTER_FREQUENCIES.values())
+        self._prior = {c: f * scale for c, f in LETTER_FREQUENCIES.items()}
+        self.typed: Counter = Counter()
+        if history_path is not None and history_path.exists():
+            with history_path.open() as f:
+                self.typed.update(json.load(f))
+
+        self._words = 0
+        self._pending: Optional[Future] = None
+        self.check()  # A returning user gets their code straight away
+
+    def counts(self) -> Dict[str, float]:
+        return {c: f + self.typed[c] for c, f in self._prior.items()}
+
+    def observe(self, word: str) -> None:
+        """Count an accepted word's chars, checking for a better code now and then."""
+        self.typed.update(c for c in word if c in self._prior)
+        self._words += 1
+        if self._words % self.check_every == 0:
+            self.save()
+            self.check()
+
+    def check(self) -> bool:
+        """Start building a better code in the background, if there is one."""
+        if self._pending is not None and not self._pending.done():
+            return False
+        counts = self.counts()
+        saving = expected_length(self.current.codes, counts) - average_code_length(
+            counts, K
+        )
+        if saving < self.margin:
+            return False
+        self._pending = _REBUILDS.submit(self._publish, counts)
+        return True
+
+    def _publish(self, counts: Dict[str, float]) -> None:
+        root, _ = build_huffman_tree(counts, top_k=K)
+        codes = tree_codes(root)
+        self.current = Codebook.build(codes)  # One assignment, so swaps are atomic
+
+    def wait(self) -> None:
+        """Block until a pending rebuild has been published."""
+        if self._pending is not None:
+            self._pending.result()
+
+    def save(self) -> None:
+        if self.history_path is not None:
+            with self.history_path.open("w") as f:
+                json.dump(self.typed, f)
@@ -0,0 +1,156 @@
+"""Precompiled keyboard data, memory-mapped at startup.
+
+Bundles the Huffman codebook, the Huffman-encoded frequency list and the packed
+dictionary index into one file so constants.py skips parsing the text sources.
+The file records the SHA-256 of the huffman.json, english.txt and freq.txt it was
+built from and is ignored once any of them changes. Rebuild with:
+
+    python -m app.keyboard.artifact
+
+Layout: MAGIC, little-endian uint32 header length, JSON header, then the raw
+sections, each 8-byte aligned. The header maps section names to
+(offset from data start, byte length, dtype).
+"""
+
+import hashlib
+import json
+import mmap
+import struct
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.keyboard.codec import HuffmanCodec
+from app.keyboard.decoder import HuffmanTrie
+from app.keyboard.dictionary import DictionaryIndex
+
+MAGIC = b"HKB1"
+root = Path(__file__).parent
+ARTIFACT_PATH = root / "keyboard.bin"
+
+
+@dataclass
+class KeyboardArtifact:
+    codes: Dict[str, str]
+    words: DictionaryIndex
+    freq_words: List[str]
+    freq_blocks: np.ndarray  # (len(freq_words), blocks) uint64, see pack_codes
+    freq_lengths: np.ndarray  # Code length in bits per freq word
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def source_digests(
+    huffman_path: Path, words_path: Path, freq_path: Path
+) -> Dict[str, str]:
+    """SHA-256 of each text source, as recorded in the artifact header."""
+    return {
+        "huffman": file_digest(huffman_path),
+        "words": file_digest(words_path),
+        "freq": file_digest(freq_path),
+    }
+
+
+def pack_codes(
+    words: Sequence[str], codes: Dict[str, str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Huffman-encode words into packed blocks and code lengths.
+
+    Bit i of word w's code is bit i % 64 of blocks[w, i // 64], matching the
+    layout of BinaryEditDistanceStream. Word codebooks spell each word with its
+    cheapest symbols, see HuffmanTrie.segment.
+    """
+    return HuffmanCodec(HuffmanTrie(codes)).encode(words)
+
+
+def build_artifact(
+    huffman_path: Path = root / "huffman.json",
+    words_path: Path = root / "english.txt",
+    freq_path: Path = root / "freq.txt",
+    out_path: Path = ARTIFACT_PATH,
+) -> None:
+    with huffman_path.open() as f:
+        codes = json.load(f)["codes"]
+    with freq_path.open() as f:
+        freq_words = f.read().splitlines()
+    words = DictionaryIndex.from_file(words_path)
+    freq_blocks, freq_lengths = pack_codes(freq_words, codes)
+
+    sections = {
+        "words_blob": (bytes(words.blob), "u1"),
+        "words_offsets": (np.asarray(words.offsets, dtype=np.uint32), "u4"),
+        "freq_words": ("".join(w + "\n" for w in freq_words).encode(), "u1"),
+        "freq_lengths": (freq_lengths, "u4"),
+        "freq_blocks": (freq_blocks, "u8"),
+    }
+    layout = {}
+    payload = bytearray()
+    for name, (data, dtype) in sections.items():
+        raw = data if isinstance(data, bytes) else data.tobytes()
+        layout[name] = [len(payload), len(raw), dtype]
+        payload += raw
+        payload += b"\0" * (-len(payload) % 8)
+
+    header = json.dumps(
+        {
+            "sha256": source_digests(huffman_path, words_path, freq_path),
+            "codes": codes,
+            "freq_blocks_per_word": freq_blocks.shape[1],
+            "sections": layout,
+        }
+    ).encode()
+    header += b" " * (-(len(MAGIC) + 4 + len(header)) % 8)  # Align data start
+
+    with out_path.open("wb") as f:
+        f.write(MAGIC + struct.pack("<I", len(header)) + header + payload)
+    print(f"Wrote {out_path} ({out_path.stat().st_size:,} bytes)")
+
+
+def load_artifact(
+    path: Path = ARTIFACT_PATH,
+    huffman_path: Path = root / "huffman.json",
+    words_path: Path = root / "english.txt",
+    freq_path: Path = root / "freq.txt",
+) -> Optional[KeyboardArtifact]:
+    """Map a compiled artifact, or None if missing or built from other sources."""
+    if not path.exists():
+        return None
+
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if mm[: len(MAGIC)] != MAGIC:
+        return None
+    (header_len,) = struct.unpack_from("<I", mm, len(MAGIC))
+    data_start = len(MAGIC) + 4 + header_len
+    header = json.loads(mm[len(MAGIC) + 4 : data_start])
+    if header.get("sha256") != source_digests(huffman_path, words_path, freq_path):
+        print(f"{path.name} is stale, rebuild with: python -m app.keyboard.artifact")
+        return None
+
+    def section(name: str) -> np.ndarray:
+        offset, nbytes, dtype = header["sections"][name]
+        return np.frombuffer(
+            mm,
+            dtype=np.dtype(dtype),
+            count=nbytes // np.dtype(dtype).itemsize,
+            offset=data_start + offset,
+        )
+
+    return KeyboardArtifact(
+        codes=header["codes"],
+        words=DictionaryIndex(
+            memoryview(section("words_blob")),
+            memoryview(section("words_offsets")),
+        ),
+        freq_words=section("freq_words").tobytes().decode().splitlines(),
+        freq_blocks=section("freq_blocks").reshape(-1, header["freq_blocks_per_word"]),
+        freq_lengths=section("freq_lengths"),
+    )
+
+
+if __name__ == "__main__":
+    build_artifact()
@@ -0,0 +1,102 @@
+import heapq
+import math
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+from app.keyboard.decoder import HuffmanTrie
+from app.keyboard.dictionary import DictionaryIndex, Node
+
+# (log-likelihood, decoded chars, trie node of the pending bits, dictionary prefix)
+Hypothesis = Tuple[float, str, int, Node]
+
+_EPS = 1e-6  # Keeps a certain-looking bit from ruling out its alternative
+
+
+class BeamDecoder:
+    """Most likely dictionary words for a sequence of uncertain bits.
+
+    Each bit arrives with the classifier's P(bit is 1). Every hypothesis is
+    extended by both bits and scored by summed log-likelihood; those whose chars
+    start no dictionary word are dropped and only the best ``width`` survive, so
+    width trades CPU for accuracy. Complete words rank by likelihood plus
+    ``prior_weight`` times their freq.txt log-prior.
+
+    Huffman codes are prefix-free, so each bit sequence is one hypothesis and no
+    merging is needed. Like HuffmanDecoder, every push saves the previous beam so
+    pop() undoes a bit in O(1).
+    """
+
+    def __init__(
+        self,
+        trie: HuffmanTrie,
+        words: DictionaryIndex,
+        log_prior: Dict[str, float],
+        width: int = 16,
+        confidence: float = 0.9,
+        prior_weight: float = 1.0,
+    ):
+        self.trie = trie
+        self.words = words
+        self.log_prior = log_prior
+        self.width = width
+        self.confidence = confidence  # P(bit is right) for bits without likelihood
+        self.prior_weight = prior_weight
+        # Dictionary words outside freq.txt rank as the rarest listed word
+        self._unlisted_prior = min(log_prior.values(), default=0.0)
+        self.reset()
+
+    def reset(self) -> None:
+        self.beam: List[Hypothesis] = [(0.0, "", 0, self.words.root)]
+        self._history: List[List[Hypothesis]] = []
+
+    def __len__(self) -> int:
+        return len(self._history)
+
+    def push(self, c: str, likelihood: Optional[float] = None) -> None:
+        """Consume one bit: its hard value and, if known, P(bit is 1)."""
+        assert c in "01"
+        if likelihood is None:
+            likelihood = self.confidence if c == "1" else 1 - self.confidence
+        p = min(max(likelihood, _EPS), 1 - _EPS)
+        bit_scores = (math.log1p(-p), math.log(p))
+
+        transitions, symbols = self.trie.transitions, self.trie.symbols
+        extended: List[Hypothesis] = []
+        for score, word, node, prefix in self.beam:
+            for bit in (0, 1):
+                child = transitions[2 * node + bit]
+                if child < 0:
+                    continue
+                symbol = symbols[child]
+                if symbol is None:
+                    extended.append((score + bit_scores[bit], word, child, prefix))
+                    continue
+                stepped = self.words.step(prefix, symbol)
+                if stepped is not None:  # Some word still starts this way
+                    extended.append(
+                        (score + bit_scores[bit], word + symbol, 0, stepped)
+                    )
+
+        self._history.append(self.beam)
+        self.beam = heapq.nlargest(self.width, extended, key=itemgetter(0))
+
+    def pop(self) -> None:
+        """Undo the last pushed bit (backspace)."""
+        if self._history:
+            self.beam = self._history.pop()
+
+    def candidates(self, k: int) -> List[Tuple[str, float]]:
+        """Up to k complete words in the beam with their scores, best first."""
+        scored = (
+            (
+                word,
+                score
+                + self.prior_weight * self.log_prior.get(word, self._unlisted_prior),
+            )
+            for score, word, node, prefix in self.beam
+            if node == 0 and word and self.words.is_word(prefix)
+        )
+        return heapq.nlargest(k, scored, key=itemgetter(1))
+
+    def suggestions(self, k: int) -> List[str]:
+        return [word for word, _ in self.candidates(k)]
@@ -0,0 +1,117 @@
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.keyboard.decoder import HuffmanTrie
+
+
+class HuffmanCodec:
+    """Batch Huffman encoding and decoding over packed bit arrays.
+
+    Compiles a HuffmanTrie into numpy tables once, so whole word lists or
+    recordings are coded with a few array passes rather than string
+    concatenation per word. Batches are (blocks, lengths): bit i of row r is bit
+    i % 64 of blocks[r, i // 64], the layout of pack_codes and FREQ_CODE_BLOCKS.
+    """
+
+    def __init__(self, trie: HuffmanTrie):
+        self.trie = trie
+        self.symbols = list(trie.codes)
+        self._ids = {s: i for i, s in enumerate(self.symbols)}
+        self._lengths = np.array([len(trie.codes[s]) for s in self.symbols])
+        self._bits = np.zeros((len(self.symbols), trie.max_code_len), dtype=np.uint8)
+        for i, s in enumerate(self.symbols):
+            self._bits[i, : self._lengths[i]] = [c == "1" for c in trie.codes[s]]
+
+        self._transitions = np.array(trie.transitions, dtype=np.int64)
+        self._leaf_ids = np.array(
+            [-1 if s is None else self._ids[s] for s in trie.symbols], dtype=np.int64
+        )
+
+    def encode(self, words: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Huffman-encode words into packed blocks and code lengths in bits."""
+        segments = [self.trie.segment(w) for w in words]
+        ids = np.array([self._ids[s] for seg in segments for s in seg], dtype=np.int64)
+        rows = np.repeat(np.arange(len(words)), [len(seg) for seg in segments])
+        return self._scatter(rows, self._lengths[ids], self._bits[ids], len(words))
+
+    def encode_bits(self, words: Sequence[str]) -> List[str]:
+        """Codes of words as strings of "0"/"1"."""
+        return self.unpack(*self.encode(words))
+
+    @staticmethod
+    def pack(bitstrings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack strings of "0"/"1" like encode's output, e.g. recorded bits."""
+        lengths = np.array([len(b) for b in bitstrings], dtype=np.int64)
+        n_blocks = max(1, (int(lengths.max(initial=0)) + 63) // 64)
+        bits = np.zeros((len(bitstrings), 64 * n_blocks), dtype=np.uint8)
+        flat = np.frombuffer("".join(bitstrings).encode(), dtype=np.uint8) - ord("0")
+        rows = np.repeat(np.arange(len(bitstrings)), lengths)
+        cols = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        bits[rows, cols] = flat
+        return _pack_rows(bits), lengths.astype(np.uint32)
+
+    @staticmethod
+    def unpack(blocks: np.ndarray, lengths: np.ndarray) -> List[str]:
+        """Inverse of pack."""
+        bits = _unpack_rows(blocks) + ord("0")
+        return [row[:n].tobytes().decode() for row, n in zip(bits, lengths.tolist())]
+
+    def decode(self, blocks: np.ndarray, lengths: np.ndarray) -> List[Optional[str]]:
+        """Decoded symbols of each row, ignoring an unfinished code at the end.
+
+        Walks the trie for every row at once, one bit position per step. Rows
+        leaving the trie (only possible with an incomplete code) decode to None.
+        """
+        bits = _unpack_rows(blocks).astype(np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        node = np.zeros(len(bits), dtype=np.int64)
+        failed = np.zeros(len(bits), dtype=bool)
+        emitted = []  # (rows, symbol ids) per step, in bit order
+        for j in range(int(lengths.max(initial=0))):
+            live = np.flatnonzero((lengths > j) & ~failed)
+            step = self._transitions[2 * node[live] + bits[live, j]]
+            failed[live[step < 0]] = True
+            step = np.maximum(step, 0)
+            leaf = self._leaf_ids[step]
+            done = leaf >= 0
+            emitted.append((live[done], leaf[done]))
+            node[live] = np.where(done, 0, step)
+
+        words = [[] for _ in range(len(bits))]
+        for rows, ids in emitted:
+            for r, i in zip(rows.tolist(), ids.tolist()):
+                words[r].append(self.symbols[i])
+        return [None if f else "".join(w) for w, f in zip(words, failed.tolist())]
+
+    def _scatter(
+        self,
+        rows: np.ndarray,
+        lengths: np.ndarray,
+        codes: np.ndarray,
+        n_rows: int,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Pack symbol codes into rows, in order within each row."""
+        totals = np.bincount(rows, weights=lengths, minlength=n_rows).astype(np.int64)
+        n_blocks = max(1, (int(totals.max(initial=0)) + 63) // 64)
+
+        # Offset of each symbol within its row: running total minus row start
+        ends = np.cumsum(lengths)
+        starts = ends - lengths - (np.cumsum(totals) - totals)[rows]
+
+        bits = np.zeros((n_rows, 64 * n_blocks), dtype=np.uint8)
+        used = np.arange(codes.shape[1]) < lengths[:, None]
+        sym, pos = np.nonzero(used)
+        bits[rows[sym], starts[sym] + pos] = codes[sym, pos]
+        return _pack_rows(bits), totals.astype(np.uint32)
+
+
+def _pack_rows(bits: np.ndarray) -> np.ndarray:
+    """(rows, 64 * blocks) 0/1 array into (rows, blocks) uint64, first bit lowest."""
+    packed = np.packbits(bits, axis=1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8").astype(np.uint64)
+
+
+def _unpack_rows(blocks: np.ndarray) -> np.ndarray:
+    as_bytes = np.ascontiguousarray(blocks, dtype="<u8").view(np.uint8)
+    return np.unpackbits(as_bytes, axis=1, bitorder="little")
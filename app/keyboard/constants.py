@@ -1,18 +1,42 @@
 from pathlib import Path
 import json
+from app.keyboard.artifact import load_artifact, pack_codes
+from app.keyboard.codec import HuffmanCodec
+from app.keyboard.decoder import HuffmanTrie
+from app.keyboard.dictionary import DictionaryIndex
+from app.keyboard.priors import zipf_log_prior
 
 root = Path(__file__).parent
 
-with (root / "english.txt").open() as f:
-    WORDS = set(f.read().splitlines())
-with (root / "huffman.json").open() as f:
-    HUFFMAN = json.load(f)["codes"]
-    for k, v in HUFFMAN.items():
-        assert len(k) == 1  # Single char
-        assert all(c in "01" for c in v)  # has binary code
-    HUFFMAN_INV = {char: code for code, char in HUFFMAN.items()}  # Inverse map
-# implicit assert every char in WORDS has HUFFMAN key
+# Prefer the compiled keyboard.bin (see artifact.py), else parse the text sources
+_artifact = load_artifact(root / "keyboard.bin", root / "huffman.json")
+if _artifact is not None:
+    WORDS = _artifact.words
+    HUFFMAN = _artifact.codes
+    FREQ_WORDS = _artifact.freq_words
+    FREQ_CODE_BLOCKS, FREQ_CODE_LENGTHS = _artifact.freq_blocks, _artifact.freq_lengths
+else:
+    WORDS = DictionaryIndex.from_file(root / "english.txt")  # Packed prefix index
+    with (root / "huffman.json").open() as f:
+        HUFFMAN = json.load(f)["codes"]
+    # Load frequency table
+    with (root / "freq.txt").open() as f:
+        FREQ_WORDS = f.read().splitlines()  # f ranked by line number.
+    FREQ_CODE_BLOCKS, FREQ_CODE_LENGTHS = pack_codes(FREQ_WORDS, HUFFMAN)
+# FREQ_WORDS codes: FREQ_CODE_BLOCKS[i] holds code i packed 64 bits per uint64
+FREQ_LOG_PRIOR = zipf_log_prior(len(FREQ_WORDS))  # log P(word), aligned with rows
+
+for k, v in HUFFMAN.items():
+    assert len(k) == 1  # Single char
+    assert all(c in "01" for c in v)  # has binary code
+HUFFMAN_INV = {char: code for code, char in HUFFMAN.items()}  # Inverse map
+HUFFMAN_TRIE = HuffmanTrie(HUFFMAN)  # Bitwise decoding table
+HUFFMAN_CODEC = HuffmanCodec(HUFFMAN_TRIE)  # Batch encode/decode, see codec.py
 
-# Load frequency table
-with (root / "freq.txt").open() as f:
-    FREQ_WORDS = f.read().splitlines()  # f ranked by line number.
+# Optional codebook of frequent words plus chars, see huffman.py --words
+WORD_HUFFMAN = None
+if (root / "huffman_words.json").exists():
+    with (root / "huffman_words.json").open() as f:
+        WORD_HUFFMAN = json.load(f)["codes"]
+    assert all(c in "01" for v in WORD_HUFFMAN.values() for c in v)
+# implicit assert every char in WORDS has HUFFMAN key
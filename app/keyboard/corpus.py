@@ -0,0 +1,77 @@
+"""Chunked, parallel passes over word lists too large to load at once.
+
+The corpus is read in blocks of whole lines and each block is handed to a worker
+process, with a bounded number in flight so memory stays flat whatever the file
+size. Results come back in file order.
+"""
+
+import os
+from collections import Counter, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+
+CHUNK_BYTES = 1 << 24
+
+
+def read_chunks(path: Path, chunk_bytes: int = CHUNK_BYTES) -> Iterator[str]:
+    """Blocks of about chunk_bytes, each ending on a line boundary."""
+    with path.open(encoding="utf-8", newline="") as f:
+        rest = ""
+        while block := f.read(chunk_bytes):
+            block = rest + block
+            end = block.rfind("\n") + 1
+            if end:
+                rest = block[end:]
+                yield block[:end]
+            else:
+                rest = block  # A line longer than a block
+        if rest:
+            yield rest
+
+
+def imap_ordered(
+    executor: Executor, fn: Callable, items: Iterable, window: int
+) -> Iterator:
+    """executor.map that only keeps window items in flight."""
+    pending: Deque[Future] = deque()
+    for item in items:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(fn, item))
+    while pending:
+        yield pending.popleft().result()
+
+
+def map_chunks(
+    fn: Callable[[str], object],
+    path: Path,
+    processes: Optional[int] = None,
+    chunk_bytes: int = CHUNK_BYTES,
+) -> Iterator:
+    """fn over the chunks of path in a process pool, results in file order."""
+    processes = processes or os.cpu_count() or 1
+    with ProcessPoolExecutor(processes) as executor:
+        yield from imap_ordered(
+            executor, fn, read_chunks(path, chunk_bytes), 2 * processes
+        )
+
+
+def allowed_table(charset: Iterable[str]) -> Dict[int, None]:
+    """str.translate table deleting charset, so allowed words translate to ""."""
+    return dict.fromkeys(map(ord, charset))
+
+
+def count_alpha(chunk: str) -> Counter:
+    """Letter counts of a chunk, counted in C rather than char by char."""
+    return Counter({c: n for c, n in Counter(chunk).items() if c.isalpha()})
+
+
+def filter_words(chunk: str, table: Dict[int, None]) -> Tuple[str, int, int]:
+    """Lines of a chunk's words spelled only with allowed chars, kept and total.
+
+    Returned as one string, which is far cheaper to send back than a list.
+    """
+    words = [w for w in map(str.strip, chunk.splitlines()) if w]
+    kept = [w + "\n" for w in words if not w.translate(table)]
+    return "".join(kept), len(kept), len(words)
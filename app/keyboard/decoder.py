@@ -0,0 +1,193 @@
+from typing import Dict, List, Optional
+from app.keyboard.dictionary import DictionaryIndex
+
+
+class HuffmanTrie:
+    """Huffman decoding trie flattened into a transition table.
+
+    Node 0 is the root. ``transitions[2 * node + bit]`` is the child reached by
+    ``bit``, or -1 if no code continues that way. ``symbols[node]`` is the decoded
+    symbol at leaves and None at internal nodes: a char, or in a word codebook
+    also a whole word.
+
+    Built once per codebook, so decoding walks bits without slicing substrings.
+    """
+
+    def __init__(self, codes: Dict[str, str]):
+        self.codes = codes
+        self.transitions: List[int] = [-1, -1]
+        self.symbols: List[Optional[str]] = [None]
+        self.max_code_len = max(len(code) for code in codes.values())
+        self.max_symbol_len = max(len(symbol) for symbol in codes)
+
+        for char, code in codes.items():
+            node = 0
+            for c in code:
+                idx = 2 * node + (c == "1")
+                if self.transitions[idx] < 0:
+                    self.transitions[idx] = len(self.symbols)
+                    self.transitions.extend((-1, -1))
+                    self.symbols.append(None)
+                node = self.transitions[idx]
+            assert self.symbols[node] is None, f"Duplicate code {code!r}"
+            self.symbols[node] = char
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def segment(self, word: str) -> List[str]:
+        """Split word into the symbols with the shortest total code.
+
+        Just the chars for a char codebook. With word symbols, e.g. "they" may be
+        cheapest as "the" + "y". Raises KeyError if word cannot be spelled.
+        """
+        if self.max_symbol_len == 1:
+            return list(word)
+
+        # cost[i]: fewest bits for word[:i], reached from start[i]
+        cost = [0] + [None] * len(word)
+        start = [0] * (len(word) + 1)
+        for i in range(1, len(word) + 1):
+            for j in range(max(0, i - self.max_symbol_len), i):
+                code = self.codes.get(word[j:i])
+                if code is None or cost[j] is None:
+                    continue
+                if cost[i] is None or cost[j] + len(code) < cost[i]:
+                    cost[i] = cost[j] + len(code)
+                    start[i] = j
+        if cost[-1] is None:
+            raise KeyError(word)
+
+        symbols = []
+        i = len(word)
+        while i:
+            symbols.append(word[start[i] : i])
+            i = start[i]
+        return symbols[::-1]
+
+    def encode(self, word: str) -> str:
+        return "".join(self.codes[s] for s in self.segment(word))
+
+
+class HuffmanDecoder:
+    """Resumable decoder with the same results as a full ``binary_to_word`` pass.
+
+    Bits are consumed one at a time, so re-decoding a buffer that only grew costs
+    O(new bits), and each push records the previous state so pop() undoes a bit in
+    O(1). Result is None once either:
+    - a pending (undecoded) sequence reaches the longest code length
+    - more than the longest code length has arrived after the first decoded char
+    and otherwise the last decoded prefix that is a word.
+    """
+
+    def __init__(self, trie: HuffmanTrie, words: DictionaryIndex):
+        self.trie = trie
+        self.words = words
+        self.reset()
+
+    def reset(self) -> None:
+        self.word = ""  # Decoded chars so far
+        self.last_valid_word = ""
+        self.failed = False
+        self._is_word = False
+        self._prefix = self.words.root  # None once no word starts with word
+        self._node = 0  # -1 once the pending sequence matches no code
+        self._pending = 0  # Bits since the last decoded char
+        self._first_end: Optional[int] = None
+        self._bits: List[str] = []
+        self._history: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    @property
+    def bits(self) -> str:
+        return "".join(self._bits)
+
+    @property
+    def result(self) -> Optional[str]:
+        return None if self.failed else self.last_valid_word
+
+    @property
+    def is_word(self) -> bool:
+        """Whether the bits decode exactly to a dictionary word, with none pending."""
+        return self._pending == 0 and self._is_word
+
+    def push(self, c: str) -> Optional[str]:
+        """Consume one appended bit and return the updated result."""
+        assert c in "01"
+        self._history.append(
+            (
+                self.word,
+                self.last_valid_word,
+                self.failed,
+                self._is_word,
+                self._prefix,
+                self._node,
+                self._pending,
+                self._first_end,
+            )
+        )
+        self._bits.append(c)
+
+        # Keep decoding after failure so word and is_word stay meaningful
+        n = len(self._bits)
+        max_code_len = self.trie.max_code_len
+        if self._node >= 0:
+            self._node = self.trie.transitions[2 * self._node + (c == "1")]
+        self._pending += 1
+
+        symbol = self.trie.symbols[self._node] if self._node >= 0 else None
+        if symbol is not None:
+            self.word += symbol
+            self._node = 0
+            self._pending = 0
+            if self._first_end is None:
+                self._first_end = n
+            if self._prefix is not None:  # Prune once no word can match
+                self._prefix = self.words.step(self._prefix, symbol)
+            self._is_word = self._prefix is not None and self.words.is_word(
+                self._prefix
+            )
+            if self._is_word:
+                self.last_valid_word = self.word
+
+        if self._pending >= max_code_len or (
+            self._first_end is not None and n - self._first_end > max_code_len
+        ):
+            self.failed = True
+        return self.result
+
+    def pop(self) -> Optional[str]:
+        """Undo the last pushed bit (backspace) and return the restored result."""
+        if self._bits:
+            self._bits.pop()
+            (
+                self.word,
+                self.last_valid_word,
+                self.failed,
+                self._is_word,
+                self._prefix,
+                self._node,
+                self._pending,
+                self._first_end,
+            ) = self._history.pop()
+        return self.result
+
+    def feed(self, bits: str) -> Optional[str]:
+        """Consume appended bits and return the updated result."""
+        for c in bits:
+            self.push(c)
+        return self.result
+
+    def decode(self, binary: str) -> Optional[str]:
+        """Decode a whole buffer, resuming or rewinding from the last one."""
+        bits = self.bits
+        if binary.startswith(bits):
+            return self.feed(binary[len(bits) :])
+        if bits.startswith(binary):
+            while len(self._bits) > len(binary):
+                self.pop()
+            return self.result
+        self.reset()
+        return self.feed(binary)
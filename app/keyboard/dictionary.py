@@ -0,0 +1,107 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+# Words sharing a prefix: (lo, hi) range of the sorted word list and prefix length
+Node = Tuple[int, int, int]
+
+
+class _ByteColumn:
+    """Byte depth of every word, read on demand, to bisect over.
+
+    bisect's key argument needs Python 3.10, so this stands in for the sorted
+    column of those bytes.
+    """
+
+    def __init__(
+        self, blob: Union[bytes, memoryview], offsets: Sequence[int], depth: int
+    ):
+        self.blob = blob
+        self.offsets = offsets
+        self.depth = depth
+
+    def __getitem__(self, i: int) -> int:
+        return self.blob[self.offsets[i] + self.depth]
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+
+class DictionaryIndex:
+    """Sorted dictionary packed into one byte blob, queried one char at a time.
+
+    Word i is ``blob[offsets[i] : offsets[i + 1] - 1]``, each followed by a newline.
+    Since the words are sorted, those sharing a prefix form a contiguous range, so
+    typing a char narrows the range with two bisections on the next byte. The
+    newline sorts before every letter, so a prefix is a word exactly when the
+    first word of its range ends there.
+
+    Costs the raw text plus 4 bytes per word, rather than a str object per word.
+    """
+
+    def __init__(self, blob: Union[bytes, memoryview], offsets: Sequence[int]):
+        self.blob = blob
+        self.offsets = offsets
+        self._ids = range(len(offsets) - 1)
+        self.root: Node = (0, len(self._ids), 0)
+
+    @classmethod
+    def from_words(cls, words: Iterable[str]) -> "DictionaryIndex":
+        return cls._pack(w.encode() for w in words)
+
+    @classmethod
+    def from_file(cls, path: Path) -> "DictionaryIndex":
+        """Load a newline-separated word list, e.g. english.txt."""
+        with path.open("rb") as f:
+            return cls._pack(f.read().splitlines())
+
+    @classmethod
+    def _pack(cls, words: Iterable[bytes]) -> "DictionaryIndex":
+        encoded = sorted(set(w for w in words if w))
+        offsets = array("I", [0])
+        offsets.extend(accumulate(len(w) + 1 for w in encoded))
+        encoded.append(b"")  # Trailing newline
+        return cls(b"\n".join(encoded), offsets)
+
+    def step(self, node: Node, char: str) -> Optional[Node]:
+        """Extend a prefix by char, or None if no word starts with the result."""
+        lo, hi, depth = node
+        for b in char.encode():
+            column = _ByteColumn(self.blob, self.offsets, depth)
+            lo = bisect_left(column, b, lo, hi)
+            hi = bisect_right(column, b, lo, hi)
+            if lo == hi:
+                return None
+            depth += 1
+        return lo, hi, depth
+
+    def is_word(self, node: Node) -> bool:
+        lo, _, depth = node
+        return self.offsets[lo + 1] - self.offsets[lo] - 1 == depth
+
+    def find(self, prefix: str) -> Optional[Node]:
+        """Node for prefix, or None if it starts no word."""
+        node: Optional[Node] = self.root
+        for c in prefix:
+            node = self.step(node, c)
+            if node is None:
+                return None
+        return node
+
+    def __contains__(self, word: object) -> bool:
+        if not isinstance(word, str):
+            return False
+        node = self.find(word)
+        return node is not None and self.is_word(node)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in self._ids:
+            yield self[i]
+
+    def __getitem__(self, i: int) -> str:
+        return str(self.blob[self.offsets[i] : self.offsets[i + 1] - 1], "utf-8")
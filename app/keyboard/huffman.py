@@ -1,15 +1,24 @@
+import argparse
+import os
 from collections import Counter
 from dataclasses import dataclass
-from typing import Optional, Dict, List
-from queue import PriorityQueue
-from tqdm import tqdm
+from typing import Optional, Dict, List, Sequence
+import heapq
+from functools import partial
 from pathlib import Path
 from collections import deque
 import json
-import plotly.graph_objects as go
-from treelib import Tree  # Add to imports at top
+from app.keyboard.artifact import build_artifact
+from app.keyboard.corpus import allowed_table, count_alpha, filter_words, map_chunks
+
+# tqdm and treelib are imported where used: only the offline tools need them,
+# while the server rebuilds codes at runtime (see adaptive.py). To tune the
+# codebook against a corpus, see optimize.py
+
+WEB_DIR = Path(__file__).parents[2] / "web"
 
 K = 27
+WORD_CODEBOOK_SIZE = 256  # Top freq.txt words given their own code in word mode
 
 # https://norvig.com/mayzner.html
 # https://www.cs.umd.edu/content/punctuation-input-touchscreen-keyboards-analyzing-frequency-use-and-costs
@@ -78,41 +87,155 @@ class HuffmanNode:
             }
 
 
-def analyze_frequencies(words: List[str]) -> Dict[str, int]:
-    """Count character frequencies across all words."""
+def analyze_frequencies(
+    words_path: Path, processes: Optional[int] = None
+) -> Dict[str, int]:
+    """Count character frequencies across all words, in parallel chunks."""
+    from tqdm import tqdm
+
     char_freq = Counter()
-    for word in tqdm(words, desc="Count freq"):
-        char_freq.update(c for c in word if c.isalpha())
+    for counts in tqdm(
+        map_chunks(count_alpha, words_path, processes), desc="Count freq"
+    ):
+        char_freq.update(counts)
 
     total_chars = sum(char_freq.values())
     print(f"\nTotal characters analyzed: {total_chars:,}")
     return char_freq
 
 
+def word_frequencies(
+    freq_words: List[str],
+    n_words: int,
+    char_freq: Dict[str, float] = LETTER_FREQUENCIES,
+) -> Dict[str, float]:
+    """Symbol frequencies in percent, like LETTER_FREQUENCIES, for a codebook of
+    words and chars.
+
+    freq_words is ranked, so word probabilities follow Zipf's law. The top
+    n_words (of 2+ chars) become symbols; the rest are spelled out with chars,
+    whose frequency is their count over those words mixed evenly with char_freq
+    so every char keeps a code.
+    """
+    probs = [1 / rank for rank in range(1, len(freq_words) + 1)]
+    total = sum(probs)
+
+    freqs: Dict[str, float] = {}
+    spelled = Counter()
+    for word, p in zip(freq_words, probs):
+        if len(freqs) < n_words and len(word) > 1:
+            freqs[word] = p / total
+        else:
+            for c in word:
+                spelled[c] += p / total
+
+    n_chars = sum(spelled.values())
+    scale = n_chars / sum(char_freq.values())
+    for c, f in char_freq.items():
+        freqs[c] = (spelled[c] + f * scale) / 2
+
+    total = sum(freqs.values())
+    return {symbol: 100 * f / total for symbol, f in freqs.items()}
+
+
 def build_huffman_tree(
-    char_freq: Dict[str, int], top_k: int
+    char_freq: Dict[str, int], top_k: int, space: bool = True
 ) -> tuple[HuffmanNode, List[tuple[str, int]]]:
-    """Build Huffman tree from top K most frequent characters."""
-    pq = PriorityQueue()
+    """Build Huffman tree from top K most frequent characters.
+
+    With space, a space symbol is added with the shortest code; otherwise
+    char_freq is coded as given. Nodes are pushed in the same order as the
+    queue.PriorityQueue this used to use (itself a heapq), so ties break the same
+    way and the codes are unchanged.
+    """
+    heap: List[HuffmanNode] = []
 
     # Get top K characters
     top_chars = sorted(char_freq.items(), key=lambda x: x[1], reverse=True)[:top_k]
 
     # Let 'space' have shortest Huffman code
-    pq.put(HuffmanNode(" ", top_chars[0][1] + 1))
+    if space:
+        heapq.heappush(heap, HuffmanNode(" ", top_chars[0][1] + 1))
     for char, freq in top_chars:
-        pq.put(HuffmanNode(char, freq))
+        heapq.heappush(heap, HuffmanNode(char, freq))
 
     # Build tree
-    while pq.qsize() > 1:
-        left = pq.get()
-        right = pq.get()
+    while len(heap) > 1:
+        left = heapq.heappop(heap)
+        right = heapq.heappop(heap)
         internal = HuffmanNode(
             char="", freq=left.freq + right.freq, left=left, right=right
         )
-        pq.put(internal)
+        heapq.heappush(heap, internal)
+
+    return heap[0], top_chars
+
+
+def huffman_code_lengths(freqs: Sequence[float]) -> List[int]:
+    """Huffman code length for each frequency, without building a tree.
+
+    Two-queue construction: the leaves sorted ascending, then the merged nodes,
+    which are created in non-decreasing order too, so the two smallest are always
+    at the queue fronts and merging is linear after the sort. Nodes only record
+    their parent, from which depths follow.
+    """
+    n = len(freqs)
+    order = sorted(range(n), key=freqs.__getitem__)
+    weight = [freqs[i] for i in order] + [0] * (n - 1)  # Leaves, then merged
+    parent = [0] * (2 * n - 1)
+
+    leaf, merged = 0, n  # Fronts of the two queues
+    for node in range(n, 2 * n - 1):
+        for _ in range(2):
+            if leaf < n and (merged == node or weight[leaf] <= weight[merged]):
+                child, leaf = leaf, leaf + 1
+            else:
+                child, merged = merged, merged + 1
+            weight[node] += weight[child]
+            parent[child] = node
+
+    depth = [0] * (2 * n - 1)  # Root is the last node
+    for node in range(2 * n - 3, -1, -1):
+        depth[node] = depth[parent[node]] + 1
+
+    lengths = [0] * n
+    for rank, i in enumerate(order):
+        lengths[i] = depth[rank]
+    return lengths
+
+
+def code_lengths(char_freq: Dict[str, float], top_k: int) -> Dict[str, int]:
+    """Code length per char of build_huffman_tree(char_freq, top_k), treeless."""
+    top_chars = sorted(char_freq.items(), key=lambda x: x[1], reverse=True)[:top_k]
+    chars = [" "] + [char for char, _ in top_chars]
+    freqs = [top_chars[0][1] + 1] + [freq for _, freq in top_chars]
+    return dict(zip(chars, huffman_code_lengths(freqs)))
 
-    return pq.get(), top_chars
+
+def average_code_length(char_freq: Dict[str, float], top_k: int) -> float:
+    """E(l) over char_freq for a top K code, counting uncoded chars as 0 bits."""
+    lengths = code_lengths(char_freq, top_k)
+    total_freq = sum(char_freq.values())
+    return sum(
+        lengths[char] * freq / total_freq
+        for char, freq in char_freq.items()
+        if char in lengths
+    )
+
+
+def tree_codes(root: HuffmanNode) -> Dict[str, str]:
+    """Codes of a Huffman tree (left 0, right 1), as in build_prefix_code."""
+    codes = {}
+    stack = [(root, "")]
+    while stack:
+        node, code = stack.pop()
+        if node.char:
+            codes[node.char] = code
+        if node.left:
+            stack.append((node.left, code + "0"))
+        if node.right:
+            stack.append((node.right, code + "1"))
+    return dict(sorted(codes.items()))
 
 
 def build_prefix_code(
@@ -123,6 +246,8 @@ def build_prefix_code(
     Returns:
         dict: Contains 'codes' mapping and serialized 'tree' structure
     """
+    from treelib import Tree
+
     total_freq = sum(char_freq.values())
 
     # Build codes and tree visualization in single BFS
@@ -158,96 +283,81 @@ def build_prefix_code(
     }
 
 
-def restrict_dictionary(words: List[str], top_chars: List[tuple[str, int]]):
-    """Compute restricted subset of dictionary where all letters are in Huffman tree."""
-    charset = set(c for c, _ in top_chars)
+def restrict_dictionary(
+    words_path: Path,
+    top_chars: List[tuple[str, int]],
+    out_path: Path,
+    processes: Optional[int] = None,
+) -> int:
+    """Write the subset of dictionary where all letters are in Huffman tree.
 
-    count = 0
-    for word in tqdm(words, desc="Restrict dict"):
-        if all(c in charset for c in word):
-            count += 1
-            yield word
+    Streams words_path in parallel chunks, so the output may replace the input.
+    Returns the number of words kept.
+    """
+    from tqdm import tqdm
 
-    print(
-        f"Saved {count:,}/{len(words):,} ~ {count/len(words)*100:.2f}% words in restricted English coding"
-    )
+    table = allowed_table(c for c, _ in top_chars)
 
+    count = total = 0
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        results = map_chunks(partial(filter_words, table=table), words_path, processes)
+        for kept, n_kept, n_words in tqdm(results, desc="Restrict dict"):
+            f.write(kept)
+            count += n_kept
+            total += n_words
+    os.replace(tmp_path, out_path)
 
-def analyze_k_values(words: List[str], k_range=range(1, K + 1)):
-    """Find change in average prefix length E(l) as function of k, number of codewords.
-    Annotates plot with new characters added at each K.
-    """
-    char_freq = LETTER_FREQUENCIES  # analyze_frequencies(words)
-    avg_lengths = []
-    alphabet_sets = []  # Cache alphabet sets for each k
-
-    for k in k_range:
-        # Build tree and get codes for this K
-        root, top_chars = build_huffman_tree(char_freq, top_k=k)
-        json_output = build_prefix_code(root, char_freq)
-        codes = json_output["codes"]
-        alphabet_sets.append(set(codes.keys()))
-
-        # Calculate weighted average prefix length
-        total_freq = sum(char_freq.values())
-        avg_length = sum(
-            len(codes.get(char, "")) * freq / total_freq
-            for char, freq in char_freq.items()
-            if char in codes
-        )
-        avg_lengths.append(avg_length)
-
-    # Create plotly figure with annotations
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatter(
-            x=list(k_range),
-            y=avg_lengths,
-            mode="lines+markers",
-            name="Average Prefix Length",
-        )
+    print(
+        f"Saved {count:,}/{total:,} ~ {count/total*100:.2f}% words in restricted English coding"
     )
+    return count
 
-    # Add annotations for new characters at each k
-    for i in range(len(alphabet_sets) - 1, 0, -1):
-        new_chars = alphabet_sets[i] - alphabet_sets[i - 1]
-        if new_chars:
-            fig.add_annotation(
-                x=list(k_range)[i],
-                y=avg_lengths[i],
-                text=f"+{','.join(sorted(list(new_chars)))}",
-                showarrow=True,
-                arrowhead=1,
-                yshift=5,
-            )
-
-    fig.update_layout(
-        title="Average Huffman Code Length vs K",
-        xaxis_title="K (Alphabet Size)",
-        yaxis_title="Average Code Length (bits)",
-        template="plotly_white",
-    )
 
-    fig.write_image("huffman_analysis.png")
+def write_web_tree(json_output: dict, path: Path) -> None:
+    """Export a codebook as the huffmanTree constant drawn by web/huffman.js."""
+    with path.open("w") as f:
+        f.write(f"const huffmanTree={json.dumps(json_output, indent=2)};\n")
 
 
-def main():
-    with (Path(__file__).parent / "english.txt").open() as f:
-        words = [w.strip() for w in f.readlines()]
+def main(n_words: int = 0):
+    """Build huffman.json, or with n_words a word codebook, huffman_words.json."""
+    words_path = Path(__file__).parent / "english.txt"
 
-    analyze_k_values(words)  # Add analysis before original logic
+    if n_words:
+        with words_path.open() as f:
+            dictionary = set(f.read().splitlines())
+        with (Path(__file__).parent / "freq.txt").open() as f:
+            freq_words = [w for w in f.read().splitlines() if w in dictionary]
+        char_freq = word_frequencies(freq_words, n_words)
+        huffman_root, _ = build_huffman_tree(char_freq, top_k=len(char_freq))
+        json_output = build_prefix_code(huffman_root, char_freq)
+        with (Path(__file__).parent / "huffman_words.json").open("w") as f:
+            f.write(json.dumps(json_output, indent=2))
+        write_web_tree(json_output, WEB_DIR / "huffmanWordTreeConstant.js")
+        return
 
-    char_freq = LETTER_FREQUENCIES  # analyze_frequencies(words)
+    char_freq = LETTER_FREQUENCIES  # analyze_frequencies(words_path)
     huffman_root, top_chars = build_huffman_tree(char_freq, top_k=K)
     json_output = build_prefix_code(huffman_root, char_freq)
 
-    with (Path(__file__).parent / "english'.txt").open("w") as f:
-        for w in restrict_dictionary(words, top_chars):
-            f.write(w + "\n")
+    restrict_dictionary(words_path, top_chars, Path(__file__).parent / "english'.txt")
 
     with (Path(__file__).parent / "huffman.json").open("w") as f:
         f.write(json.dumps(json_output, indent=2))
+    write_web_tree(json_output, WEB_DIR / "huffmanTreeConstant.js")
+
+    build_artifact()  # Recompile keyboard.bin against the new codebook
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "--words",
+        type=int,
+        nargs="?",
+        const=WORD_CODEBOOK_SIZE,
+        default=0,
+        help=f"code the top N words too (default N: {WORD_CODEBOOK_SIZE})",
+    )
+    main(parser.parse_args().words)
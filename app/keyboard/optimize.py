@@ -0,0 +1,276 @@
+"""Codebook tuning against a word corpus, by expected bits per word.
+
+    python -m app.keyboard.optimize [--corpus freq.txt] [--miss-bits 64]
+
+Candidates differ in alphabet, the top K chars of the corpus, and in the weights
+the tree is built with for the word separator " " and Enter (">"). Every
+codebook codes both, as the keyboard needs them; letting the search drop them
+would always "win" by moving their cost to gestures it does not count. However a
+candidate weighs them, it is scored at the true rates: one separator per word
+and the corpus' Enter rate. The score is the expected bits to type one corpus
+word *including its separator*, where a word the alphabet cannot spell costs
+miss_bits instead, so coverage trades off against shorter codes rather than
+filtering candidates. All candidates are scored at once as a matrix product of
+per-word char counts and per-candidate code lengths, so a sweep only builds the
+winning tree.
+
+Writes the best candidate to huffman.json (and the web tree and keyboard.bin, as
+huffman.py does) plus a Markdown report of the sweep.
+"""
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from app.keyboard.artifact import build_artifact
+from app.keyboard.huffman import (
+    LETTER_FREQUENCIES,
+    WEB_DIR,
+    build_huffman_tree,
+    build_prefix_code,
+    huffman_code_lengths,
+    write_web_tree,
+)
+
+root = Path(__file__).parent
+
+# Enter's share of typed letters in LETTER_FREQUENCIES
+ENTER_SHARE = LETTER_FREQUENCIES[">"] / sum(
+    f for c, f in LETTER_FREQUENCIES.items() if c != ">"
+)
+
+
+# Multiples of the true separator and Enter rates tried as tree weights. The true
+# rates come first, so they win ties
+WEIGHT_SCALES = (1.0, 0.5, 2.0, 0.25, 4.0)
+
+
+@dataclass(frozen=True)
+class Candidate:
+    k: int  # Corpus chars coded, most frequent first
+    space_weight: float  # Separator (" ") count per word the tree is built for
+    enter_weight: float  # Enter (">") count per word the tree is built for
+
+
+@dataclass
+class Corpus:
+    words: List[str]
+    probs: np.ndarray  # P(word)
+    chars: List[str]  # Chars in the corpus, most frequent first
+    counts: np.ndarray  # (word, char) occurrences
+
+    @classmethod
+    def from_file(cls, path: Path) -> "Corpus":
+        """Read "word count" lines, or ranked words (like freq.txt) under Zipf's law."""
+        words, weights = [], []
+        with path.open() as f:
+            for rank, line in enumerate(f, 1):
+                word, *count = line.split()
+                words.append(word)
+                weights.append(float(count[0]) if count else 1 / rank)
+        return cls.from_words(words, weights)
+
+    @classmethod
+    def from_words(cls, words: Sequence[str], weights: Sequence[float]) -> "Corpus":
+        probs = np.asarray(weights, dtype=np.float64)
+        probs /= probs.sum()
+
+        index: Dict[str, int] = {}
+        rows, cols = [], []
+        for i, word in enumerate(words):
+            for c in word:
+                rows.append(i)
+                cols.append(index.setdefault(c, len(index)))
+        counts = np.zeros((len(words), len(index)))
+        np.add.at(counts, (rows, cols), 1)
+
+        order = np.argsort(-(probs @ counts), kind="stable")
+        chars = list(index)
+        return cls(list(words), probs, [chars[i] for i in order], counts[:, order])
+
+    @property
+    def char_freq(self) -> np.ndarray:
+        """Expected occurrences of each char per word."""
+        return self.probs @ self.counts
+
+
+def symbol_freqs(corpus: Corpus, candidate: Candidate) -> Dict[str, float]:
+    """Symbols of a candidate codebook and their expected count per word."""
+    freqs = dict(zip(corpus.chars[: candidate.k], corpus.char_freq.tolist()))
+    freqs[" "] = candidate.space_weight
+    freqs[">"] = candidate.enter_weight
+    return freqs
+
+
+def expected_bits(
+    corpus: Corpus,
+    lengths: np.ndarray,
+    separator_bits: np.ndarray,
+    miss_bits: float,
+) -> Tuple[np.ndarray, ...]:
+    """Bits per word, bits per char and coverage of (char, codebook) code lengths.
+
+    separator_bits is what each codebook spends per word on " " and Enter. A
+    word with an uncoded char (length 0) costs miss_bits in all, and counts
+    towards neither bits per char nor coverage.
+    """
+    typable = corpus.counts @ (lengths == 0) == 0  # (word, codebook)
+    weights = corpus.probs[:, None] * typable
+    coverage = weights.sum(axis=0)
+    char_bits = (weights * (corpus.counts @ lengths)).sum(axis=0)
+    chars = (weights * corpus.counts.sum(axis=1)[:, None]).sum(axis=0)
+    bits = char_bits + coverage * separator_bits + (1 - coverage) * miss_bits
+    return bits, char_bits / np.maximum(chars, 1e-12), coverage
+
+
+def score(
+    corpus: Corpus,
+    candidates: Sequence[Candidate],
+    enter_rate: float,
+    miss_bits: float,
+) -> Tuple[np.ndarray, ...]:
+    """expected_bits of each candidate, typing enter_rate Enters per word."""
+    lengths = np.zeros((len(corpus.chars), len(candidates)))  # 0 for uncoded chars
+    separator_bits = np.zeros(len(candidates))
+    for j, candidate in enumerate(candidates):
+        freqs = symbol_freqs(corpus, candidate)
+        code = dict(zip(freqs, huffman_code_lengths(list(freqs.values()))))
+        lengths[: candidate.k, j] = [code[c] for c in corpus.chars[: candidate.k]]
+        separator_bits[j] = code[" "] + enter_rate * code[">"]
+    return expected_bits(corpus, lengths, separator_bits, miss_bits)
+
+
+def candidate_grid(
+    corpus: Corpus,
+    k_min: int,
+    enter_rate: float,
+    scales: Sequence[float] = WEIGHT_SCALES,
+) -> List[Candidate]:
+    """Every K from k_min, with separator and Enter weights at each scale of
+    their true rates."""
+    return [
+        Candidate(k, space, enter * enter_rate)
+        for k in range(max(k_min, 1), len(corpus.chars) + 1)
+        for space in scales
+        for enter in scales
+    ]
+
+
+def current_bits(
+    corpus: Corpus, codes: Dict[str, str], enter_rate: float, miss_bits: float
+) -> float:
+    """Bits per word of an existing codebook, scored like the candidates."""
+    lengths = np.array([[len(codes.get(c, ""))] for c in corpus.chars], dtype=float)
+    separator = len(codes.get(" ", "")) + enter_rate * len(codes.get(">", ""))
+    bits, _, _ = expected_bits(corpus, lengths, np.array([separator]), miss_bits)
+    return float(bits[0])
+
+
+def write_report(
+    path: Path,
+    corpus_path: Path,
+    candidates: Sequence[Candidate],
+    scores: Tuple[np.ndarray, ...],
+    best: int,
+    baseline: Optional[float],
+    enter_rate: float,
+    miss_bits: float,
+    top: int = 20,
+) -> None:
+    bits, per_char, coverage = scores
+    c = candidates[best]
+    lines = [
+        "# Codebook optimization",
+        "",
+        f"Corpus: `{corpus_path.name}`, {len(candidates)} candidates. Bits per word"
+        f" include the word separator and {enter_rate:.3f} Enter per word; a word"
+        f" the alphabet cannot spell costs {miss_bits:g} bits.",
+        "",
+        f"Best: K={c.k}, tree weights {c.space_weight:.3f} separator and"
+        f" {c.enter_weight:.3f} Enter per word:"
+        f" **{bits[best]:.3f} bits/word** ({per_char[best]:.3f} bits/char),"
+        f" coverage {coverage[best]:.2%}.",
+    ]
+    if baseline is not None:
+        lines.append(
+            f"The current huffman.json scored the same way: {baseline:.3f} bits/word."
+        )
+
+    lines += [
+        "",
+        "| K | separator weight | Enter weight | bits/word | bits/char | coverage |",
+        "|--:|--:|--:|--:|--:|--:|",
+    ]
+    for j in np.argsort(bits, kind="stable")[:top]:
+        c = candidates[j]
+        lines.append(
+            f"| {c.k} | {c.space_weight:.3f} | {c.enter_weight:.3f}"
+            f" | {bits[j]:.3f} | {per_char[j]:.3f} | {coverage[j]:.2%} |"
+        )
+    path.write_text("\n".join(lines) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--corpus", type=Path, default=root / "freq.txt")
+    parser.add_argument("--k-min", type=int, default=20)
+    parser.add_argument(
+        "--enter-rate",
+        type=float,
+        help="Enter symbols per word (default: as common among letters as in"
+        " LETTER_FREQUENCIES)",
+    )
+    parser.add_argument(
+        "--miss-bits",
+        type=float,
+        default=64.0,
+        help="cost of a corpus word the alphabet cannot spell, typed some other way",
+    )
+    parser.add_argument("--out", type=Path, default=root / "huffman.json")
+    parser.add_argument("--report", type=Path, default=root / "codebook_report.md")
+    parser.add_argument("--dry-run", action="store_true", help="only the report")
+    args = parser.parse_args()
+
+    corpus = Corpus.from_file(args.corpus)
+    enter_rate = args.enter_rate
+    if enter_rate is None:
+        enter_rate = ENTER_SHARE * float(corpus.char_freq.sum())
+    candidates = candidate_grid(corpus, args.k_min, enter_rate)
+    scores = score(corpus, candidates, enter_rate, args.miss_bits)
+    bits = scores[0]
+    best = int(np.argmin(bits))
+
+    baseline = None
+    if (root / "huffman.json").exists():
+        with (root / "huffman.json").open() as f:
+            codes = json.load(f)["codes"]
+        baseline = current_bits(corpus, codes, enter_rate, args.miss_bits)
+    write_report(
+        args.report,
+        args.corpus,
+        candidates,
+        scores,
+        best,
+        baseline,
+        enter_rate,
+        args.miss_bits,
+    )
+    print(f"Wrote {args.report}: {bits[best]:.3f} bits/word with {candidates[best]}")
+
+    if not args.dry_run:
+        freqs = symbol_freqs(corpus, candidates[best])
+        tree, _ = build_huffman_tree(freqs, top_k=len(freqs), space=False)
+        json_output = build_prefix_code(tree, freqs)
+        with args.out.open("w") as f:
+            f.write(json.dumps(json_output, indent=2))
+        if args.out == root / "huffman.json":
+            write_web_tree(json_output, WEB_DIR / "huffmanTreeConstant.js")
+            build_artifact()  # Recompile keyboard.bin against the new codebook
+
+
+if __name__ == "__main__":
+    main()
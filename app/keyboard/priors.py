@@ -0,0 +1,68 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def zipf_log_prior(n: int) -> np.ndarray:
+    """log P(word) for ranks 1..n under Zipf's law, as freq.txt only has ranks."""
+    ranks = np.arange(1, n + 1, dtype=np.float64)
+    return -np.log(ranks) - np.log(np.sum(1 / ranks))
+
+
+@dataclass
+class SuggestionPriors:
+    """Frequency and bigram log-priors, dense and aligned with the candidate rows.
+
+    Suggestions are ranked by
+        distance - prior_weight * log P(w) - bigram_weight * log(P(w | prev) / P(w))
+    with P(w | prev) smoothed towards P(w). Everything but distance depends only on
+    the previously accepted word, so it is folded into one bias row per accepted
+    word and scoring a bit is a single vector subtraction.
+    """
+
+    words: List[str]
+    log_prior: np.ndarray  # log P(w) per row
+    bigrams: Dict[str, Counter] = field(default_factory=dict)
+    prior_weight: float = 0.2  # Bits of distance per nat: 1 bit ~ 150x likelier
+    bigram_weight: float = 0.2
+    smoothing: float = 1.0  # Pseudo-count pulling P(w | prev) towards P(w)
+
+    def __post_init__(self):
+        self._index = {w: i for i, w in enumerate(self.words)}
+        self.set_previous(None)
+
+    def set_previous(self, word: Optional[str]) -> None:
+        """Condition on the last accepted word, precomputing the bias row."""
+        self.previous = word
+        self.bias = self.prior_weight * self.log_prior
+
+        counts = self.bigrams.get(word) if word is not None else None
+        if not counts or not self.bigram_weight:
+            return
+        # Followers outside the candidates (e.g. words missing from freq.txt) can
+        # not be ranked; with none left, context is the same for every row
+        rows = np.array(
+            [self._index[w] for w in counts if w in self._index], dtype=np.intp
+        )
+        if len(rows):
+            total = sum(counts.values())
+            seen = np.array([counts[self.words[i]] for i in rows], dtype=np.float64)
+            p = np.exp(self.log_prior[rows])
+
+            # Unseen words share P(w | prev) / P(w) = smoothing / (total + smoothing)
+            context = np.full(len(self.words), np.log(self.smoothing))
+            context[rows] = np.log(seen / p + self.smoothing)
+            context -= np.log(total + self.smoothing)
+            self.bias = self.bias + self.bigram_weight * context
+
+    def observe(self, word: str) -> None:
+        """Count the bigram (previous, word) and condition on word next."""
+        if self.previous is not None:
+            self.bigrams.setdefault(self.previous, Counter())[word] += 1
+        self.set_previous(word)
+
+    def scores(self, dist: np.ndarray) -> np.ndarray:
+        """Lower is better."""
+        return dist - self.bias
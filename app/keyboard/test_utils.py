@@ -1,10 +1,56 @@
+import asyncio
 import random
-from typing import Iterator
-from app.keyboard.constants import HUFFMAN, HUFFMAN_INV, WORDS
+from collections import Counter
+from typing import Iterator, Optional
+from pathlib import Path
+from app.api.bit import handle
+from app.keyboard.adaptive import AdaptiveCodebook, expected_length, word_codebook
+from app.keyboard.artifact import build_artifact, load_artifact
+from app.keyboard.constants import (
+    FREQ_CODE_BLOCKS,
+    FREQ_CODE_LENGTHS,
+    FREQ_LOG_PRIOR,
+    FREQ_WORDS,
+    HUFFMAN,
+    HUFFMAN_INV,
+    WORDS,
+)
+from app.keyboard.decoder import HuffmanDecoder, HuffmanTrie
+from app.keyboard.dictionary import DictionaryIndex
+from app.keyboard.optimize import Corpus, candidate_grid, score, symbol_freqs
+from app.keyboard.codec import HuffmanCodec
+from app.keyboard.corpus import read_chunks
+from app.keyboard.huffman import (
+    analyze_frequencies,
+    build_huffman_tree,
+    code_lengths,
+    huffman_code_lengths,
+    restrict_dictionary,
+    tree_codes,
+    word_frequencies,
+)
+from app.keyboard.priors import SuggestionPriors
+from app.keyboard.textual_toy import AutocorrectEngine
+from app.models import StateBit
+import numpy as np
+from app.keyboard.vector_engine import (
+    K,
+    MAX_CLOSE,
+    LevenshteinScorer,
+    SuggestionCursor,
+    VectorAutocorrectEngine,
+    rank_suggestions,
+    unpack_bits,
+)
 from app.keyboard.utils import (
     binary_edit_distance,
     BinaryEditDistanceStream,
+    LevenshteinStream,
     binary_to_word,
+    levenshtein_distance,
+    make_beam_decoder,
+    make_decoder,
+    pad_coding,
 )
 
 
@@ -130,6 +176,75 @@ def test_stream():
     print("All pass: stream")
 
 
+def _naive_levenshtein(s1: str, s2: str) -> int:
+    prev = list(range(len(s2) + 1))
+    for i, a in enumerate(s1, 1):
+        cur = [i]
+        for j, b in enumerate(s2, 1):
+            cur.append(min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (a != b)))
+        prev = cur
+    return prev[-1]
+
+
+def test_levenshtein():
+    """Bit-parallel Levenshtein matches the textbook DP, batch and streaming."""
+    random.seed(42)
+
+    assert levenshtein_distance("", "") == 0
+    assert levenshtein_distance("", "101") == 3
+    assert levenshtein_distance("101", "") == 3
+    assert levenshtein_distance("10" * 32, "01" * 32) == 2
+    assert levenshtein_distance("1" * 1000, "1" * 100) == 900
+    assert levenshtein_distance("1" * 1000, "1" * 100, max_distance=10) is None
+
+    for _ in range(300):
+        s1 = "".join(random.choice("01") for _ in range(random.randint(0, 140)))
+        s2 = "".join(random.choice("01") for _ in range(random.randint(0, 140)))
+        expected = _naive_levenshtein(s1, s2)
+        assert levenshtein_distance(s1, s2) == expected, (s1, s2)
+        band = random.randint(0, 20)
+        banded = levenshtein_distance(s1, s2, max_distance=band)
+        assert banded == (expected if expected <= band else None), (s1, s2, band)
+
+    # Streaming: every prefix, with pops restoring earlier columns
+    for _ in range(50):
+        s2 = "".join(random.choice("01") for _ in range(random.randint(0, 80)))
+        s1 = _flip_bits(s2, min(3, len(s2))) + random.choice(["", "0", "11"])
+        stream = LevenshteinStream(s2, max_distance=4)
+        for i, c in enumerate(s1, 1):
+            expected = _naive_levenshtein(s1[:i], s2)
+            got = stream.add(c)
+            if got is None:
+                # Pruned only when no extension of s1[:i] gets back within band
+                assert all(
+                    _naive_levenshtein(s1[:i] + s2[k:], s2) > 4
+                    for k in range(len(s2) + 1)
+                )
+                break
+            assert got == expected
+        cut = random.randint(0, stream.s1_len)
+        while stream.s1_len > cut:
+            stream.pop()
+        assert stream.pop() == (
+            None if stream.pruned else _naive_levenshtein(s1[: stream.s1_len], s2)
+        )
+
+
+def test_stream_pop():
+    """Popping characters restores the distance of the shorter prefix."""
+    random.seed(42)
+
+    for _ in range(100):
+        s2 = "".join(random.choice("01") for _ in range(random.randint(0, 150)))
+        s1 = "".join(random.choice("01") for _ in range(random.randint(0, 150)))
+        calculator = BinaryEditDistanceStream(s2)
+        for c in s1:
+            calculator.add(c)
+        for i in range(len(s1) - 1, -1, -1):
+            assert calculator.pop() == binary_edit_distance(s1[:i], s2)
+        assert calculator.pop() == len(s2)  # Nothing left to remove
+
+
 def invalid_seq_candidates(max_code_len: int) -> Iterator[str]:
     """Generate candidate invalid sequences.
 
@@ -294,6 +409,453 @@ def test_binary_to_word():
     print(f"All {len(test_cases)} binary_to_word tests passed")
 
 
+def _reference_binary_to_word(binary: str) -> Optional[str]:
+    """Original substring-scanning decoder, kept as an oracle for the trie walk."""
+    word = ""
+    i = 0
+    last_valid_word = ""
+    max_code_len = max(len(code) for code in HUFFMAN_INV)
+
+    while i < len(binary):
+        found_match = False
+        for j in range(i + 1, min(i + max_code_len + 1, len(binary) + 1)):
+            prefix = binary[i:j]
+            if prefix in HUFFMAN_INV:
+                if len(binary) - j > max_code_len:
+                    return None
+                word += HUFFMAN_INV[prefix][0]
+                i = j
+                if word in WORDS:
+                    last_valid_word = word
+                found_match = True
+                break
+            if len(prefix) >= max_code_len:
+                return None
+
+        if not found_match:
+            if len(binary) - i > max_code_len:
+                return None
+            return last_valid_word
+
+    return word if word in WORDS else last_valid_word
+
+
+def test_binary_to_word_matches_reference():
+    """Trie decoder agrees with the substring scan, including resumed calls."""
+    random.seed(42)
+
+    valid_codes = list(HUFFMAN_INV.keys())
+    buffers = [format(i, "b")[1:] for i in range(1, 2**12)]  # All up to 11 bits
+    for _ in range(200):
+        seq = "".join(random.choice(valid_codes) for _ in range(random.randint(1, 6)))
+        buffers.append(seq + "".join(random.choice("01") for _ in range(3)))
+    for _ in range(200):
+        buffers.append(
+            "".join(random.choice("01") for _ in range(random.randint(0, 40)))
+        )
+
+    for binary in buffers:
+        # Type bit by bit, then backspace, to exercise resume and restart
+        for i in list(range(len(binary) + 1)) + list(range(len(binary), -1, -1)):
+            expected = _reference_binary_to_word(binary[:i])
+            assert binary_to_word(binary[:i]) == expected, binary[:i]
+
+
+def test_decoder_push_pop():
+    """Undoing bits restores exactly the state of decoding the shorter buffer."""
+    random.seed(42)
+
+    decoder = make_decoder()
+    words = sorted(WORDS)[:5000]
+    for _ in range(200):
+        word = random.choice(words)
+        binary = "".join(HUFFMAN[c] for c in word)
+        decoder.reset()
+        decoder.feed(binary)
+        assert decoder.is_word and decoder.word == word
+
+        cut = random.randint(0, len(binary))
+        for _ in range(len(binary) - cut):
+            decoder.pop()
+        fresh = make_decoder()
+        fresh.feed(binary[:cut])
+        assert decoder.bits == fresh.bits == binary[:cut]
+        assert (decoder.result, decoder.word, decoder.is_word) == (
+            fresh.result,
+            fresh.word,
+            fresh.is_word,
+        )
+
+
+def test_dictionary_index():
+    """Prefix index agrees with a plain set on words and prefixes."""
+    random.seed(42)
+
+    words = ["a", "ab", "abc", "abd", "b", "ba", "zz"]
+    index = DictionaryIndex.from_words(words + ["ab", ""])
+    assert list(index) == words and len(index) == len(words)
+    for w in ["", "a", "ab", "abc", "abe", "abcd", "bb", "z", "zz", "zzz"]:
+        assert (w in index) == (w in words), w
+        has_prefix = any(x.startswith(w) for x in words)
+        assert (index.find(w) is not None) == has_prefix, w
+
+    sample = random.sample(sorted(WORDS), 2000)
+    for w in sample:
+        assert w in WORDS
+        cut = random.randint(0, len(w))
+        assert WORDS.find(w[:cut]) is not None
+
+
+def test_artifact_roundtrip(tmp_path):
+    """Compiled artifact maps back to the same codebook, words and codes."""
+    root = Path(__file__).parent
+    out = tmp_path / "keyboard.bin"
+    build_artifact(out_path=out)
+
+    artifact = load_artifact(out, root / "huffman.json")
+    assert artifact is not None
+    assert artifact.codes == HUFFMAN
+    assert artifact.freq_words == FREQ_WORDS
+    assert len(artifact.words) == len(WORDS)
+    assert all((w in artifact.words) == (w in WORDS) for w in FREQ_WORDS[:500])
+    for i, word in enumerate(FREQ_WORDS[:500]):
+        n = int(artifact.freq_lengths[i])
+        value = sum(int(b) << (64 * j) for j, b in enumerate(artifact.freq_blocks[i]))
+        code = "".join(str(value >> j & 1) for j in range(n))
+        assert code == "".join(HUFFMAN[c] for c in word)
+
+    # Stale once any source changes
+    other = tmp_path / "huffman.json"
+    other.write_text('{"codes": {}}')
+    assert load_artifact(out, other) is None
+    for name in ["english.txt", "freq.txt"]:
+        changed = tmp_path / name
+        changed.write_text((root / name).read_text() + "zyzzyvaq\n")
+        paths = {"words_path" if name == "english.txt" else "freq_path": changed}
+        assert load_artifact(out, root / "huffman.json", **paths) is None
+
+
+def test_vector_distances():
+    """Vectorized distances match binary_edit_distance for every candidate."""
+    random.seed(42)
+
+    engine = VectorAutocorrectEngine()
+    codes = ["".join(HUFFMAN[c] for c in w) for w in engine.words]
+    for length in [0, 1, 5, 17, 63, 64, 65, 80, 130]:
+        binary = "".join(random.choice("01") for _ in range(length))
+        expected = [binary_edit_distance(binary, code) for code in codes]
+        assert engine.distances(binary).tolist() == expected, length
+
+
+def test_levenshtein_scorer():
+    """Lane-parallel scorer matches levenshtein_distance for every candidate."""
+    random.seed(42)
+
+    scorer = LevenshteinScorer(FREQ_CODE_BLOCKS, FREQ_CODE_LENGTHS)
+    codes = ["".join(HUFFMAN[c] for c in w) for w in FREQ_WORDS]
+    lanes = scorer.start()
+    cursor = SuggestionCursor()
+    for length in [0, 1, 5, 17, 64, 70]:
+        binary = "".join(random.choice("01") for _ in range(length))
+        expected = [levenshtein_distance(binary, code) for code in codes]
+        lanes.reset()
+        lanes.seek(binary)
+        assert lanes.distances.tolist() == expected
+
+        # Pushing and popping bits tracks the typed bits
+        cursor.reset()
+        for c in binary + "1":
+            cursor.push(c)
+        cursor.pop()
+        assert cursor.bits == binary
+
+
+def test_levenshtein_lanes():
+    """Carried, pruned lanes agree with levenshtein_distance within the band
+    through pushes, backspaces and seeks."""
+    random.seed(42)
+
+    scorer = LevenshteinScorer(FREQ_CODE_BLOCKS, FREQ_CODE_LENGTHS)
+    codes = ["".join(HUFFMAN[c] for c in w) for w in FREQ_WORDS]
+    lanes = scorer.start(max_distance=6)
+    typed = ""
+    for _ in range(50):
+        if typed and random.random() < 0.3:
+            typed = typed[:-1]
+            lanes.pop()
+        elif random.random() < 0.1:
+            typed = typed[: random.randint(0, len(typed))]
+            typed += "".join(random.choice("01") for _ in range(random.randint(0, 9)))
+            lanes.seek(typed)
+        else:
+            typed += random.choice("01")
+            lanes.push(typed[-1])
+
+        assert lanes.cursor.bits == typed
+        # Exact within the band; anything past it only has to stay past it
+        expected = np.array([levenshtein_distance(typed, code) for code in codes])
+        distances = np.minimum(lanes.distances, 7)
+        assert np.array_equal(distances, np.minimum(expected, 7)), typed
+
+    # Words out of reach stop costing anything
+    lanes.seek("0" * 80)
+    assert len(lanes._band.lanes) < len(codes) / 10
+    lanes.reset()
+    assert lanes.cursor.length == 0
+    assert lanes.distances.tolist() == scorer.lengths.tolist()
+
+
+def test_rank_suggestions():
+    """Partial-sort ranking matches a full sort by (distance, frequency rank)."""
+    random.seed(42)
+
+    for _ in range(200):
+        dist = np.array([random.randint(0, 8) for _ in range(random.randint(1, 300))])
+        threshold = random.randint(0, 3)
+        band = random.choice([None, random.randint(0, 8)])
+        ranked = sorted(range(len(dist)), key=lambda i: (dist[i], i))
+
+        close = [i for i in ranked if dist[i] < threshold][:MAX_CLOSE]
+        if not close:
+            close = [i for i in ranked if band is None or dist[i] <= band][:K]
+        assert rank_suggestions(dist, threshold, band).tolist() == close
+
+
+def test_suggestion_priors():
+    """Priors break distance ties by frequency and learn from accepted words."""
+    assert np.isclose(np.logaddexp.reduce(FREQ_LOG_PRIOR), 0)
+    assert np.all(np.diff(FREQ_LOG_PRIOR) < 0)
+
+    priors = SuggestionPriors(FREQ_WORDS, FREQ_LOG_PRIOR)
+    dist = np.full(len(FREQ_WORDS), 3)
+    assert rank_suggestions(dist, 0, None, priors.scores(dist)).tolist() == [0]
+
+    rare = len(FREQ_WORDS) - 1
+    for _ in range(50):
+        priors.set_previous("the")
+        priors.observe(FREQ_WORDS[rare])
+    priors.set_previous("the")
+    assert rank_suggestions(dist, 0, None, priors.scores(dist)).tolist() == [rare]
+
+    # One bit closer still beats the prior of an ordinary word
+    dist[100] = 2
+    priors.set_previous(None)
+    assert rank_suggestions(dist, 0, None, priors.scores(dist)).tolist() == [100]
+
+    # Accepted words outside freq.txt never crash bigram conditioning
+    priors = SuggestionPriors(FREQ_WORDS, FREQ_LOG_PRIOR)
+    for word in ["the", "zyzzyvaq", "cat", "the"]:
+        priors.observe(word)
+    assert priors.scores(dist).shape == dist.shape
+
+    engine = VectorAutocorrectEngine()
+    engine.best = "hello"
+    assert engine.accept() == "hello"
+    assert engine.priors.previous == "hello" and engine.best is None
+
+
+def test_beam_decoder():
+    """Soft bits recover a word whose misread bit was flagged as uncertain."""
+    beam = make_beam_decoder(width=32)
+    code = "".join(HUFFMAN[c] for c in "hello")
+    for c in code:
+        beam.push(c, 0.99 if c == "1" else 0.01)
+    assert beam.suggestions(1) == ["hello"]
+
+    beam.reset()
+    flip = len(code) // 2
+    for i, c in enumerate(code):
+        if i == flip:
+            c = "1" if c == "0" else "0"
+            beam.push(c, 0.45 if c == "1" else 0.55)  # Barely leaning the wrong way
+        else:
+            beam.push(c)
+    assert binary_to_word(code[:flip] + c + code[flip + 1 :]) != "hello"
+    assert "hello" in beam.suggestions(MAX_CLOSE)
+
+    before = beam.candidates(MAX_CLOSE)
+    beam.push("1")
+    beam.pop()
+    assert beam.candidates(MAX_CLOSE) == before and len(beam) == len(code)
+
+
+def test_adaptive_codebook(tmp_path: Path):
+    """A user typing unusual words gets a shorter code for them, swapped whole."""
+    history = tmp_path / "history.json"
+    adaptive = AdaptiveCodebook(history, check_every=10)
+    static = adaptive.current
+    assert static.codes == HUFFMAN
+
+    for _ in range(100):
+        adaptive.observe("jazz")
+    adaptive.wait()
+    book = adaptive.current
+    assert book is not static
+    assert len(book.codes["z"]) < len(HUFFMAN["z"])
+    assert expected_length(book.codes, adaptive.counts()) < expected_length(
+        HUFFMAN, adaptive.counts()
+    )
+
+    decoder = book.decoder()
+    decoder.feed("".join(book.codes[c] for c in "jazz"))
+    assert decoder.word == "jazz" and decoder.is_word
+    i = FREQ_WORDS.index("the")
+    assert book.freq_lengths[i] == sum(len(book.codes[c]) for c in "the")
+
+    # Counts carry over: a new session starts rebuilding straight away
+    assert AdaptiveCodebook(history)._pending is not None
+
+
+def test_word_codebook():
+    """Word symbols shorten common words, and every word can still be spelled."""
+    freqs = word_frequencies(FREQ_WORDS, 64)
+    root, _ = build_huffman_tree(freqs, top_k=len(freqs))
+    trie = HuffmanTrie(tree_codes(root))
+
+    assert trie.segment("the") == ["the"]
+    assert "".join(trie.segment("zyzzyva")) == "zyzzyva"
+    for word in random.Random(0).sample(FREQ_WORDS, 200):
+        assert len(trie.encode(word)) <= sum(len(trie.codes[c]) for c in word)
+
+    decoder = HuffmanDecoder(trie, WORDS)
+    decoder.feed(trie.encode("they"))
+    assert decoder.word == "they" and decoder.is_word
+
+    code, text = pad_coding("the", trie)
+    assert code == trie.codes["the"] and len(text) == len(code)
+    assert pad_coding("hello") == (
+        "".join(HUFFMAN[c] for c in "hello"),
+        "".join(c.rjust(len(HUFFMAN[c])) for c in "hello"),
+    )
+
+
+def test_beam_keeps_exact_words():
+    """With a beam decoder, bits spelling a dictionary word exactly complete and
+    accept that word, in the word codebook too."""
+    book = word_codebook()
+    autocorrect = AutocorrectEngine()
+    autocorrect.use_codebook(book)
+    decoder = book.decoder()
+    beam = make_beam_decoder(16)
+    beam.trie = book.trie
+
+    bits, event = "", None
+    for c in book.trie.encode("hello"):
+        bit = StateBit.RIGHT_CLENCH if c == "1" else StateBit.LEFT_CLENCH
+        bits, event = asyncio.run(handle(bit, bits, autocorrect, decoder, beam))
+    assert event.complete_word == "hello" and event.is_word
+
+    _, event = asyncio.run(handle(StateBit.NOD, bits, autocorrect, decoder, beam))
+    assert event.accepted == "hello"
+
+
+def test_huffman_code_lengths():
+    """Treeless code lengths are optimal: as short on average as the tree's."""
+    rng = random.Random(0)
+    assert huffman_code_lengths([1.0, 2.0]) == [1, 1]
+
+    for _ in range(200):
+        n = rng.randint(2, 40)
+        freq = {chr(97 + i): rng.choice([rng.random(), 1.0]) for i in range(n)}
+        k = rng.randint(1, n)
+        lengths = code_lengths(freq, k)
+        assert sum(2.0**-l for l in lengths.values()) == 1  # Complete code
+
+        root, _ = build_huffman_tree(freq, top_k=k)
+        codes = tree_codes(root)
+        assert set(codes) == set(lengths)
+        weights = dict(freq, **{" ": max(freq.values()) + 1})
+        assert np.isclose(
+            sum(lengths[c] * weights[c] for c in codes),
+            sum(len(codes[c]) * weights[c] for c in codes),
+        )
+
+
+def test_corpus_pipeline(tmp_path: Path):
+    """Chunked parallel passes match a plain pass over the whole list."""
+    rng = random.Random(0)
+    words = [
+        "".join(rng.choices("abcxyz\u00e9-", k=rng.randint(1, 9))) for _ in range(3000)
+    ]
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(words) + "\n", encoding="utf-8")
+
+    assert "".join(read_chunks(path, 97)) == path.read_text(encoding="utf-8")
+    assert all(chunk.endswith("\n") for chunk in read_chunks(path, 97))
+
+    expected = Counter(c for w in words for c in w if c.isalpha())
+    assert analyze_frequencies(path, processes=2) == expected
+
+    out = tmp_path / "restricted.txt"
+    allowed = [("a", 1), ("b", 1), ("c", 1), ("\u00e9", 1)]
+    assert restrict_dictionary(path, allowed, out, processes=2) == len(
+        [w for w in words if set(w) <= set("abc\u00e9")]
+    )
+    assert out.read_text(encoding="utf-8").splitlines() == [
+        w for w in words if set(w) <= set("abc\u00e9")
+    ]
+
+
+def test_codebook_optimizer():
+    """Vectorized scores equal the bits of actually encoding the corpus."""
+    words = FREQ_WORDS[:500]
+    corpus = Corpus.from_words(words, [1 / r for r in range(1, len(words) + 1)])
+    candidates = candidate_grid(corpus, 1, enter_rate=0.05)
+    bits, _, coverage = score(corpus, candidates, enter_rate=0.05, miss_bits=40)
+
+    for j in random.Random(0).sample(range(len(candidates)), 10):
+        freqs = symbol_freqs(corpus, candidates[j])
+        tree, _ = build_huffman_tree(freqs, top_k=len(freqs), space=False)
+        codes = tree_codes(tree)
+        typable = [all(c in codes for c in w) for w in words]
+        assert np.isclose(coverage[j], corpus.probs[typable].sum())
+
+        # Separator and Enter at their true rates, whatever the tree weights
+        separator = len(codes[" "]) + 0.05 * len(codes[">"])
+        expected = sum(
+            p * (sum(len(codes[c]) for c in w) + separator) if ok else p * 40
+            for w, p, ok in zip(words, corpus.probs, typable)
+        )
+        assert np.isclose(bits[j], expected)
+
+    # Every candidate keeps the separator and Enter, at a range of weights
+    assert all({" ", ">"} <= set(symbol_freqs(corpus, c)) for c in candidates)
+    assert len({(c.space_weight, c.enter_weight) for c in candidates}) > 1
+
+    # Coverage is a cost: free misses favour the smallest alphabet, dear ones
+    # the full one
+    cheap, _, _ = score(corpus, candidates, enter_rate=0.05, miss_bits=0)
+    dear, _, _ = score(corpus, candidates, enter_rate=0.05, miss_bits=1000)
+    assert candidates[np.argmin(cheap)].k == 1
+    assert candidates[np.argmin(dear)].k == len(corpus.chars)
+
+
+def test_codec():
+    """Batch coding agrees with word-by-word coding, for both codebooks."""
+    words = FREQ_WORDS[:2000] + ["", "zyzzyva"]
+    codec = HuffmanCodec(HuffmanTrie(HUFFMAN))
+    blocks, lengths = codec.encode(words)
+    bits = codec.encode_bits(words)
+    assert bits == ["".join(HUFFMAN[c] for c in w) for w in words]
+    assert all(unpack_bits(b, n) == s for b, n, s in zip(blocks, lengths, bits))
+    assert codec.decode(blocks, lengths) == words
+
+    packed, packed_lengths = codec.pack(bits)
+    assert np.array_equal(packed, blocks) and np.array_equal(packed_lengths, lengths)
+    truncated = [s[:-1] for s in bits[:50]]
+    decoders = [make_decoder() for _ in truncated]
+    for decoder, s in zip(decoders, truncated):
+        decoder.feed(s)
+    assert codec.decode(*codec.pack(truncated)) == [d.word for d in decoders]
+
+    freqs = word_frequencies(FREQ_WORDS, 64)
+    root, _ = build_huffman_tree(freqs, top_k=len(freqs))
+    trie = HuffmanTrie(tree_codes(root))
+    codec = HuffmanCodec(trie)
+    assert codec.encode_bits(words) == [trie.encode(w) for w in words]
+    assert codec.decode(*codec.encode(words)) == words
+
+
 def test_hardcoded_regressions():
     # max_code_len = #max(len(code) for code in HUFFMAN_INV)
 
@@ -2,66 +2,71 @@ from textual.app import App
 from textual.widgets import Input, Label
 from textual.containers import Container
 from textual.validation import ValidationResult, Validator
-from queue import PriorityQueue
 from app.keyboard.utils import (
-    binary_edit_distance,
     pad_coding,
     binary_to_word,
-    BinaryEditDistanceStream,
 )
-from app.keyboard.constants import HUFFMAN, FREQ_WORDS
+from app.keyboard.constants import HUFFMAN
+from app.keyboard.decoder import HuffmanDecoder
+from app.keyboard.vector_engine import (
+    LevenshteinLanes,
+    LevenshteinScorer,
+    RankedEngine,
+    freq_scorer,
+)
 from dataclasses import dataclass, field
-import asyncio
+from typing import TYPE_CHECKING, Optional
 
-K = 1  # Number of suggestions to show
+if TYPE_CHECKING:
+    from app.keyboard.adaptive import Codebook
 
 
 @dataclass
-class AutocorrectEngine:
-    """Maintains streaming edit distance state for word suggestions."""
+class AutocorrectEngine(RankedEngine):
+    """Suggests frequent words by Levenshtein distance from the typed bits.
+
+    The per-session state is a LevenshteinLanes: each new bit advances every
+    word's DP column by one step, backspace restores the previous columns, and
+    words further than max_distance are pruned as the bits rule them out, so they
+    cost nothing more until backspaced to. The rest rank by distance and the word
+    priors.
+    """
 
-    word_streams: dict[str, BinaryEditDistanceStream] = field(default_factory=dict)
+    max_distance: int = 6
+    scorer: LevenshteinScorer = field(default_factory=freq_scorer)
 
     def __post_init__(self):
-        for word in FREQ_WORDS:
-            code = "".join(HUFFMAN[c] for c in word)
-            self.word_streams[word] = BinaryEditDistanceStream(code)
+        self.lanes: LevenshteinLanes = self.scorer.start(self.max_distance)
 
-    async def get_suggestions(self, binary: str, threshold: int = 2) -> list[str]:
-        """Get suggestions with chunked processing."""
-        results = []
-        pq = PriorityQueue()
+    async def get_suggestions(
+        self,
+        binary: str,
+        threshold: int = 2,
+        decoder: Optional[HuffmanDecoder] = None,
+    ) -> list[str]:
+        """Get suggestions for binary, moving the lanes there.
 
-        direct = binary_to_word(binary)
+        Pass the session's decoder, already advanced to binary, to skip re-decoding.
+        """
+        self.lanes.seek(binary)
+
+        direct = decoder.result if decoder is not None else binary_to_word(binary)
         if direct is not None:
+            self.best = direct
             return [direct]
 
-        # Process words in chunks to stay responsive
-        CHUNK_SIZE = 100
-        for i in range(0, len(FREQ_WORDS), CHUNK_SIZE):
-            chunk = FREQ_WORDS[i : i + CHUNK_SIZE]
-            for word in chunk:
-                stream = self.word_streams[word]
-                dist = stream.add(binary[-1]) if binary else 0
-
-                if dist < threshold:
-                    results.append((dist, word))
-                    if len(results) >= 5:
-                        return [word for _, word in sorted(results)]
-                else:
-                    pq.put((dist, word))
+        return self.rank(self.lanes.distances, threshold, self.max_distance)
 
-            await asyncio.sleep(0)
-
-        while len(results) < K and not pq.empty():
-            results.append(pq.get())
-
-        return [word for _, word in sorted(results)]
+    def pop(self) -> None:
+        """Drop the last typed bit (backspace)."""
+        self.lanes.pop()
 
     def reset(self) -> None:
-        for word in FREQ_WORDS:
-            code = "".join(HUFFMAN[c] for c in word)
-            self.word_streams[word] = BinaryEditDistanceStream(code)
+        self.lanes.reset()
+
+    def use_codebook(self, book: "Codebook") -> None:
+        self.scorer = book.scorer
+        self.lanes = self.scorer.start(self.max_distance)
 
 
 class WordValidator(Validator):
@@ -1,15 +1,42 @@
 from typing import Optional
-from app.keyboard.constants import HUFFMAN, HUFFMAN_INV, WORDS
+from app.keyboard.beam import BeamDecoder
+from app.keyboard.constants import (
+    FREQ_LOG_PRIOR,
+    FREQ_WORDS,
+    HUFFMAN_TRIE,
+    WORDS,
+)
+from app.keyboard.decoder import HuffmanDecoder, HuffmanTrie
 
+_decoder = HuffmanDecoder(HUFFMAN_TRIE, WORDS)
 
-def pad_coding(word: str) -> tuple[str, str]:
-    code = ""
-    text = ""
-    for c in word:
-        c_code = HUFFMAN[c]
-        code += c_code
-        text += c.replace(" ", "_").rjust(len(c_code))
-    return code, text
+
+def make_decoder() -> HuffmanDecoder:
+    """Fresh incremental decoder over the loaded codebook, e.g. one per session."""
+    return HuffmanDecoder(HUFFMAN_TRIE, WORDS)
+
+
+def make_beam_decoder(width: int = 16, confidence: float = 0.9) -> BeamDecoder:
+    """Fresh soft-bit decoder over the loaded codebook, ranked by FREQ_WORDS."""
+    log_prior = dict(zip(FREQ_WORDS, FREQ_LOG_PRIOR.tolist()))
+    return BeamDecoder(HUFFMAN_TRIE, WORDS, log_prior, width, confidence)
+
+
+def pad_coding(word: str, trie: HuffmanTrie = HUFFMAN_TRIE) -> tuple[str, str]:
+    """Code for word and its symbols, each right-aligned under its own code.
+
+    Symbols wider than their code (words in a word codebook) are shortened to fit.
+    """
+    codes = []
+    labels = []
+    for symbol in trie.segment(word):
+        s_code = trie.codes[symbol]
+        label = symbol.replace(" ", "_")
+        if len(label) > len(s_code):
+            label = label[: len(s_code) - 1] + "~"
+        codes.append(s_code)
+        labels.append(label.rjust(len(s_code)))
+    return "".join(codes), "".join(labels)
 
 
 def binary_to_word(binary: str) -> Optional[str]:
@@ -21,52 +48,25 @@ def binary_to_word(binary: str) -> Optional[str]:
     - Last typing sequence is longer than longest valid code
 
     If invalid sequence is at end but shorter than max code length,
-    returns the last valid word (to handle incomplete typing)."""
-    word = ""
-    i = 0
-    last_valid_word = ""
-    max_code_len = max(len(code) for code in HUFFMAN_INV)
-
-    while i < len(binary):
-        found_match = False
-        for j in range(i + 1, min(i + max_code_len + 1, len(binary) + 1)):
-            prefix = binary[i:j]
-            if prefix in HUFFMAN_INV:
-                # Before accepting this match, check if remaining sequence is too long
-                remaining_len = len(binary) - j
-                if remaining_len > max_code_len:
-                    return None
-
-                word += HUFFMAN_INV[prefix][0]
-                i = j
-                if word in WORDS:
-                    last_valid_word = word
-                found_match = True
-                break
-            if len(prefix) >= max_code_len:
-                return None
-
-        if not found_match:
-            remaining_len = len(binary) - i
-            if remaining_len > max_code_len:
-                return None
-            return last_valid_word
-
-    return word if word in WORDS else last_valid_word
+    returns the last valid word (to handle incomplete typing).
+
+    Walks HUFFMAN_TRIE and resumes from the previous call when binary only grew,
+    so typing one more bit costs O(1) instead of a full re-decode."""
+    return _decoder.decode(binary)
 
 
 class BinaryEditDistanceStream:
     """Streaming edit distance calculator for binary strings.
 
     Optimized for computing edit distance as characters are added to s1,
-    with a fixed reference string s2.
+    with a fixed reference string s2. Keeps a running count of aligned
+    mismatches, so adding or removing a character only looks at that position.
 
-    Time complexity per character: O(1) amortized
-    Space complexity: O(n/64) where n = len(s2)
+    Time complexity per character: O(1), for both add and pop
+    Space complexity: O(n/64 + len(s1)) where n = len(s2)
     """
 
     def __init__(self, s2: str):
-        self.s2 = s2
         self.n = len(s2)
         self.blocks = (self.n + 63) // 64
 
@@ -76,9 +76,12 @@ class BinaryEditDistanceStream:
             if c == "1":
                 self.pattern2[i // 64] |= 1 << (i % 64)
 
-        # Initialize s1 state
-        self.pattern1 = [0] * self.blocks
+        self._reset_s1()
+
+    def _reset_s1(self) -> None:
         self.s1_len = 0
+        self.mismatches = 0  # Differing bits in the aligned prefix
+        self._added: list[int] = []  # Mismatch contributed by each char of s1
 
     def add(self, c: str) -> int:
         """Process new character and return updated edit distance.
@@ -91,63 +94,43 @@ class BinaryEditDistanceStream:
         """
         assert c in "01"
 
-        # Special case: if s2 is empty, distance is just length of s1
-        if self.n == 0:
-            self.s1_len += 1
-            return self.s1_len
-
-        # Update affected block for new character
-        block_idx = self.s1_len // 64
-        if block_idx < self.blocks:
-            if c == "1":
-                self.pattern1[block_idx] |= 1 << (self.s1_len % 64)
-
+        i = self.s1_len
+        mismatch = 0
+        if i < self.n:
+            bit = (self.pattern2[i // 64] >> (i % 64)) & 1
+            mismatch = bit ^ (c == "1")
+        self.mismatches += mismatch
+        self._added.append(mismatch)
         self.s1_len += 1
 
-        # Calculate Hamming distance for aligned portions
-        distance = 0
-        full_blocks = min(self.s1_len, self.n) // 64
-        remaining_bits = min(self.s1_len, self.n) % 64
-
-        # Full blocks
-        for i in range(full_blocks):
-            diff = self.pattern1[i] ^ self.pattern2[i]
-            distance += bin(diff).count("1")
-
-        # Partial block
-        if remaining_bits > 0:
-            mask = (1 << remaining_bits) - 1
-            diff = (self.pattern1[full_blocks] ^ self.pattern2[full_blocks]) & mask
-            distance += bin(diff).count("1")
+        return self.mismatches + abs(self.n - self.s1_len)
 
-        # Add cost of length difference
-        distance += abs(self.n - self.s1_len)
-
-        return distance
+    def pop(self) -> int:
+        """Remove the last character of s1 (backspace) and return the distance."""
+        if self._added:
+            self.mismatches -= self._added.pop()
+            self.s1_len -= 1
+        return self.mismatches + abs(self.n - self.s1_len)
 
 
 def binary_edit_distance(s1: str, s2: str) -> int:
-    """Calculate edit distance between two binary strings.
-
-    Uses Myers' bit-parallel algorithm for O(n/w) time where:
-    - n is the length of the longer string
-    - w is the machine word size (typically 64)
+    """Calculate mismatch distance between two binary strings.
 
-    Time complexity: O(n/64) for strings <= 64 bits
-                    O(nm/64) for longer strings where m = min(len(s1), len(s2))
-    Space complexity: O(1) for strings <= 64 bits
-                     O(m) for longer strings
+    Counts differing bits over the common prefix (Hamming distance) plus the
+    length difference, in O(n/64) with 64-bit blocks. This upper-bounds the true
+    edit distance but is not it: a dropped or doubled bit shifts every later bit.
+    See levenshtein_distance for that.
 
     Args:
         s1: First binary string containing only '0' and '1'
         s2: Second binary string containing only '0' and '1'
 
     Returns:
-        Minimum edit distance between strings
+        Differing aligned bits plus length difference
 
     Example:
-        >>> binary_levenshtein_distance("1100", "1010")
-        2  # 1100 → 1110 → 1010
+        >>> binary_edit_distance("1100", "1010")
+        2
     """
     # Ensure s1 is shorter for optimization
     if len(s1) > len(s2):
@@ -179,3 +162,149 @@ def binary_edit_distance(s1: str, s2: str) -> int:
     distance += abs(n - m)
 
     return distance
+
+
+class LevenshteinStream:
+    """Streaming Levenshtein distance to a fixed binary string s2.
+
+    Myers' bit-parallel algorithm (in Hyyrö's formulation for whole-string
+    distance): the DP column over s2 is kept as vertical +1/-1 delta bit-vectors
+    VP/VN packed into ints, so each added char of s1 costs O(len(s2)/64) big-int
+    operations. Every add saves the column so pop() undoes it in O(1).
+
+    With max_distance set, once every cell of the column exceeds it no extension
+    of s1 can come back within it (column minima never decrease), so the stream
+    is dropped and add returns None from then on. The minimum also rises by at
+    most 1 per char, so the column is only rescanned once it could exceed the band.
+    """
+
+    def __init__(self, s2: str, max_distance: Optional[int] = None):
+        assert all(c in "01" for c in s2)
+        pattern = int(s2[::-1] or "0", 2)
+        self.n = n = len(s2)
+        self.max_distance = max_distance
+        self._full = (1 << n) - 1
+        self._high = 1 << (n - 1) if n else 0
+        self._peq = {"1": pattern & self._full, "0": ~pattern & self._full}
+
+        # Column for empty s1: D[i][0] = i, all vertical deltas +1
+        self.vp = self._full
+        self.vn = 0
+        self.distance = n
+        self.pruned = False
+        self.s1_len = 0
+        self._next_scan = 0  # s1_len at which the column min could leave the band
+        self._history: list[tuple[int, int, int, bool, int]] = []
+
+    def add(self, c: str) -> Optional[int]:
+        """Append c to s1, returning the distance or None once out of band."""
+        assert c in "01"
+        self._history.append(
+            (self.vp, self.vn, self.distance, self.pruned, self._next_scan)
+        )
+        self.s1_len += 1
+        if self.pruned:
+            return None
+        if self.n == 0:
+            self.distance += 1
+            return self._check_band()
+
+        vp, vn, full = self.vp, self.vn, self._full
+        eq = self._peq[c]
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & full)
+        mh = vp & xh
+        if ph & self._high:
+            self.distance += 1
+        elif mh & self._high:
+            self.distance -= 1
+        ph = ((ph << 1) | 1) & full  # Top row D[0][j] = j grows by 1
+        mh = (mh << 1) & full
+        self.vp = mh | (~(xv | ph) & full)
+        self.vn = ph & xv
+        return self._check_band()
+
+    def pop(self) -> Optional[int]:
+        """Remove the last char of s1 (backspace) and return the restored distance."""
+        if self._history:
+            (
+                self.vp,
+                self.vn,
+                self.distance,
+                self.pruned,
+                self._next_scan,
+            ) = self._history.pop()
+            self.s1_len -= 1
+        return None if self.pruned else self.distance
+
+    def reset(self) -> None:
+        """Clear s1 (word accepted), restoring the column saved by the first add."""
+        if self._history:
+            (
+                self.vp,
+                self.vn,
+                self.distance,
+                self.pruned,
+                self._next_scan,
+            ) = self._history[0]
+            self._history.clear()
+            self.s1_len = 0
+
+    def column_min(self) -> int:
+        """Smallest D[i][len(s1)] over all prefixes of s2."""
+        best = value = self.s1_len  # D[0][j] = j
+        vp, vn = self.vp, self.vn
+        for _ in range(self.n):
+            value += (vp & 1) - (vn & 1)
+            best = min(best, value)
+            vp >>= 1
+            vn >>= 1
+        return best
+
+    def _check_band(self) -> Optional[int]:
+        if self.max_distance is None or self.distance <= self.max_distance:
+            return self.distance
+        # Only scan the column when the final row is already out of band
+        if self.s1_len < self._next_scan:
+            return self.distance
+        lowest = self.column_min()
+        if lowest > self.max_distance:
+            self.pruned = True
+            return None
+        self._next_scan = self.s1_len + self.max_distance - lowest + 1
+        return self.distance
+
+
+def levenshtein_distance(
+    s1: str, s2: str, max_distance: Optional[int] = None
+) -> Optional[int]:
+    """Edit distance between binary strings by Myers' bit-parallel algorithm.
+
+    Time complexity: O(len(s1) * len(s2)/64)
+
+    Args:
+        s1: First binary string containing only '0' and '1'
+        s2: Second binary string containing only '0' and '1'
+        max_distance: If set, give up as soon as the distance must exceed it
+
+    Returns:
+        Minimum number of bit insertions, deletions and flips, or None if that
+        exceeds max_distance
+
+    Example:
+        >>> levenshtein_distance("10" * 32, "01" * 32)
+        2  # drop the leading 1, append a 1
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1  # Fewer columns, wider bit-vectors
+
+    stream = LevenshteinStream(s2, max_distance)
+    distance: Optional[int] = len(s2)
+    for c in s1:
+        distance = stream.add(c)
+        if distance is None:
+            return None
+    if max_distance is not None and distance > max_distance:
+        return None
+    return distance
@@ -0,0 +1,440 @@
+import dataclasses
+import os
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+from app.keyboard.constants import (
+    FREQ_CODE_BLOCKS,
+    FREQ_CODE_LENGTHS,
+    FREQ_LOG_PRIOR,
+    FREQ_WORDS,
+)
+from app.keyboard.decoder import HuffmanDecoder
+from app.keyboard.priors import SuggestionPriors
+from app.keyboard.utils import LevenshteinStream, binary_to_word
+
+if TYPE_CHECKING:
+    from app.keyboard.adaptive import Codebook
+
+K = 1  # Number of suggestions to show when none is under threshold
+MAX_CLOSE = 5  # Most suggestions under threshold to show
+
+_POPCOUNT_8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+_ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+_ONE = np.uint64(1)
+
+
+def popcount(x: np.ndarray) -> np.ndarray:
+    """Set bits per uint64 element."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(x)
+    as_bytes = np.ascontiguousarray(x).view(np.uint8)
+    return _POPCOUNT_8[as_bytes].reshape(*x.shape, 8).sum(axis=-1)
+
+
+def pack_bits(binary: str, n_blocks: int) -> np.ndarray:
+    """Pack a binary string like FREQ_CODE_BLOCKS rows, dropping bits past the end."""
+    value = int(binary[: 64 * n_blocks][::-1] or "0", 2)  # First bit lowest
+    return np.array(
+        [(value >> (64 * b)) & 0xFFFFFFFFFFFFFFFF for b in range(n_blocks)],
+        dtype=np.uint64,
+    )
+
+
+def unpack_bits(blocks: np.ndarray, n: int) -> str:
+    """Inverse of pack_bits for one row of n bits."""
+    value = sum(int(b) << (64 * i) for i, b in enumerate(blocks))
+    return "".join(str(value >> i & 1) for i in range(n))
+
+
+@dataclass
+class SuggestionCursor:
+    """Bits typed for the current word: their count and value, first bit lowest.
+
+    push (new bit), pop (backspace) and reset (word accepted) are O(1).
+    """
+
+    length: int = 0
+    prefix: int = 0
+
+    @property
+    def bits(self) -> str:
+        return "".join(str(self.prefix >> i & 1) for i in range(self.length))
+
+    def push(self, c: str) -> None:
+        assert c in "01"
+        self.prefix |= (c == "1") << self.length
+        self.length += 1
+
+    def pop(self) -> None:
+        if self.length:
+            self.length -= 1
+            self.prefix &= (1 << self.length) - 1
+
+    def reset(self) -> None:
+        self.length = 0
+        self.prefix = 0
+
+
+class LevenshteinScorer:
+    """levenshtein_distance(bits, code) for every packed code at once.
+
+    Runs LevenshteinStream's bit-parallel update with one uint64 lane per code, so
+    each typed bit is a dozen numpy passes over all codes. The rare codes over 64
+    bits (and any empty one) fall back to a LevenshteinStream each. The tables
+    here are shared; each session advances its own LevenshteinLanes from start().
+    """
+
+    def __init__(self, codes: np.ndarray, lengths: np.ndarray):
+        self.lengths = lengths.astype(np.int64)
+        width = np.minimum(self.lengths, 64).astype(np.uint64)
+        self._full = np.where(
+            width >= 64, _ALL_ONES, (_ONE << np.minimum(width, 63)) - _ONE
+        )
+        self._high = np.maximum(width, _ONE) - _ONE  # Shift to the last row's bit
+        self._peq = (~codes[:, 0] & self._full, codes[:, 0] & self._full)
+        self._packed = np.flatnonzero((self.lengths > 0) & (self.lengths <= 64))
+        self._unpacked = {
+            int(i): unpack_bits(codes[i], int(self.lengths[i]))
+            for i in np.flatnonzero((self.lengths == 0) | (self.lengths > 64))
+        }
+
+    def start(self, max_distance: Optional[int] = None) -> "LevenshteinLanes":
+        return LevenshteinLanes(self, max_distance)
+
+
+def _byte_steps() -> tuple[np.ndarray, np.ndarray]:
+    """Net vertical delta and lowest running delta of 8 rows, indexed by the
+    VP byte << 8 | VN byte."""
+    rows = np.arange(8)
+    vp = np.arange(256)[:, None, None] >> rows & 1
+    vn = np.arange(256)[None, :, None] >> rows & 1
+    running = np.cumsum(vp - vn, axis=-1)
+    lowest = np.minimum(running.min(axis=-1), 0)
+    return running[..., -1].ravel(), lowest.ravel()
+
+
+_BYTE_SUM, _BYTE_MIN = _byte_steps()
+_BYTE = np.uint64(0xFF)
+
+
+def column_min(vp: np.ndarray, vn: np.ndarray, top: int) -> np.ndarray:
+    """Smallest cell of each lane's DP column, as LevenshteinStream.column_min.
+
+    Walks the VP/VN deltas a byte at a time from the top row's value.
+    """
+    value = np.zeros(len(vp), dtype=np.int64)
+    lowest = np.zeros(len(vp), dtype=np.int64)
+    for shift in range(0, 64, 8):
+        shift = np.uint64(shift)
+        i = ((vp >> shift & _BYTE) << np.uint64(8) | vn >> shift & _BYTE).astype(
+            np.intp
+        )
+        lowest = np.minimum(lowest, value + _BYTE_MIN[i])
+        value += _BYTE_SUM[i]
+    return top + lowest
+
+
+@dataclass(frozen=True)
+class _Band:
+    """Columns of the lanes still within max_distance, and their code tables."""
+
+    lanes: np.ndarray  # Code index of each lane
+    full: np.ndarray
+    high: np.ndarray
+    peq: tuple[np.ndarray, np.ndarray]
+    vp: np.ndarray
+    vn: np.ndarray
+    distance: np.ndarray
+    next_scan: np.ndarray  # Bits typed when the column min could leave the band
+
+    def take(self, keep: np.ndarray) -> "_Band":
+        return _Band(
+            self.lanes[keep],
+            self.full[keep],
+            self.high[keep],
+            (self.peq[0][keep], self.peq[1][keep]),
+            self.vp[keep],
+            self.vn[keep],
+            self.distance[keep],
+            self.next_scan[keep],
+        )
+
+
+class LevenshteinLanes:
+    """One session's LevenshteinScorer columns, carried from bit to bit.
+
+    A typed bit costs one update of each lane's VP/VN, and backspace restores
+    the columns saved by the last push. With max_distance set, lanes are pruned
+    as LevenshteinStream does: once a lane's distance is past it, its column
+    minimum is checked (no sooner than it could have risen that far), and when
+    that is past it too no later bit can bring the word back, so the lane is
+    dropped until popped. Dropped lanes read max_distance + 1.
+    """
+
+    def __init__(self, scorer: LevenshteinScorer, max_distance: Optional[int] = None):
+        self.scorer = scorer
+        self.max_distance = max_distance
+        self.cursor = SuggestionCursor()
+        lanes = scorer._packed
+        zeros = np.zeros(len(lanes), dtype=np.int64)
+        self._band = _Band(
+            lanes,
+            scorer._full[lanes],
+            scorer._high[lanes],
+            (scorer._peq[0][lanes], scorer._peq[1][lanes]),
+            scorer._full[lanes],  # Column for no bits: all vertical deltas +1
+            np.zeros(len(lanes), dtype=np.uint64),
+            scorer.lengths[lanes],
+            zeros,
+        )
+        self._history: list[_Band] = []
+        self._streams = {
+            i: LevenshteinStream(code, max_distance)
+            for i, code in scorer._unpacked.items()
+        }
+
+    @property
+    def distances(self) -> np.ndarray:
+        far = self.max_distance + 1 if self.max_distance is not None else 0
+        distance = np.full(len(self.scorer.lengths), far, dtype=np.int64)
+        distance[self._band.lanes] = self._band.distance
+        for i, stream in self._streams.items():
+            if not stream.pruned:
+                distance[i] = stream.distance
+        return distance
+
+    def push(self, c: str) -> None:
+        self.cursor.push(c)
+        band = self._band
+        full, high, vp, vn = band.full, band.high, band.vp, band.vn
+        eq = band.peq[c == "1"]
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq  # Carries past 64 bits drop garbage
+        ph = vn | (~(xh | vp) & full)
+        mh = vp & xh
+        distance = band.distance + ((ph >> high) & _ONE).view(np.int64)
+        distance -= ((mh >> high) & _ONE).view(np.int64)
+        ph = ((ph << _ONE) | _ONE) & full
+        mh = (mh << _ONE) & full
+        vp = mh | (~(xv | ph) & full)
+        vn = ph & xv
+
+        self._history.append(band)
+        self._band = self._prune(
+            _Band(band.lanes, full, high, band.peq, vp, vn, distance, band.next_scan)
+        )
+        for stream in self._streams.values():
+            stream.add(c)
+
+    def _prune(self, band: _Band) -> _Band:
+        if self.max_distance is None:
+            return band
+        typed = self.cursor.length
+        (due,) = np.nonzero(
+            (band.distance > self.max_distance) & (band.next_scan <= typed)
+        )
+        if not len(due):
+            return band
+        lowest = column_min(band.vp[due], band.vn[due], typed)
+        next_scan = band.next_scan.copy()
+        next_scan[due] = typed + self.max_distance - lowest + 1
+        band = dataclasses.replace(band, next_scan=next_scan)
+        out = due[lowest > self.max_distance]
+        if not len(out):
+            return band
+        keep = np.ones(len(band.lanes), dtype=bool)
+        keep[out] = False
+        return band.take(keep)
+
+    def pop(self) -> None:
+        """Drop the last typed bit (backspace)."""
+        if self._history:
+            self._band = self._history.pop()
+            self.cursor.pop()
+            for stream in self._streams.values():
+                stream.pop()
+
+    def reset(self) -> None:
+        """Clear the typed bits (word accepted), back to the columns for none."""
+        if self._history:
+            self._band = self._history[0]
+            self._history.clear()
+        self.cursor.reset()
+        for stream in self._streams.values():
+            stream.reset()
+
+    def seek(self, binary: str) -> None:
+        """Move to binary, keeping the columns of the prefix it shares."""
+        typed = self.cursor.bits
+        common = len(os.path.commonprefix([typed, binary]))
+        for _ in range(len(typed) - common):
+            self.pop()
+        for c in binary[common:]:
+            self.push(c)
+
+
+@lru_cache(maxsize=None)
+def freq_scorer() -> LevenshteinScorer:
+    """Scorer of the compiled FREQ_WORDS codes, shared by every session."""
+    return LevenshteinScorer(FREQ_CODE_BLOCKS, FREQ_CODE_LENGTHS)
+
+
+def top_k(keys: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k smallest keys, smallest first.
+
+    Partitions in O(len(keys)) and only sorts the k survivors.
+    """
+    if k < len(keys):
+        idx = np.argpartition(keys, k - 1)[:k]
+    else:
+        idx = np.arange(len(keys))
+    return idx[np.argsort(keys[idx], kind="stable")]
+
+
+def rank_suggestions(
+    dist: np.ndarray,
+    threshold: int,
+    max_distance: Optional[int] = None,
+    scores: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """Indices of the words to suggest, best first.
+
+    Up to MAX_CLOSE words under threshold, else the K closest (within
+    max_distance, if given). Ranked by scores when given (lower is better, see
+    SuggestionPriors), else by distance then frequency rank: rows are in
+    FREQ_WORDS order, so the row index is the rank and both fold into one key.
+    """
+    keys = dist * len(dist) + np.arange(len(dist)) if scores is None else scores
+    close = np.flatnonzero(dist < threshold)
+    if close.size:
+        return close[top_k(keys[close], MAX_CLOSE)]
+    if max_distance is None:
+        return top_k(keys, K)
+    in_band = np.flatnonzero(dist <= max_distance)
+    return in_band[top_k(keys[in_band], K)]
+
+
+def default_priors() -> SuggestionPriors:
+    return SuggestionPriors(FREQ_WORDS, FREQ_LOG_PRIOR)
+
+
+@dataclass
+class RankedEngine(ABC):
+    """Prior-weighted ranking and word acceptance shared by the engines.
+
+    priors rows must line up with the engine's words. best is the top suggestion
+    last shown, which accept takes as the word when none is given.
+    """
+
+    priors: SuggestionPriors = field(default_factory=default_priors)
+    best: Optional[str] = None
+
+    def rank(
+        self,
+        dist: np.ndarray,
+        threshold: int,
+        max_distance: Optional[int] = None,
+    ) -> list[str]:
+        ranked = rank_suggestions(
+            dist, threshold, max_distance, self.priors.scores(dist)
+        )
+        suggestions = [self.priors.words[i] for i in ranked]
+        self.best = suggestions[0] if suggestions else None
+        return suggestions
+
+    def accept(self, word: Optional[str] = None) -> Optional[str]:
+        """Finish the current word (NOD), conditioning the next on it."""
+        word = word if word is not None else self.best
+        if word:
+            self.priors.observe(word)
+        self.best = None
+        self.reset()
+        return word
+
+    @abstractmethod
+    async def get_suggestions(
+        self,
+        binary: str,
+        threshold: int = 2,
+        decoder: Optional[HuffmanDecoder] = None,
+    ) -> list[str]:
+        """Suggestions for the bits typed so far, best first."""
+
+    @abstractmethod
+    def pop(self) -> None:
+        """Drop the last typed bit (backspace)."""
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Drop the current word's state."""
+
+    @abstractmethod
+    def use_codebook(self, book: "Codebook") -> None:
+        """Score against book's codes from now on; call between words."""
+
+
+@dataclass
+class VectorAutocorrectEngine(RankedEngine):
+    """Scores every frequency word per bit with one XOR/popcount over a bit matrix.
+
+    Drop-in for AutocorrectEngine with the same get_suggestions API, scoring by
+    the aligned mismatch distance of binary_edit_distance. No per-word objects, so
+    per-bit cost is a handful of numpy passes however large the vocabulary grows.
+    Ranked by distance and the word priors.
+    """
+
+    words: list[str] = field(default_factory=lambda: FREQ_WORDS)
+    codes: np.ndarray = field(default_factory=lambda: FREQ_CODE_BLOCKS)
+    lengths: np.ndarray = field(default_factory=lambda: FREQ_CODE_LENGTHS)
+
+    def __post_init__(self):
+        assert len(self.priors.words) == len(self.words)
+        self.lengths = self.lengths.astype(np.int64)
+        # Bit offset of each block, to turn overlap lengths into block masks
+        self._block_starts = 64 * np.arange(self.codes.shape[1], dtype=np.int64)
+
+    def distances(self, binary: str) -> np.ndarray:
+        """binary_edit_distance(binary, code) for every word's code."""
+        n = len(binary)
+        typed = pack_bits(binary, self.codes.shape[1])
+
+        # Compare only the overlapping prefix of each code, block by block
+        overlap = np.minimum(self.lengths, n)[:, None] - self._block_starts
+        bits = np.clip(overlap, 0, 64).astype(np.uint64)
+        mask = np.where(
+            bits >= 64,
+            _ALL_ONES,
+            (np.uint64(1) << np.minimum(bits, 63)) - np.uint64(1),
+        )
+
+        mismatches = popcount((self.codes ^ typed) & mask).sum(axis=1, dtype=np.int64)
+        return mismatches + np.abs(self.lengths - n)
+
+    async def get_suggestions(
+        self,
+        binary: str,
+        threshold: int = 2,
+        decoder: Optional[HuffmanDecoder] = None,
+    ) -> list[str]:
+        """Suggestions under threshold (closest first), else the K closest."""
+        direct = decoder.result if decoder is not None else binary_to_word(binary)
+        if direct is not None:
+            self.best = direct
+            return [direct]
+
+        return self.rank(self.distances(binary), threshold)
+
+    def use_codebook(self, book: "Codebook") -> None:
+        self.codes, self.lengths = book.freq_blocks, book.freq_lengths
+        self.__post_init__()
+
+    def pop(self) -> None:
+        """No per-word state to rewind; kept for AutocorrectEngine parity."""
+
+    def reset(self) -> None:
+        """No per-word state to rebuild; kept for AutocorrectEngine parity."""
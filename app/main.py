@@ -1,7 +1,8 @@
 from typing import Literal
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import RedirectResponse
+from fastapi.responses import FileResponse, RedirectResponse
+from fastapi.staticfiles import StaticFiles
 from textual.app import App
 from textual.widgets import Static
 from textual.reactive import reactive
@@ -10,6 +11,9 @@ from textual.containers import Container, Vertical
 from app.models import BitEvent, WordEvent
 from app.api.ws_handler import WebSocketHandler
 from app.config.settings import settings
+from app.keyboard.constants import HUFFMAN_TRIE
+from app.keyboard.decoder import HuffmanTrie
+from app.keyboard.huffman import WEB_DIR
 from app.keyboard.utils import binary_to_word, pad_coding
 from app.services.eleven import TTSService, EEGData
 from app.services.luma import ImageService
@@ -50,6 +54,7 @@ class MessageDisplay(App):
     suggestions = reactive([])
     complete_word = reactive(None)
     current_image = reactive(None)
+    trie: HuffmanTrie = HUFFMAN_TRIE  # The session's codebook, for pad_coding
 
     def compose(self):
         """Create and yield widgets for the app."""
@@ -66,7 +71,7 @@ class MessageDisplay(App):
             return
 
         if self.complete_word:
-            code, text = pad_coding(self.complete_word)
+            code, text = pad_coding(self.complete_word, self.trie)
             display = f"Bits: {bits}\nWord: {self.complete_word}\n{code}\n{text}"
         else:
             display = f"Bits: {bits}"
@@ -154,6 +159,8 @@ class BridgedWebSocketHandler(WebSocketHandler):
         if event_type == "bit" and bridge["app"] and response:
             word_event = WordEvent(**response)
             app = bridge["app"]
+            if self.codebook is not None:
+                app.trie = self.codebook.trie
             app.current_bits = word_event.bits
             app.suggestions = word_event.suggestions
             app.complete_word = word_event.complete_word
@@ -190,6 +197,18 @@ async def websocket_endpoint(websocket: WebSocket):
     await ws_handler.handle_connection(websocket)
 
 
+@app.get("/huffmanTree.js")
+async def huffman_tree():
+    """Web tree constant of the codebook sessions start with."""
+    if settings.codebook == "word":
+        return FileResponse(WEB_DIR / "huffmanWordTreeConstant.js")
+    return FileResponse(WEB_DIR / "huffmanTreeConstant.js")
+
+
+# Last, so the routes above take precedence over files of the same name
+app.mount("/", StaticFiles(directory=WEB_DIR, html=True), name="web")
+
+
 async def run_server():
     """Run FastAPI server in the background."""
     print("start fastapi")
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 @dataclass
@@ -10,6 +10,7 @@ class GreekWaves:
     alpha: float  # 8-12 Hz
     beta: float  # 12-30 Hz
     gamma: float  # 30-100 Hz
+    valid: bool = True  # False before enough samples for a spectrum, when all 0
 
 
 class StateBit(str, Enum):
@@ -31,6 +32,8 @@ class BitEvent:
     bit: StateBit
     greeks: GreekWaves
     raw_data: List[float]
+    likelihood: Optional[float] = None  # Classifier's P(bit is 1), for clenches
+    features: Optional[List[float]] = None  # Of the window, see FeatureExtractor
 
 
 @dataclass
@@ -48,3 +51,7 @@ class WordEvent:
     bits: str
     suggestions: List[str]
     complete_word: Optional[str]
+    decoded: str = ""  # Chars decoded from bits so far
+    is_word: bool = False  # decoded is a dictionary word with no bits pending
+    accepted: Optional[str] = None  # Word accepted by a NOD
+    codes: Optional[Dict[str, str]] = None  # Huffman codes, sent when they change
@@ -1,22 +1,30 @@
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from functools import lru_cache
 
-from app.config.settings import settings
-from app.services.eleven import TTSService
-from app.services.luma import ImageService
+# Imported where used, so the signal processing modules load without the API
+# clients (or their keys) installed
+if TYPE_CHECKING:
+    from app.services.eleven import TTSService
+    from app.services.luma import ImageService
 
 
 @lru_cache
-def get_tts_service() -> Optional[TTSService]:
+def get_tts_service() -> Optional["TTSService"]:
     """Get TTS service singleton if enabled."""
+    from app.config.settings import settings
+    from app.services.eleven import TTSService
+
     if settings.ENABLE_TTS:
         return TTSService()
     return None
 
 
 @lru_cache
-def get_image_service() -> Optional[ImageService]:
+def get_image_service() -> Optional["ImageService"]:
     """Get image service singleton if enabled."""
+    from app.config.settings import settings
+    from app.services.luma import ImageService
+
     if settings.ENABLE_IMAGE_GEN:
         return ImageService()
     return None
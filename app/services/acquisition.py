@@ -0,0 +1,121 @@
+"""Background sample acquisition from a BrainFlow board into a ring buffer.
+
+One thread drains the board every poll seconds into a preallocated (channels, N)
+buffer; readers block on a condition until enough new samples arrived and get
+the latest window as a view, without copying or spinning.
+"""
+
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+
+class SampleRing:
+    """Fixed-size (channels, capacity) history of the newest samples.
+
+    Every sample is written twice, at i and i + capacity of a buffer twice as
+    long, so any window of up to capacity samples is one contiguous slice.
+    Single writer: readers only need the writer's total, never a lock, and a
+    view stays valid until capacity more samples are written.
+    """
+
+    def __init__(self, n_channels: int, capacity: int):
+        self.capacity = capacity
+        self.total = 0  # Samples ever written
+        self._data = np.zeros((n_channels, 2 * capacity))
+
+    def write(self, chunk: np.ndarray) -> None:
+        """Append (channels, n) samples, keeping the newest capacity."""
+        n = chunk.shape[1]
+        if n > self.capacity:
+            self.total += n - self.capacity
+            chunk = chunk[:, -self.capacity :]
+            n = self.capacity
+        start = self.total % self.capacity
+        first = min(n, self.capacity - start)
+        for offset in (0, self.capacity):
+            self._data[:, offset + start : offset + start + first] = chunk[:, :first]
+        self._data[:, : n - first] = chunk[:, first:]
+        self._data[:, self.capacity : self.capacity + n - first] = chunk[:, first:]
+        self.total += n
+
+    def window(self, n: int, end: Optional[int] = None) -> np.ndarray:
+        """View of the n samples before sample number end (default: newest)."""
+        end = self.total if end is None else end
+        assert n <= self.capacity, f"Window of {n} over a ring of {self.capacity}"
+        assert max(0, self.total - self.capacity) <= end - n and end <= self.total
+        stop = (end - 1) % self.capacity + 1 + self.capacity
+        return self._data[:, stop - n : stop]
+
+
+class Acquisition(threading.Thread):
+    """Thread filling a SampleRing from board.get_board_data().
+
+    with Acquisition(board, n_channels, capacity) as acq:
+        while (data := acq.next_window(n, hop)) is not None:
+            ...
+    """
+
+    def __init__(
+        self,
+        board,
+        n_channels: int,
+        capacity: int,
+        poll: float = 0.02,
+        transform: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+    ):
+        super().__init__(name="bci-acquisition", daemon=True)
+        self.board = board
+        self.transform = transform  # Applied once to each chunk, e.g. filters
+        self.ring = SampleRing(n_channels, capacity)
+        self.poll = poll
+        self.cursor = 0  # End of the last window handed out
+        self._new_data = threading.Condition()
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self._stopped.wait(self.poll):
+            chunk = self.board.get_board_data()
+            if chunk.shape[1]:
+                if self.transform:
+                    chunk = self.transform(chunk)
+                with self._new_data:
+                    self.ring.write(chunk)
+                    self._new_data.notify_all()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        with self._new_data:
+            self._new_data.notify_all()
+        if self.is_alive():
+            self.join()
+
+    def __enter__(self) -> "Acquisition":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def wait_for(self, total: int, timeout: Optional[float] = None) -> bool:
+        """Block until total samples were acquired; False if stopped or timed out."""
+        with self._new_data:
+            self._new_data.wait_for(
+                lambda: self.ring.total >= total or self._stopped.is_set(), timeout
+            )
+        return self.ring.total >= total
+
+    def next_window(self, n: int, hop: int) -> Optional[np.ndarray]:
+        """View of the n samples ending hop after the last window, once acquired.
+
+        Windows fall behind the newest samples rather than skipping any, unless the
+        reader lags a whole ring behind; hop=n gives windows without overlap.
+        None once stopped.
+        """
+        if not self.wait_for(max(self.cursor + hop, n)):
+            return None
+        self.cursor = max(
+            self.cursor + hop, n, self.ring.total - self.ring.capacity + n
+        )
+        return self.ring.window(n, self.cursor)
@@ -1,32 +1,82 @@
 from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Optional
 from brainflow.board_shim import BoardShim, BrainFlowInputParams
-from brainflow.data_filter import DataFilter
 import numpy as np
 
 import time
-from app.models import GreekWaves, StateBit, BitEvent
+from app.models import StateBit, BitEvent
 from app.config.settings import settings
-
-
-def get_greek_waves(data: np.ndarray, sampling_rate: int) -> GreekWaves:
-    """Extract frequency band powers from EEG data"""
-    eeg_channels = BoardShim.get_eeg_channels(settings.board_id)
-
-    try:
-        band_powers = DataFilter.get_avg_band_powers(
-            data, eeg_channels, sampling_rate, True
-        )[0]
-    except:
-        # Random fallback values for band powers
-        band_powers = np.random.random(5)
-
-    return GreekWaves(
-        delta=band_powers[0],
-        theta=band_powers[1],
-        alpha=band_powers[2],
-        beta=band_powers[3],
-        gamma=band_powers[4],
-    )
+from app.services.calibration import GESTURES, GestureModel
+from app.services.features import FEATURES, FeatureExtractor
+from app.services.filters import SavitzkyGolay, chain, filter_bank
+from app.services.gestures import Debouncer, RollingRange
+from app.services.spectrum import BandPowers
+
+
+@dataclass(frozen=True)
+class BoardProfile:
+    """Board metadata resolved once per session, off the per-window path."""
+
+    board_id: int
+    sampling_rate: int
+    n_rows: int  # Rows of get_board_data()
+    eeg_channels: np.ndarray
+    accel_channels: np.ndarray
+    # Rows of each gesture's signal, in action_to_state's argument order
+    left: int
+    right: int
+    nod: int
+    shake: int
+
+    @classmethod
+    def load(cls, board_id: int = settings.board_id) -> "BoardProfile":
+        eeg_channels = np.array(BoardShim.get_eeg_channels(board_id))
+        accel_channels = np.array(BoardShim.get_accel_channels(board_id))
+        return cls(
+            board_id=board_id,
+            sampling_rate=BoardShim.get_sampling_rate(board_id),
+            n_rows=BoardShim.get_num_rows(board_id),
+            eeg_channels=eeg_channels,
+            accel_channels=accel_channels,
+            left=int(eeg_channels[settings.left_clench_channel]),
+            right=int(eeg_channels[settings.right_clench_channel]),
+            nod=int(accel_channels[settings.nod_accel_axis]),
+            shake=int(accel_channels[settings.shake_accel_axis]),
+        )
+
+    @property
+    def gesture_rows(self) -> list:
+        return [self.left, self.right, self.nod, self.shake]
+
+    @property
+    def feature_rows(self) -> np.ndarray:
+        return np.concatenate([self.eeg_channels, self.accel_channels])
+
+    def samples(self, seconds: float) -> int:
+        """Samples in a duration, at least one."""
+        return max(1, int(seconds * self.sampling_rate))
+
+
+def eeg_filter(profile: BoardProfile) -> Optional[Callable]:
+    """Streaming EEG filters and smoothing configured in settings, if any"""
+    stages = []
+    if settings.filter_eeg:
+        stages.append(
+            filter_bank(
+                profile.eeg_channels,
+                profile.sampling_rate,
+                settings.bandpass_hz,
+                settings.notch_hz,
+            )
+        )
+    if settings.savgol_window:
+        stages.append(
+            SavitzkyGolay(
+                profile.eeg_channels, settings.savgol_window, settings.savgol_order
+            )
+        )
+    return chain(*stages) if stages else None
 
 
 def action_to_state(
@@ -34,60 +84,134 @@ def action_to_state(
     range_right: float,
     range_accel_nod: float,
     range_accel_shake: float,
-    last_bit: StateBit,
 ) -> StateBit:
     """Detect movement type based on sensor ranges"""
-    if last_bit == StateBit.NOTHING:
-        if (
-            range_accel_nod > range_accel_shake
-            and range_accel_nod > settings.accel_pitch_thres
-        ):
-            return StateBit.NOD
-        elif (
-            range_accel_shake > range_accel_nod
-            and range_accel_shake > settings.accel_roll_thres
-        ):
-            return StateBit.SHAKE
-        elif range_left > range_right / 2 and range_left > settings.left_clench_thres:
-            return StateBit.LEFT_CLENCH
-        elif range_right > range_left and range_right > settings.right_clench_thres:
-            return StateBit.RIGHT_CLENCH
+    if (
+        range_accel_nod > range_accel_shake
+        and range_accel_nod > settings.accel_pitch_thres
+    ):
+        return StateBit.NOD
+    elif (
+        range_accel_shake > range_accel_nod
+        and range_accel_shake > settings.accel_roll_thres
+    ):
+        return StateBit.SHAKE
+    elif range_left > range_right / 2 and range_left > settings.left_clench_thres:
+        return StateBit.LEFT_CLENCH
+    elif range_right > range_left and range_right > settings.right_clench_thres:
+        return StateBit.RIGHT_CLENCH
     return StateBit.NOTHING
 
 
+def right_clench_likelihood(range_left: float, range_right: float) -> float:
+    """P(the clench was on the right) from the clench ranges, 0.5 on the
+    boundary action_to_state draws between them.
+
+    action_to_state calls a clench left while range_left > range_right / 2, i.e.
+    while the right side has under 2/3 of the activity, so the right share is
+    rescaled piecewise linearly to map 2/3 to 0.5.
+    """
+    share = range_right / (range_left + range_right)
+    if share < 2 / 3:
+        return 0.75 * share
+    return 0.5 + 1.5 * (share - 2 / 3)
+
+
+class GestureClassifier:
+    """Debounced gestures over a window sliding along the sample stream.
+
+    Peak-to-peak ranges of the clench and accelerometer rows are kept up to date
+    sample by sample, so each hop only processes the samples it added. With a
+    calibrated model, windows are classified from their features instead.
+    """
+
+    def __init__(
+        self,
+        profile: BoardProfile,
+        window: int,
+        hold: int,
+        refractory: int,
+        model: Optional[GestureModel] = None,
+    ):
+        self.profile = profile
+        self.model = model
+        self.probabilities: Optional[np.ndarray] = None  # Model's, last window
+        self.window = window
+        self.rows = profile.gesture_rows
+        self.ranges = RollingRange(len(self.rows), window)
+        self.debouncer = Debouncer(hold, refractory)
+        self.bands = BandPowers(
+            profile.eeg_channels,
+            profile.sampling_rate,
+            segment=profile.samples(settings.band_power_seconds),
+        )
+        self.features: Optional[FeatureExtractor] = None  # Set by set_baseline
+        self.seen = 0  # Sample number after the last one pushed
+
+    def set_baseline(self, baseline: np.ndarray) -> None:
+        """Use a window of rest as the reference for event features."""
+        self.features = FeatureExtractor(
+            self.profile.feature_rows, baseline, self.window
+        )
+
+    def update(self, data: np.ndarray, end: int) -> StateBit:
+        """Gesture completed by a window ending at sample number end, if any."""
+        new = min(end - self.seen, data.shape[1])
+        self.seen = end
+        self.ranges.push(data[self.rows, data.shape[1] - new :])
+        self.bands.update(data[:, data.shape[1] - new :])
+        if self.model is None:
+            return self.debouncer.update(action_to_state(*self.ranges.ptp), end)
+
+        self.probabilities = self.model.probabilities(self.features(data))
+        candidate = GESTURES[int(np.argmax(self.probabilities))]
+        return self.debouncer.update(candidate, end)
+
+
 def process_board_data(
-    data: np.ndarray,
-    baseline_data: np.ndarray,
-    last_bit: StateBit,
+    data: np.ndarray, bit: StateBit, classifier: GestureClassifier
 ) -> BitEvent:
-    """Process raw board data into bit event"""
-    eeg_channels = BoardShim.get_eeg_channels(settings.board_id)
-    accel_channels = BoardShim.get_accel_channels(settings.board_id)
-    sampling_rate = BoardShim.get_sampling_rate(settings.board_id)
-
-    range_left = np.ptp(data[eeg_channels[1]])
-    range_right = np.ptp(data[eeg_channels[9]])
-    range_accel_nod = np.ptp(data[accel_channels[2]])
-    range_accel_shake = np.ptp(data[accel_channels[0]])
+    """Bit event for a gesture the classifier detected in data"""
+    range_left, range_right, range_accel_nod, range_accel_shake = classifier.ranges.ptp
 
     if not settings.SIMULATE:
         print(range_left, range_right, range_accel_nod, range_accel_shake)
 
-    bit = action_to_state(
-        range_left,
-        range_right,
-        range_accel_nod,
-        range_accel_shake,
-        last_bit,
-    )
+    # The model's P(right | a clench), or the same from the clench ranges
+    likelihood = None
+    if bit in (StateBit.LEFT_CLENCH, StateBit.RIGHT_CLENCH):
+        if classifier.probabilities is not None:
+            p = classifier.probabilities
+            left = p[GESTURES.index(StateBit.LEFT_CLENCH)]
+            right = p[GESTURES.index(StateBit.RIGHT_CLENCH)]
+            likelihood = float(right / (left + right))
+        else:
+            likelihood = float(right_clench_likelihood(range_left, range_right))
+        # Never on the other side of 0.5 from the bit itself, which the debounced
+        # or threshold-gated decision may have settled differently
+        if bit == StateBit.LEFT_CLENCH:
+            likelihood = min(likelihood, 0.5)
+        else:
+            likelihood = max(likelihood, 0.5)
 
     return BitEvent(
         bit=bit,
-        greeks=get_greek_waves(data, sampling_rate),
-        raw_data=(np.mean(data, axis=1) - np.mean(baseline_data, axis=1)).tolist(),
+        greeks=classifier.bands.greeks(),
+        raw_data=classifier.features.offsets(data).tolist(),
+        likelihood=likelihood,
+        features=classifier.features(data).tolist(),
     )
 
 
+def load_gesture_model(profile: BoardProfile) -> Optional[GestureModel]:
+    """Calibrated model from settings.gesture_model_path, if one was fitted"""
+    if settings.gesture_model_path.exists():
+        # As FeatureExtractor.size, before there is a baseline to build one from
+        n_features = len(FEATURES) * len(profile.feature_rows)
+        return GestureModel.load(settings.gesture_model_path, n_features)
+    return None
+
+
 @contextmanager
 def bci_session(flush_seconds: int = 4):
     """Context manager for BCI board session"""
@@ -0,0 +1,188 @@
+"""Per-user gesture model: record labelled windows, fit offline, classify fast.
+
+    python -m app.services.calibration [--data calibration.npz] [--out model.npz]
+
+In mode "collect", bci_client prompts for each gesture in turn and saves the
+FeatureExtractor vector of every window to settings.calibration_path. This
+fits a shrinkage LDA to them and saves it to settings.gesture_model_path, from
+where GestureClassifier loads it in place of the hand-tuned thresholds.
+"""
+
+import argparse
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from app.models import StateBit
+
+# Model classes, in label order
+GESTURES = (
+    StateBit.NOTHING,
+    StateBit.LEFT_CLENCH,
+    StateBit.RIGHT_CLENCH,
+    StateBit.NOD,
+    StateBit.SHAKE,
+)
+PROMPTS = {
+    StateBit.NOTHING: "Rest",
+    StateBit.LEFT_CLENCH: "Clench your left jaw",
+    StateBit.RIGHT_CLENCH: "Clench your right jaw",
+    StateBit.NOD: "Nod",
+    StateBit.SHAKE: "Shake your head",
+}
+
+
+@dataclass
+class GestureModel:
+    """Linear scores per gesture: one (features, gestures) product per window.
+
+    Standardisation is folded into weights and bias, so features go in raw.
+    """
+
+    weights: np.ndarray  # (features, gestures)
+    bias: np.ndarray  # (gestures,)
+
+    @classmethod
+    def fit(
+        cls, features: np.ndarray, labels: np.ndarray, shrinkage: float = 0.1
+    ) -> "GestureModel":
+        """Linear discriminant analysis with a covariance shrunk towards its
+        diagonal, which keeps it invertible with few windows per feature.
+
+        Gestures missing from labels get no chance of being predicted.
+        """
+        mean, std = features.mean(axis=0), features.std(axis=0) + 1e-9
+        x = (features - mean) / std
+
+        n_gestures = len(GESTURES)
+        counts = np.bincount(labels, minlength=n_gestures)
+        seen = counts > 0
+        means = np.zeros((n_gestures, x.shape[1]))
+        np.add.at(means, labels, x)
+        means[seen] /= counts[seen, None]
+
+        centred = x - means[labels]
+        covariance = centred.T @ centred / max(1, len(x) - seen.sum())
+        covariance = (1 - shrinkage) * covariance + shrinkage * np.diag(
+            np.diag(covariance)
+        )
+        w = np.linalg.solve(covariance + 1e-9 * np.eye(len(covariance)), means.T)
+        b = -0.5 * np.einsum("fg,gf->g", w, means)
+        b = np.where(seen, b + np.log(np.maximum(counts, 1) / len(labels)), -np.inf)
+
+        # Scores of (f - mean) / std: fold the scaling into w and b
+        weights = w / std[:, None]
+        return cls(weights, b - mean @ weights)
+
+    def scores(self, features: np.ndarray) -> np.ndarray:
+        return features @ self.weights + self.bias
+
+    def probabilities(self, features: np.ndarray) -> np.ndarray:
+        scores = self.scores(features)
+        scores = np.exp(scores - scores.max(axis=-1, keepdims=True))
+        return scores / scores.sum(axis=-1, keepdims=True)
+
+    def predict(self, features: np.ndarray) -> StateBit:
+        return GESTURES[int(np.argmax(self.scores(features)))]
+
+    def save(self, path: Path) -> None:
+        np.savez(path, weights=self.weights, bias=self.bias)
+
+    @classmethod
+    def load(cls, path: Path, n_features: Optional[int] = None) -> "GestureModel":
+        """Saved model, checked against the n_features windows will have."""
+        with np.load(path) as f:
+            model = cls(f["weights"], f["bias"])
+        if n_features is not None and len(model.weights) != n_features:
+            raise ValueError(
+                f"{path} takes {len(model.weights)} features, not {n_features}: "
+                "recalibrate for this board and channel settings"
+            )
+        return model
+
+
+def collect(
+    acquisition,
+    classifier,
+    window: int,
+    hop: int,
+    path: Path,
+    seconds: float = 4.0,
+    rounds: int = 3,
+    settle: float = 0.5,
+) -> None:
+    """Prompt for each gesture rounds times and save labelled window features.
+
+    Windows in the first settle seconds after a prompt, while the user reacts,
+    are not recorded. If acquisition stops early, the windows so far are saved.
+    """
+    baseline = acquisition.next_window(window, window)
+    if baseline is None:
+        return
+    classifier.set_baseline(baseline)
+    features: List[np.ndarray] = []
+    labels: List[int] = []
+
+    def record() -> None:
+        for _ in range(rounds):
+            for label, gesture in enumerate(GESTURES):
+                print(f"{PROMPTS[gesture]} for {seconds:g} s, starting now")
+                start = time.monotonic()
+                while (elapsed := time.monotonic() - start) < seconds:
+                    data = acquisition.next_window(window, hop)
+                    if data is None:
+                        print("Acquisition stopped, keeping the windows so far")
+                        return
+                    if elapsed >= settle:
+                        features.append(classifier.features(data))
+                        labels.append(label)
+
+    record()
+    if not labels:
+        return
+    np.savez(path, features=np.array(features), labels=np.array(labels))
+    print(f"Saved {len(labels)} windows to {path}")
+
+
+def holdout_accuracy(
+    features: np.ndarray, labels: np.ndarray, test_share: float = 0.2
+) -> Sequence[float]:
+    """Accuracy per gesture when fitting on all but each gesture's last windows."""
+    test = np.zeros(len(labels), dtype=bool)
+    for label in np.unique(labels):
+        (rows,) = np.nonzero(labels == label)
+        test[rows[int(len(rows) * (1 - test_share)) :]] = True
+    model = GestureModel.fit(features[~test], labels[~test])
+    predicted = np.argmax(model.scores(features[test]), axis=1)
+    return [
+        float(np.mean(predicted[labels[test] == label] == label))
+        for label in range(len(GESTURES))
+        if np.any(labels[test] == label)
+    ]
+
+
+def main():
+    from app.config.settings import settings
+
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--data", type=Path, default=settings.calibration_path)
+    parser.add_argument("--out", type=Path, default=settings.gesture_model_path)
+    args = parser.parse_args()
+
+    with np.load(args.data) as f:
+        features, labels = f["features"], f["labels"]
+    for gesture, accuracy in zip(
+        (GESTURES[label] for label in np.unique(labels)),
+        holdout_accuracy(features, labels),
+    ):
+        print(f"{PROMPTS[gesture]}: {accuracy:.1%} of held-out windows")
+
+    GestureModel.fit(features, labels).save(args.out)
+    print(f"Saved model for {features.shape[1]} features to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,22 @@
+import os
+
+import numpy as np
+import pytest
+
+# Settings requires the API keys to load; these tests never call the APIs
+os.environ.setdefault("ELEVEN_LABS_API_KEY", "test")
+os.environ.setdefault("LUMA_AI_AUTH_TOKEN", "test")
+
+
+@pytest.fixture
+def chunked():
+    """Consecutive column slices of data in random sizes, some empty."""
+
+    def split(data: np.ndarray, rng: np.random.Generator, largest: int = 12):
+        start = 0
+        while start < data.shape[1]:
+            n = int(rng.integers(0, largest + 1))
+            yield data[:, start : start + n]
+            start += n
+
+    return split
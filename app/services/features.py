@@ -0,0 +1,54 @@
+"""Fixed-size feature vectors of sample windows, for gesture classification."""
+
+from typing import Sequence
+
+import numpy as np
+
+FEATURES = ("ptp", "rms", "var", "line_length")
+
+
+class FeatureExtractor:
+    """Per-channel window features relative to a baseline recorded once.
+
+    The baseline's channel means are computed when the extractor is made rather
+    than per window. Windows are copied into a preallocated float32 buffer (a
+    plain slice when the rows are contiguous, as EEG then accelerometer rows are
+    on OpenBCI boards) and every feature comes from that one buffer.
+    """
+
+    def __init__(self, rows: Sequence[int], baseline: np.ndarray, window: int):
+        rows = np.asarray(rows)
+        contiguous = np.array_equal(rows, rows[0] + np.arange(len(rows)))
+        self.rows = slice(rows[0], rows[0] + len(rows)) if contiguous else rows
+        self.baseline_mean = baseline.mean(axis=1)  # Every row, for offsets()
+        self._centre = self.baseline_mean[self.rows].astype(np.float32)[:, None]
+        self._buffer = np.empty((len(rows), window), dtype=np.float32)
+
+    @property
+    def size(self) -> int:
+        return len(FEATURES) * len(self._buffer)
+
+    def offsets(self, data: np.ndarray) -> np.ndarray:
+        """Mean of every row minus its baseline mean."""
+        return data.mean(axis=1) - self.baseline_mean
+
+    def __call__(self, data: np.ndarray) -> np.ndarray:
+        """Features of a window of at most window samples, grouped by FEATURES.
+
+        That is ptp of each row, then RMS about the baseline mean, variance and
+        line length (summed absolute sample-to-sample change).
+        """
+        x = self._buffer[:, : data.shape[1]]
+        np.copyto(x, data[self.rows], casting="same_kind")
+        x -= self._centre
+
+        mean = x.mean(axis=1)
+        mean_square = np.einsum("ij,ij->i", x, x) / x.shape[1]
+        return np.concatenate(
+            [
+                x.max(axis=1) - x.min(axis=1),
+                np.sqrt(mean_square),
+                np.maximum(mean_square - mean**2, 0),
+                np.abs(np.diff(x, axis=1)).sum(axis=1),
+            ]
+        )
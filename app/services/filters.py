@@ -0,0 +1,190 @@
+"""Causal streaming filters for multi-channel sample chunks.
+
+Filters are cascades of second-order sections (biquads) carrying their state
+between chunks, so every sample is filtered exactly once, as it arrives, instead
+of re-filtering the last window zero-phase (which also needs future samples and
+rings at the window edges). Butterworth designs follow scipy.signal.butter
+(analog prototype, band transform, bilinear transform), done here in numpy.
+Savitzky-Golay smoothing likewise keeps only the samples its next output needs.
+"""
+
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+
+
+def butter_sos(
+    order: int, band: Tuple[float, float], sampling_rate: float, btype: str
+) -> np.ndarray:
+    """(sections, 6) rows of b0 b1 b2 a0 a1 a2, like butter(..., output="sos").
+
+    btype is "bandpass" or "bandstop"; each gives 2 * order poles, so order
+    sections.
+    """
+    fs2 = 2.0 * sampling_rate
+    low, high = (fs2 * np.tan(np.pi * f / sampling_rate) for f in band)  # Prewarp
+    bandwidth, centre = high - low, np.sqrt(low * high)
+
+    # Analog Butterworth lowpass prototype, poles on the left unit semicircle
+    poles = np.exp(1j * np.pi * (2 * np.arange(order) + order + 1) / (2 * order))
+    if btype == "bandpass":
+        half = poles * bandwidth / 2
+        zeros = np.zeros(order, dtype=complex)
+        gain = bandwidth**order
+    elif btype == "bandstop":
+        half = bandwidth / 2 / poles
+        zeros = np.repeat([1j * centre, -1j * centre], order)
+        gain = np.real(1 / np.prod(-poles))
+    else:
+        raise ValueError(f"Unknown filter type {btype}")
+    root = np.sqrt(half**2 - centre**2)
+    poles = np.concatenate([half + root, half - root])
+
+    # Bilinear transform; zeros at infinity map to z = -1
+    gain *= np.real(np.prod(fs2 - zeros) / np.prod(fs2 - poles))
+    zeros = np.concatenate(
+        [(fs2 + zeros) / (fs2 - zeros), -np.ones(len(poles) - len(zeros))]
+    )
+    poles = (fs2 + poles) / (fs2 - poles)
+    return _sections(zeros, poles, gain)
+
+
+def _sections(zeros: np.ndarray, poles: np.ndarray, gain: float) -> np.ndarray:
+    """Biquads of conjugate pole pairs, each with a conjugate or real zero pair."""
+    upper = poles[poles.imag > 1e-12]
+    complex_zeros = zeros[zeros.imag > 1e-12]
+    real_zeros = np.sort(zeros[np.abs(zeros.imag) <= 1e-12].real)
+    # Real zeros paired smallest with largest, e.g. z = -1 with z = 1
+    half = len(real_zeros) // 2
+    zero_pairs = [np.poly([z, np.conj(z)]).real for z in complex_zeros] + [
+        np.poly([a, b]) for a, b in zip(real_zeros[:half], real_zeros[half:])
+    ]
+    assert len(upper) == len(zero_pairs), "Only even-order band filters"
+
+    sos = np.array(
+        [
+            np.concatenate([b, np.poly([p, np.conj(p)]).real])
+            for b, p in zip(zero_pairs, upper)
+        ]
+    )
+    sos[0, :3] *= gain
+    return sos
+
+
+def step_state(sos: np.ndarray) -> np.ndarray:
+    """(sections, 2) state of each biquad after a long unit step, as sosfilt_zi.
+
+    Scaled by a channel's first sample, it starts the filter as if that value
+    had always been the input, so DC offsets do not ring on startup.
+    """
+    state = np.empty((len(sos), 2))
+    scale = 1.0
+    for i, (b0, b1, b2, _, a1, a2) in enumerate(sos):
+        # Fixed point of z1 = b1 - a1 y + z2, z2 = b2 - a2 y, with y = b0 + z1
+        transition = np.array([[1 + a1, -1.0], [a2, 1.0]])
+        state[i] = scale * np.linalg.solve(transition, [b1 - a1 * b0, b2 - a2 * b0])
+        scale *= (b0 + b1 + b2) / (1 + a1 + a2)
+    return state
+
+
+class StreamingFilter:
+    """A biquad cascade applied in place to some rows of successive chunks.
+
+    Direct form II transposed, one time step per iteration over all rows at
+    once; the per-row state persists across calls.
+    """
+
+    def __init__(self, sos: np.ndarray, rows: Sequence[int]):
+        self.sos = sos / sos[:, 3:4]  # Normalise a0 to 1
+        self.rows = np.asarray(rows)
+        self.state = None  # (sections, 2, rows) once the first sample arrives
+
+    def __call__(self, chunk: np.ndarray) -> np.ndarray:
+        x = chunk[self.rows].T  # (samples, rows), copied
+        if not len(x):
+            return chunk
+        if self.state is None:
+            self.state = step_state(self.sos)[:, :, None] * x[0]
+
+        y = x
+        for i, (b0, b1, b2, _, a1, a2) in enumerate(self.sos):
+            z1, z2 = self.state[i]
+            out = np.empty_like(y)
+            for t, sample in enumerate(y):
+                out[t] = b0 * sample + z1
+                z1 = b1 * sample - a1 * out[t] + z2
+                z2 = b2 * sample - a2 * out[t]
+            self.state[i] = z1, z2
+            y = out
+        chunk[self.rows] = y.T
+        return chunk
+
+
+def filter_bank(
+    rows: Sequence[int],
+    sampling_rate: float,
+    bandpass: Tuple[float, float],
+    notches: Sequence[float] = (),
+    notch_width: float = 4.0,
+    order: int = 2,
+) -> StreamingFilter:
+    """Bandpass plus bandstops around mains frequencies, as one cascade.
+
+    Notches at or above Nyquist are left out.
+    """
+    sos = [butter_sos(order, bandpass, sampling_rate, "bandpass")]
+    for f in notches:
+        if f + notch_width / 2 < sampling_rate / 2:
+            band = (f - notch_width / 2, f + notch_width / 2)
+            sos.append(butter_sos(order, band, sampling_rate, "bandstop"))
+    return StreamingFilter(np.concatenate(sos), rows)
+
+
+def savgol_coeffs(window: int, order: int) -> np.ndarray:
+    """Weights giving, as a dot product with the last window samples, the value
+    at the newest sample of their least-squares polynomial of the given order.
+
+    The same as savgol_coeffs(window, order, pos=window - 1, use="dot"), i.e. the
+    last point of savgol_filter over that window.
+    """
+    assert order < window, "Savitzky-Golay order must be below the window length"
+    t = np.arange(1 - window, 1)  # Sample times, the newest at 0
+    vandermonde = t[:, None] ** np.arange(order + 1)
+    return np.linalg.pinv(vandermonde)[0]  # Constant term: the fit at t = 0
+
+
+class SavitzkyGolay:
+    """Causal Savitzky-Golay smoothing applied in place to some rows of chunks.
+
+    Keeps the last window - 1 samples of each row, so a chunk is smoothed with a
+    single matrix product over its sliding windows, all rows at once. Samples
+    before the first full window pass through unchanged.
+    """
+
+    def __init__(self, rows: Sequence[int], window: int = 11, order: int = 3):
+        self.coeffs = savgol_coeffs(window, order)
+        self.rows = np.asarray(rows)
+        self.history = np.empty((len(self.rows), 0))  # Up to window - 1 samples
+
+    def __call__(self, chunk: np.ndarray) -> np.ndarray:
+        window = len(self.coeffs)
+        x = np.concatenate([self.history, chunk[self.rows]], axis=1)
+        self.history = x[:, max(0, x.shape[1] - (window - 1)) :]
+        if x.shape[1] < window:
+            return chunk
+
+        smoothed = np.lib.stride_tricks.sliding_window_view(x, window, axis=1)
+        smoothed = smoothed @ self.coeffs  # (rows, samples with a full window)
+        chunk[self.rows, chunk.shape[1] - smoothed.shape[1] :] = smoothed
+        return chunk
+
+
+def chain(*stages: Callable[[np.ndarray], np.ndarray]) -> Callable:
+    """Apply chunk transforms in order."""
+
+    def apply(chunk: np.ndarray) -> np.ndarray:
+        for stage in stages:
+            chunk = stage(chunk)
+        return chunk
+
+    return apply
@@ -0,0 +1,83 @@
+"""Streaming building blocks for gesture detection on sliding windows."""
+
+from collections import deque
+from typing import Deque, List, Tuple
+
+import numpy as np
+
+from app.models import StateBit
+
+
+class RollingRange:
+    """Peak-to-peak of each channel over its last window samples, updated per sample.
+
+    Per channel, a deque of (sample number, value) with decreasing values holds
+    every candidate for the window maximum (and one with increasing values for
+    the minimum): a new sample evicts the smaller ones behind it, since they can
+    no longer be the maximum, and the front expires once it leaves the window.
+    Each sample enters and leaves each deque once, so a hop costs O(hop) rather
+    than rescanning the window.
+    """
+
+    def __init__(self, n_channels: int, window: int):
+        self.window = window
+        self.count = 0  # Samples pushed
+        self._max: List[Deque[Tuple[int, float]]] = [deque() for _ in range(n_channels)]
+        self._min: List[Deque[Tuple[int, float]]] = [deque() for _ in range(n_channels)]
+
+    def push(self, samples: np.ndarray) -> None:
+        """Slide the window over (channels, n) new samples."""
+        for i, column in enumerate(samples.T.tolist(), self.count):
+            expired = i - self.window
+            for value, high, low in zip(column, self._max, self._min):
+                while high and high[-1][1] <= value:
+                    high.pop()
+                high.append((i, value))
+                while low and low[-1][1] >= value:
+                    low.pop()
+                low.append((i, value))
+                if high[0][0] <= expired:
+                    high.popleft()
+                if low[0][0] <= expired:
+                    low.popleft()
+        self.count += samples.shape[1]
+
+    @property
+    def ptp(self) -> np.ndarray:
+        """Max minus min per channel, like np.ptp over the window."""
+        return np.array(
+            [h[0][1] - l[0][1] if h else 0.0 for h, l in zip(self._max, self._min)]
+        )
+
+
+class Debouncer:
+    """Turns per-hop gesture guesses into one event per gesture.
+
+    A gesture fires once it was guessed on hold consecutive hops, at most once
+    until a hop with no gesture re-arms it, and not within refractory samples of
+    the last one. This replaces requiring the previous window to be empty, which
+    tied a gesture's length to the window length.
+    """
+
+    def __init__(self, hold: int, refractory: int):
+        self.hold = hold
+        self.refractory = refractory
+        self.candidate = StateBit.NOTHING
+        self.streak = 0
+        self.armed = True
+        self.ready_at = 0  # Sample number ending the refractory period
+
+    def update(self, candidate: StateBit, now: int) -> StateBit:
+        """Gesture to report for the hop ending at sample number now."""
+        if candidate == self.candidate:
+            self.streak += 1
+        else:
+            self.candidate, self.streak = candidate, 1
+
+        if candidate == StateBit.NOTHING:
+            self.armed = True
+        elif self.armed and self.streak >= self.hold and now >= self.ready_at:
+            self.armed = False
+            self.ready_at = now + self.refractory
+            return candidate
+        return StateBit.NOTHING
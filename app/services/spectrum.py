@@ -0,0 +1,80 @@
+"""Running EEG band powers, updated as samples arrive."""
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from app.models import GreekWaves
+
+# Bands of GreekWaves, in Hz, as DataFilter.get_avg_band_powers uses
+BANDS = ((2.0, 4.0), (4.0, 8.0), (8.0, 13.0), (13.0, 30.0), (30.0, 45.0))
+
+
+class BandPowers:
+    """Relative band powers from a Welch PSD averaged exponentially over time.
+
+    Each row's samples are cut into Hann-windowed segments overlapping by half;
+    as soon as a segment completes, its periodogram (all rows in one rfft) is
+    blended into the running PSD with weight smoothing. Band powers are then a
+    matrix product of the PSD with band masks, so reading them costs nothing
+    like a fresh get_avg_band_powers, which refilters and recomputes the PSD.
+    """
+
+    def __init__(
+        self,
+        rows: Sequence[int],
+        sampling_rate: float,
+        segment: int,
+        smoothing: float = 0.2,
+        bands: Sequence[Tuple[float, float]] = BANDS,
+    ):
+        self.rows = np.asarray(rows)
+        self.segment = segment
+        self.step = max(1, segment // 2)
+        self.smoothing = smoothing
+        self.window = np.hanning(segment)
+
+        freqs = np.fft.rfftfreq(segment, 1 / sampling_rate)
+        bands = [(freqs >= lo) & (freqs < hi) for lo, hi in bands]
+        self.masks = np.array(bands, dtype=float).T  # (freqs, bands)
+        assert self.masks.any(axis=0).all(), "Segment too short to resolve every band"
+
+        self.psd = np.zeros((len(self.rows), len(freqs)))
+        self.segments = 0  # Periodograms averaged into psd
+        self._history = np.empty((len(self.rows), 0))  # Samples not yet segmented
+
+    def update(self, chunk: np.ndarray) -> None:
+        """Add (board rows, n) new samples."""
+        x = np.concatenate([self._history, chunk[self.rows]], axis=1)
+        n_segments = max(0, (x.shape[1] - self.segment) // self.step + 1)
+        if n_segments:
+            segments = np.lib.stride_tricks.sliding_window_view(
+                x, self.segment, axis=1
+            )[:, :: self.step][:, :n_segments]
+            segments = segments - segments.mean(axis=2, keepdims=True)  # Detrend
+            periodograms = np.abs(np.fft.rfft(segments * self.window)) ** 2
+            for periodogram in periodograms.transpose(1, 0, 2):
+                # The first segment replaces the empty PSD rather than fading in
+                weight = self.smoothing if self.segments else 1.0
+                self.psd += weight * (periodogram - self.psd)
+                self.segments += 1
+        self._history = x[:, n_segments * self.step :]
+
+    @property
+    def valid(self) -> bool:
+        """Whether a segment was seen and it had power in the bands."""
+        return bool(self.segments) and bool((self.psd @ self.masks).sum(axis=1).all())
+
+    def relative(self) -> np.ndarray:
+        """Each band's share of the bands' power, averaged over rows.
+
+        Zeros until valid.
+        """
+        if not self.valid:
+            return np.zeros(self.masks.shape[1])
+        powers = self.psd @ self.masks
+        return (powers / powers.sum(axis=1, keepdims=True)).mean(axis=0)
+
+    def greeks(self) -> GreekWaves:
+        delta, theta, alpha, beta, gamma = self.relative().tolist()
+        return GreekWaves(delta, theta, alpha, beta, gamma, valid=self.valid)
@@ -0,0 +1,54 @@
+import threading
+
+import numpy as np
+
+from app.services.acquisition import Acquisition, SampleRing
+
+
+def test_sample_ring():
+    """Windows of the ring are the newest samples, across wraps and overflows."""
+    rng = np.random.default_rng(0)
+    ring = SampleRing(3, 10)
+    written = np.zeros((3, 0))
+    for n in [3, 4, 7, 12, 1, 9, 10]:
+        chunk = rng.normal(size=(3, n))
+        ring.write(chunk)
+        written = np.hstack([written, chunk])
+        assert ring.total == written.shape[1]
+        for w in range(1, min(10, ring.total) + 1):
+            assert np.array_equal(ring.window(w), written[:, -w:])
+        if ring.total >= 5:
+            assert np.array_equal(ring.window(3, ring.total - 2), written[:, -5:-2])
+
+
+class _Board:
+    """Hands out queued chunks, then nothing, like get_board_data once drained."""
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.drained = threading.Event()
+
+    def get_board_data(self) -> np.ndarray:
+        if self.chunks:
+            return self.chunks.pop(0)
+        self.drained.set()
+        return np.zeros((3, 0))
+
+
+def test_next_window(chunked):
+    """Windows advance by hop over the acquired samples, and None once stopped."""
+    rng = np.random.default_rng(7)
+    data = rng.normal(size=(3, 300))
+
+    board = _Board(chunked(data, rng))
+    with Acquisition(board, 3, capacity=500, poll=0.001) as acquisition:
+        for i in range((300 - 20) // 5 + 1):
+            window = acquisition.next_window(20, 5)
+            assert np.array_equal(window, data[:, 5 * i : 5 * i + 20])
+    assert acquisition.next_window(20, 5) is None
+
+    # A reader a whole ring behind skips to the oldest samples still held
+    board = _Board(chunked(data, rng))
+    with Acquisition(board, 3, capacity=50, poll=0.001) as acquisition:
+        board.drained.wait()
+        assert np.array_equal(acquisition.next_window(20, 5), data[:, 250:270])
@@ -0,0 +1,91 @@
+import numpy as np
+from brainflow.board_shim import BoardIds, BoardShim
+
+from app.config.settings import settings
+from app.models import StateBit
+from app.services.bci import (
+    BoardProfile,
+    GestureClassifier,
+    process_board_data,
+    right_clench_likelihood,
+)
+from app.services.calibration import GESTURES
+
+SYNTHETIC = BoardIds.SYNTHETIC_BOARD.value
+
+
+def test_board_profile():
+    """Board metadata and gesture rows resolve from BrainFlow and the settings."""
+    profile = BoardProfile.load(SYNTHETIC)
+    eeg = BoardShim.get_eeg_channels(SYNTHETIC)
+    accel = BoardShim.get_accel_channels(SYNTHETIC)
+
+    assert profile.sampling_rate == BoardShim.get_sampling_rate(SYNTHETIC)
+    assert profile.n_rows == BoardShim.get_num_rows(SYNTHETIC)
+    assert profile.gesture_rows == [
+        eeg[settings.left_clench_channel],
+        eeg[settings.right_clench_channel],
+        accel[settings.nod_accel_axis],
+        accel[settings.shake_accel_axis],
+    ]
+    assert np.array_equal(profile.feature_rows, eeg + accel)
+    assert profile.samples(0.25) == int(0.25 * profile.sampling_rate)
+    assert profile.samples(0) == 1
+
+
+def test_right_clench_likelihood():
+    """0.5 where action_to_state switches sides, monotone in the right share."""
+    assert np.isclose(right_clench_likelihood(1, 2), 0.5)
+    assert right_clench_likelihood(1, 0) == 0
+    assert right_clench_likelihood(0, 1) == 1
+    shares = np.linspace(0.01, 1, 100)
+    likelihoods = [right_clench_likelihood(1 - s, s) for s in shares]
+    assert np.all(np.diff(likelihoods) > 0)
+
+
+def _clench(profile: BoardProfile, n: int, left: float, right: float) -> np.ndarray:
+    """Board data at rest but for square waves of the given ranges on the clench rows."""
+    data = np.zeros((profile.n_rows, n))
+    square = np.resize([0.5, -0.5], n)
+    data[profile.left] = left * square
+    data[profile.right] = right * square
+    return data
+
+
+def test_gesture_classifier_update():
+    """A burst on the right clench row fires one debounced RIGHT_CLENCH."""
+    profile = BoardProfile.load(SYNTHETIC)
+    window, hop = 50, 10
+    data = _clench(profile, 1000, 20, 0)
+    data[:, 500:560] += _clench(profile, 60, 0, 1200)
+
+    classifier = GestureClassifier(profile, window, hold=2, refractory=250)
+    events = []
+    for end in range(window, data.shape[1] + 1, hop):
+        bit = classifier.update(data[:, end - window : end], end)
+        if bit != StateBit.NOTHING:
+            events.append((end, bit))
+    # The burst is in the window from end 510, and held for a second hop at 520
+    assert events == [(520, StateBit.RIGHT_CLENCH)]
+
+
+def test_process_board_data():
+    """Clench likelihoods never fall on the other side of 0.5 from the bit."""
+    profile = BoardProfile.load(SYNTHETIC)
+    classifier = GestureClassifier(profile, 50, hold=1, refractory=0)
+    classifier.set_baseline(np.zeros((profile.n_rows, 50)))
+    data = _clench(profile, 50, 400, 600)
+    classifier.update(data, 50)
+
+    event = process_board_data(data, StateBit.LEFT_CLENCH, classifier)
+    assert event.likelihood == right_clench_likelihood(400, 600) <= 0.5
+    assert len(event.features) == classifier.features.size
+    assert process_board_data(data, StateBit.NOD, classifier).likelihood is None
+
+    # A model favouring the right is overruled by a left bit, and kept for a right
+    classifier.probabilities = np.zeros(len(GESTURES))
+    classifier.probabilities[GESTURES.index(StateBit.LEFT_CLENCH)] = 0.2
+    classifier.probabilities[GESTURES.index(StateBit.RIGHT_CLENCH)] = 0.8
+    assert process_board_data(data, StateBit.LEFT_CLENCH, classifier).likelihood == 0.5
+    event = process_board_data(data, StateBit.RIGHT_CLENCH, classifier)
+    assert np.isclose(event.likelihood, 0.8)
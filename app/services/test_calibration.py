@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from app.services.calibration import GESTURES, GestureModel, collect
+
+
+def test_gesture_model():
+    """LDA separates distinct feature clusters whatever their scale."""
+    rng = np.random.default_rng(5)
+    labels = np.repeat(np.arange(len(GESTURES)), 100)
+    centres = rng.normal(0, 3, (len(GESTURES), 12))
+    scale = rng.uniform(1, 500, 12)
+    features = (centres[labels] + rng.normal(0, 1, (len(labels), 12))) * scale
+
+    model = GestureModel.fit(features, labels)
+    assert np.mean(np.argmax(model.scores(features), axis=1) == labels) > 0.95
+    assert np.allclose(model.probabilities(features[:5]).sum(axis=1), 1)
+    assert model.predict(features[labels == 2][0]) == GESTURES[2]
+
+    # Gestures without windows are never predicted
+    model = GestureModel.fit(features[labels != 4], labels[labels != 4])
+    assert not np.any(np.argmax(model.scores(features), axis=1) == 4)
+
+
+def test_gesture_model_load(tmp_path):
+    """A saved model loads back, unless windows would have another feature count."""
+    model = GestureModel(np.ones((12, len(GESTURES))), np.zeros(len(GESTURES)))
+    model.save(tmp_path / "model.npz")
+    loaded = GestureModel.load(tmp_path / "model.npz", 12)
+    assert np.array_equal(loaded.weights, model.weights)
+    with pytest.raises(ValueError):
+        GestureModel.load(tmp_path / "model.npz", 16)
+
+
+class _Windows:
+    """Acquisition stand-in that stops after a number of windows."""
+
+    def __init__(self, n: int):
+        self.left = n
+
+    def next_window(self, n: int, hop: int):
+        self.left -= 1
+        return np.zeros((4, n)) if self.left >= 0 else None
+
+
+class _Classifier:
+    def set_baseline(self, baseline: np.ndarray) -> None:
+        self.features = lambda data: data[:, 0]
+
+
+def test_collect_saves_when_stopped(tmp_path):
+    """Windows recorded before acquisition stops are still saved."""
+    path = tmp_path / "calibration.npz"
+    collect(_Windows(6), _Classifier(), 8, 2, path, settle=0)
+    with np.load(path) as f:
+        assert f["features"].shape == (5, 4)
+        assert np.all(f["labels"] == 0)
+
+    # Nothing to save if it stops before the baseline
+    collect(_Windows(0), _Classifier(), 8, 2, tmp_path / "none.npz")
+    assert not (tmp_path / "none.npz").exists()
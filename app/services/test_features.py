@@ -0,0 +1,25 @@
+import numpy as np
+
+from app.services.features import FeatureExtractor
+
+
+def test_feature_extractor():
+    """Features match their numpy definitions, for contiguous and scattered rows."""
+    rng = np.random.default_rng(3)
+    baseline = rng.normal(5, 1, (32, 31))
+    data = rng.normal(5, 2, (32, 31))
+    for rows in [np.arange(1, 20), np.array([1, 5, 17])]:
+        extractor = FeatureExtractor(rows, baseline, 31)
+        features = extractor(data)
+        x = data[rows] - baseline.mean(axis=1)[rows, None]
+        expected = np.concatenate(
+            [
+                np.ptp(x, axis=1),
+                np.sqrt((x**2).mean(axis=1)),
+                x.var(axis=1),
+                np.abs(np.diff(x, axis=1)).sum(axis=1),
+            ]
+        )
+        assert features.shape == (extractor.size,)
+        assert np.allclose(features, expected, rtol=1e-4, atol=1e-4)
+        assert np.allclose(extractor.offsets(data), data.mean(1) - baseline.mean(1))
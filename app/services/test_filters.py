@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from app.services.filters import SavitzkyGolay, butter_sos, filter_bank, step_state
+
+FS = 125
+
+
+def test_streaming_filter(chunked):
+    """Chunked streaming filtering equals one sosfilt pass from the same state."""
+    signal = pytest.importorskip("scipy.signal")
+
+    for band, btype in [((3, 45), "bandpass"), ((48, 52), "bandstop")]:
+        sos = butter_sos(2, band, FS, btype)
+        # Sections may pair poles and zeros differently; the response is the same
+        _, response = signal.sosfreqz(sos, fs=FS)
+        reference = signal.butter(2, band, btype, fs=FS, output="sos")
+        assert np.allclose(response, signal.sosfreqz(reference, fs=FS)[1])
+        assert np.allclose(step_state(sos), signal.sosfilt_zi(sos))
+
+    rng = np.random.default_rng(1)
+    rows = list(range(1, 17))
+    data = rng.normal(22500, 50, (20, 1000))  # DC offset like the Cyton's
+    raw = data.copy()
+    bank = filter_bank(rows, FS, (3, 45), [50, 60])
+    for chunk in chunked(data, rng):
+        bank(chunk)  # In place
+
+    zi = signal.sosfilt_zi(bank.sos)[:, :, None] * raw[rows, 0]
+    expected, _ = signal.sosfilt(bank.sos, raw[rows], axis=1, zi=zi.swapaxes(1, 2))
+    assert np.allclose(data[rows], expected)
+    assert np.array_equal(data[0], raw[0]) and np.array_equal(data[17:], raw[17:])
+
+
+def test_savitzky_golay(chunked):
+    """Streaming smoothing equals savgol_filter's last point over each window,
+    fed one sample at a time or in small chunks."""
+    signal = pytest.importorskip("scipy.signal")
+
+    rng = np.random.default_rng(6)
+    raw = rng.normal(size=(3, 300))
+    expected = raw[1].copy()
+    for i in range(10, raw.shape[1]):
+        expected[i] = signal.savgol_filter(raw[1, i - 10 : i + 1], 11, 3)[-1]
+
+    for largest in [1, 4, 8, 30]:  # 1: one sample (or none) at a time
+        data = raw.copy()
+        smoother = SavitzkyGolay([1], window=11, order=3)
+        for chunk in chunked(data, rng, largest):
+            smoother(chunk)
+        assert np.allclose(data[1], expected)
+        assert np.array_equal(data[[0, 2]], raw[[0, 2]])
@@ -0,0 +1,32 @@
+import numpy as np
+
+from app.models import StateBit
+from app.services.gestures import Debouncer, RollingRange
+
+
+def test_rolling_range(chunked):
+    """Incremental peak-to-peak matches np.ptp over the trailing window."""
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(4, 400))
+    ranges = RollingRange(4, 31)
+    end = 0
+    for chunk in chunked(data, rng):
+        ranges.push(chunk)
+        end += chunk.shape[1]
+        if end:
+            expected = np.ptp(data[:, max(0, end - 31) : end], axis=1)
+            assert np.allclose(ranges.ptp, expected)
+
+
+def test_debouncer():
+    """A gesture fires once after hold hops, re-arms on rest, respects refractory."""
+    L, R, N = StateBit.LEFT_CLENCH, StateBit.RIGHT_CLENCH, StateBit.NOTHING
+    debouncer = Debouncer(hold=2, refractory=10)
+    guesses = [N, L, L, L, N, R, R, N, R, R]
+    fired = [debouncer.update(g, 6 * i) for i, g in enumerate(guesses)]
+    assert fired == [N, N, L, N, N, N, R, N, N, R]
+
+    # Within the refractory period a new gesture waits, then fires
+    debouncer = Debouncer(hold=1, refractory=10)
+    hops = [(L, 0), (N, 2), (R, 4), (R, 12)]
+    assert [debouncer.update(g, t) for g, t in hops] == [L, N, N, R]
@@ -0,0 +1,24 @@
+import numpy as np
+
+from app.services.spectrum import BandPowers
+
+FS = 125
+
+
+def test_band_powers(chunked):
+    """Alpha dominates a 10 Hz signal; nothing is reported before a segment."""
+    rng = np.random.default_rng(4)
+    t = np.arange(FS * 20) / FS
+    data = np.zeros((20, len(t)))
+    data[1:17] = 3 * np.sin(2 * np.pi * 10 * t) + rng.normal(0, 0.5, (16, len(t)))
+
+    bands = BandPowers(range(1, 17), FS, segment=2 * FS)
+    greeks = bands.greeks()
+    assert not greeks.valid and greeks.alpha == 0
+
+    for chunk in chunked(data, rng):
+        bands.update(chunk)
+    greeks = bands.greeks()
+    assert greeks.valid and bands.segments == 19
+    assert np.isclose(bands.relative().sum(), 1)
+    assert greeks.alpha > 0.8
@@ -1,5 +1,5 @@
 import numpy as np
-from scipy.signal import savgol_filter
+from app.services.filters import SavitzkyGolay
 import time
 # import random
 
@@ -7,23 +7,14 @@ sampling_rate = 250
 window_size = 11  
 poly_order = 3  
 
-buffer = []
+# Coefficients are computed once; each sample is then one dot product
+smoother = SavitzkyGolay(rows=[0], window=window_size, order=poly_order)
 
 def process_eeg_stream(new_sample):
     """
     Processes real-time EEG data using Savitzky-Golay smoothing.
     """
-    global buffer
-    buffer.append(new_sample)
-
-    if len(buffer) > window_size:
-        buffer.pop(0)
-
-    if len(buffer) >= window_size:
-        smoothed_signal = savgol_filter(buffer, window_size, poly_order)
-        return smoothed_signal[-1] 
-    else:
-        return new_sample
+    return smoother(np.array([[new_sample]], dtype=float))[0, 0]
 
 # for _ in range(100):
 #     #raw_eeg = np.sin(2 * np.pi * 1.2 * time.time()) + 0.2 * np.sin(2 * np.pi * 10 * time.time()) + random.uniform(-0.1, 0.1)
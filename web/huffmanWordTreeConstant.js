@@ -0,0 +1,2557 @@
+const huffmanTree={
+  "codes": {
+    " ": "1111",
+    ">": "11000011",
+    "a": "1001",
+    "about": "0111010001",
+    "add": "011101101010",
+    "address": "1011110111110",
+    "after": "010101110001",
+    "all": "1101100010",
+    "also": "01010111011",
+    "am": "01010001100",
+    "an": "1100010000",
+    "and": "1101110",
+    "any": "11000000010",
+    "are": "010100101",
+    "area": "1011110111000",
+    "as": "000000000",
+    "at": "000000110",
+    "available": "010101111101",
+    "b": "1101101",
+    "back": "110110000000",
+    "based": "1010000011110",
+    "be": "010101101",
+    "because": "1100001010101",
+    "been": "01010000100",
+    "before": "1100010010101",
+    "best": "010101110000",
+    "between": "1010000101100",
+    "black": "1010000000100",
+    "book": "000000011011",
+    "books": "010100011111",
+    "business": "01110110001",
+    "but": "0101000000",
+    "buy": "101000010001",
+    "by": "00000010",
+    "c": "01111",
+    "can": "0111011101",
+    "car": "1100000010111",
+    "center": "1100011110000",
+    "check": "1010000000001",
+    "city": "011101101011",
+    "click": "110111111001",
+    "code": "1010000001111",
+    "comments": "1100011011100",
+    "community": "1011110111101",
+    "company": "000000010011",
+    "contact": "01110110110",
+    "copyright": "010101111100",
+    "could": "1101001000001",
+    "d": "01011",
+    "data": "101000010000",
+    "date": "110110000100",
+    "day": "110001001111",
+    "days": "1101100001010",
+    "de": "1101111111001",
+    "design": "1100000010110",
+    "details": "1100011000000",
+    "development": "1100011010100",
+    "did": "1100010010001",
+    "do": "11011111101",
+    "does": "1101111111000",
+    "e": "1110",
+    "each": "010100001011",
+    "education": "1100000011011",
+    "email": "110001001001",
+    "even": "1010000000101",
+    "f": "011100",
+    "family": "1010000101000",
+    "find": "110110001110",
+    "first": "01010001101",
+    "for": "11000101",
+    "forum": "1010000101001",
+    "free": "0101000011",
+    "from": "010100010",
+    "full": "1101100101000",
+    "g": "101001",
+    "games": "1101100001110",
+    "general": "1101111101101",
+    "get": "01010101111",
+    "go": "110000000110",
+    "good": "010101011100",
+    "great": "1101001000000",
+    "group": "000000010001",
+    "h": "00001",
+    "had": "110001111011",
+    "has": "0101010010",
+    "have": "1101001001",
+    "he": "11000111110",
+    "health": "110000101011",
+    "help": "01010110001",
+    "her": "011101101110",
+    "here": "01110110100",
+    "high": "010100011110",
+    "his": "10100000010",
+    "home": "1010000010",
+    "hotel": "1100011111100",
+    "hotels": "1100010010100",
+    "how": "00000011110",
+    "i": "0110",
+    "if": "0101011110",
+    "in": "11011110",
+    "index": "0111011100000",
+    "info": "010101001100",
+    "information": "11011001001",
+    "international": "1100011110001",
+    "internet": "1011110111111",
+    "into": "110001001011",
+    "is": "10111100",
+    "it": "101000011",
+    "item": "1100011110100",
+    "items": "000000011010",
+    "its": "110111110111",
+    "j": "010101000",
+    "jan": "010101011101",
+    "january": "1101100101100",
+    "just": "110001101111",
+    "k": "11010011",
+    "know": "1101100001111",
+    "l": "10110",
+    "last": "101111011001",
+    "life": "1101100011110",
+    "like": "110110010111",
+    "line": "1100010011101",
+    "links": "010100001010",
+    "list": "110001111001",
+    "local": "1100001010100",
+    "long": "1010000011111",
+    "m": "110011",
+    "made": "1100011010101",
+    "mail": "1101100101001",
+    "make": "101000001110",
+    "management": "1101100000011",
+    "many": "000000001100",
+    "map": "1101100100011",
+    "may": "11000110110",
+    "me": "00000001100",
+    "member": "1100011000001",
+    "message": "010101110100",
+    "more": "1100011001",
+    "most": "101111010111",
+    "music": "101000010101",
+    "must": "1100011100001",
+    "my": "0101010110",
+    "n": "0100",
+    "name": "110001110001",
+    "national": "1100000011010",
+    "need": "000000001101",
+    "new": "1100011101",
+    "news": "11000010100",
+    "next": "110000001100",
+    "no": "11011111010",
+    "not": "011101111",
+    "now": "01010111001",
+    "number": "011101100000",
+    "o": "0011",
+    "of": "101110",
+    "off": "1100011010000",
+    "office": "1100001001010",
+    "on": "01110101",
+    "one": "0000000101",
+    "online": "01010010011",
+    "only": "10100001001",
+    "or": "011101001",
+    "order": "000000111110",
+    "other": "0000000010",
+    "our": "0000000111",
+    "out": "11000000111",
+    "over": "110001101011",
+    "p": "110010",
+    "page": "0101011001",
+    "part": "1101100000010",
+    "people": "110001111111",
+    "phone": "1011110110000",
+    "please": "011101000000",
+    "pm": "01010101001",
+    "policy": "011101100001",
+    "post": "011101101111",
+    "posted": "1100000001110",
+    "price": "110110000110",
+    "prices": "0111011100001",
+    "privacy": "000000111010",
+    "product": "101000000001",
+    "products": "101000010111",
+    "program": "1101100011111",
+    "public": "010100100100",
+    "q": "1100010001",
+    "r": "0001",
+    "re": "110000100100",
+    "read": "000000010010",
+    "real": "1100011110101",
+    "report": "1100011010001",
+    "research": "1101111101100",
+    "reserved": "1011110101100",
+    "results": "1100001001011",
+    "review": "010100000110",
+    "reviews": "1101100100010",
+    "right": "1100001011001",
+    "rights": "010100100101",
+    "s": "0010",
+    "said": "1101111111100",
+    "school": "010100011101",
+    "search": "0101001000",
+    "see": "10111101010",
+    "send": "1100010010000",
+    "service": "110110010101",
+    "services": "00000000111",
+    "set": "1101111110001",
+    "sex": "000000010000",
+    "she": "010100000111",
+    "shipping": "1011110101101",
+    "should": "101000000011",
+    "show": "1010000001110",
+    "site": "11010010001",
+    "so": "10100000110",
+    "software": "010101100001",
+    "some": "110111111111",
+    "special": "1010000000000",
+    "state": "110001101001",
+    "states": "1011110111001",
+    "store": "1100011100000",
+    "subject": "1010000101101",
+    "such": "011101000001",
+    "support": "010101110101",
+    "system": "011101110001",
+    "t": "1000",
+    "take": "1100000001111",
+    "terms": "1100010011100",
+    "than": "110110010000",
+    "that": "01010011",
+    "the": "10101",
+    "their": "11000010111",
+    "them": "101000000110",
+    "then": "010101100000",
+    "there": "10111101101",
+    "these": "110111111101",
+    "they": "11011000001",
+    "this": "110110011",
+    "those": "1100001001111",
+    "through": "010100011100",
+    "time": "11011000110",
+    "to": "1010001",
+    "top": "110100100001",
+    "travel": "1100011011101",
+    "two": "110000101101",
+    "type": "1100001011000",
+    "u": "110101",
+    "under": "1101111110000",
+    "united": "1100011111101",
+    "university": "1101100101101",
+    "up": "11000111001",
+    "us": "0111011001",
+    "use": "11000000100",
+    "used": "110000001010",
+    "user": "1101111111101",
+    "using": "1100001001110",
+    "v": "1011111",
+    "very": "000000111011",
+    "video": "010101010001",
+    "view": "01010100111",
+    "w": "1101000",
+    "want": "1011110110001",
+    "was": "1100001000",
+    "way": "1101100001011",
+    "we": "1100000000",
+    "web": "01010111111",
+    "well": "010101010000",
+    "were": "00000011100",
+    "what": "11000110001",
+    "when": "01110111001",
+    "where": "010101001101",
+    "which": "11000100110",
+    "who": "01110100001",
+    "will": "1011110100",
+    "with": "110100101",
+    "within": "1011110111100",
+    "work": "101111011101",
+    "world": "110000100110",
+    "would": "01010000010",
+    "x": "110000011",
+    "y": "000001",
+    "year": "110001100001",
+    "years": "000000111111",
+    "you": "110000010",
+    "your": "1101111100",
+    "z": "0101010101"
+  },
+  "tree": {
+    "code": "",
+    "left": {
+      "code": "0",
+      "left": {
+        "code": "00",
+        "left": {
+          "code": "000",
+          "left": {
+            "code": "0000",
+            "left": {
+              "code": "00000",
+              "left": {
+                "code": "000000",
+                "left": {
+                  "code": "0000000",
+                  "left": {
+                    "code": "00000000",
+                    "left": {
+                      "char": "as",
+                      "freq": 0.15277072763205854,
+                      "code": "000000000"
+                    },
+                    "right": {
+                      "code": "000000001",
+                      "left": {
+                        "char": "other",
+                        "freq": 0.07638536381602927,
+                        "code": "0000000010"
+                      },
+                      "right": {
+                        "code": "0000000011",
+                        "left": {
+                          "code": "00000000110",
+                          "left": {
+                            "char": "many",
+                            "freq": 0.019096340954007317,
+                            "code": "000000001100"
+                          },
+                          "right": {
+                            "char": "need",
+                            "freq": 0.019200692543919925,
+                            "code": "000000001101"
+                          }
+                        },
+                        "right": {
+                          "char": "services",
+                          "freq": 0.03861238170920162,
+                          "code": "00000000111"
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "00000001",
+                    "left": {
+                      "code": "000000010",
+                      "left": {
+                        "code": "0000000100",
+                        "left": {
+                          "code": "00000001000",
+                          "left": {
+                            "char": "sex",
+                            "freq": 0.01930619085460081,
+                            "code": "000000010000"
+                          },
+                          "right": {
+                            "char": "group",
+                            "freq": 0.019412854892471527,
+                            "code": "000000010001"
+                          }
+                        },
+                        "right": {
+                          "code": "00000001001",
+                          "left": {
+                            "char": "read",
+                            "freq": 0.019520704086318594,
+                            "code": "000000010010"
+                          },
+                          "right": {
+                            "char": "company",
+                            "freq": 0.019740037840097455,
+                            "code": "000000010011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "char": "one",
+                        "freq": 0.07808281634527438,
+                        "code": "0000000101"
+                      }
+                    },
+                    "right": {
+                      "code": "000000011",
+                      "left": {
+                        "code": "0000000110",
+                        "left": {
+                          "char": "me",
+                          "freq": 0.03948007568019491,
+                          "code": "00000001100"
+                        },
+                        "right": {
+                          "code": "00000001101",
+                          "left": {
+                            "char": "items",
+                            "freq": 0.01985156347761213,
+                            "code": "000000011010"
+                          },
+                          "right": {
+                            "char": "book",
+                            "freq": 0.019964356451916743,
+                            "code": "000000011011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "char": "our",
+                        "freq": 0.07985742580766697,
+                        "code": "0000000111"
+                      }
+                    }
+                  }
+                },
+                "right": {
+                  "code": "0000001",
+                  "left": {
+                    "char": "by",
+                    "freq": 0.3194297032306679,
+                    "code": "00000010"
+                  },
+                  "right": {
+                    "code": "00000011",
+                    "left": {
+                      "char": "at",
+                      "freq": 0.15971485161533394,
+                      "code": "000000110"
+                    },
+                    "right": {
+                      "code": "000000111",
+                      "left": {
+                        "code": "0000001110",
+                        "left": {
+                          "char": "were",
+                          "freq": 0.039928712903833485,
+                          "code": "00000011100"
+                        },
+                        "right": {
+                          "code": "00000011101",
+                          "left": {
+                            "char": "privacy",
+                            "freq": 0.02007843848878484,
+                            "code": "000000111010"
+                          },
+                          "right": {
+                            "char": "very",
+                            "freq": 0.020193831813433028,
+                            "code": "000000111011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "0000001111",
+                        "left": {
+                          "char": "how",
+                          "freq": 0.040387663626866056,
+                          "code": "00000011110"
+                        },
+                        "right": {
+                          "code": "00000011111",
+                          "left": {
+                            "char": "order",
+                            "freq": 0.020310559164955763,
+                            "code": "000000111110"
+                          },
+                          "right": {
+                            "char": "years",
+                            "freq": 0.020428643811263643,
+                            "code": "000000111111"
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              },
+              "right": {
+                "char": "y",
+                "freq": 1.2780653133265139,
+                "code": "000001"
+              }
+            },
+            "right": {
+              "char": "h",
+              "freq": 2.827730505641368,
+              "code": "00001"
+            }
+          },
+          "right": {
+            "char": "r",
+            "freq": 5.390426826616117,
+            "code": "0001"
+          }
+        },
+        "right": {
+          "code": "001",
+          "left": {
+            "char": "s",
+            "freq": 5.5777471988335,
+            "code": "0010"
+          },
+          "right": {
+            "char": "o",
+            "freq": 5.6526006457158235,
+            "code": "0011"
+          }
+        }
+      },
+      "right": {
+        "code": "01",
+        "left": {
+          "code": "010",
+          "left": {
+            "char": "n",
+            "freq": 5.663859556676335,
+            "code": "0100"
+          },
+          "right": {
+            "code": "0101",
+            "left": {
+              "code": "01010",
+              "left": {
+                "code": "010100",
+                "left": {
+                  "code": "0101000",
+                  "left": {
+                    "code": "01010000",
+                    "left": {
+                      "code": "010100000",
+                      "left": {
+                        "char": "but",
+                        "freq": 0.08171457524505457,
+                        "code": "0101000000"
+                      },
+                      "right": {
+                        "code": "0101000001",
+                        "left": {
+                          "char": "would",
+                          "freq": 0.040857287622527286,
+                          "code": "01010000010"
+                        },
+                        "right": {
+                          "code": "01010000011",
+                          "left": {
+                            "char": "review",
+                            "freq": 0.020548109564545888,
+                            "code": "010100000110"
+                          },
+                          "right": {
+                            "char": "she",
+                            "freq": 0.020668980797278507,
+                            "code": "010100000111"
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "010100001",
+                      "left": {
+                        "code": "0101000010",
+                        "left": {
+                          "char": "been",
+                          "freq": 0.041337961594557014,
+                          "code": "01010000100"
+                        },
+                        "right": {
+                          "code": "01010000101",
+                          "left": {
+                            "char": "links",
+                            "freq": 0.02079128245880087,
+                            "code": "010100001010"
+                          },
+                          "right": {
+                            "char": "each",
+                            "freq": 0.020915040092484204,
+                            "code": "010100001011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "char": "free",
+                        "freq": 0.08366016036993681,
+                        "code": "0101000011"
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "01010001",
+                    "left": {
+                      "char": "from",
+                      "freq": 0.16732032073987363,
+                      "code": "010100010"
+                    },
+                    "right": {
+                      "code": "010100011",
+                      "left": {
+                        "code": "0101000110",
+                        "left": {
+                          "char": "am",
+                          "freq": 0.04183008018496841,
+                          "code": "01010001100"
+                        },
+                        "right": {
+                          "char": "first",
+                          "freq": 0.04233405705466683,
+                          "code": "01010001101"
+                        }
+                      },
+                      "right": {
+                        "code": "0101000111",
+                        "left": {
+                          "code": "01010001110",
+                          "left": {
+                            "char": "through",
+                            "freq": 0.021167028527333414,
+                            "code": "010100011100"
+                          },
+                          "right": {
+                            "char": "school",
+                            "freq": 0.021295313548711194,
+                            "code": "010100011101"
+                          }
+                        },
+                        "right": {
+                          "code": "01010001111",
+                          "left": {
+                            "char": "high",
+                            "freq": 0.02142516302156919,
+                            "code": "010100011110"
+                          },
+                          "right": {
+                            "char": "books",
+                            "freq": 0.021556605739492925,
+                            "code": "010100011111"
+                          }
+                        }
+                      }
+                    }
+                  }
+                },
+                "right": {
+                  "code": "0101001",
+                  "left": {
+                    "code": "01010010",
+                    "left": {
+                      "code": "010100100",
+                      "left": {
+                        "char": "search",
+                        "freq": 0.08570065208627677,
+                        "code": "0101001000"
+                      },
+                      "right": {
+                        "code": "0101001001",
+                        "left": {
+                          "code": "01010010010",
+                          "left": {
+                            "char": "public",
+                            "freq": 0.02168967120702066,
+                            "code": "010100100100"
+                          },
+                          "right": {
+                            "char": "rights",
+                            "freq": 0.02182438966172265,
+                            "code": "010100100101"
+                          }
+                        },
+                        "right": {
+                          "char": "online",
+                          "freq": 0.04392158419421684,
+                          "code": "01010010011"
+                        }
+                      }
+                    },
+                    "right": {
+                      "char": "are",
+                      "freq": 0.17568633677686735,
+                      "code": "010100101"
+                    }
+                  },
+                  "right": {
+                    "char": "that",
+                    "freq": 0.3513726735537347,
+                    "code": "01010011"
+                  }
+                }
+              },
+              "right": {
+                "code": "010101",
+                "left": {
+                  "code": "0101010",
+                  "left": {
+                    "code": "01010100",
+                    "left": {
+                      "char": "j",
+                      "freq": 0.17606710555444588,
+                      "code": "010101000"
+                    },
+                    "right": {
+                      "code": "010101001",
+                      "left": {
+                        "char": "has",
+                        "freq": 0.08784316838843367,
+                        "code": "0101010010"
+                      },
+                      "right": {
+                        "code": "0101010011",
+                        "left": {
+                          "code": "01010100110",
+                          "left": {
+                            "char": "info",
+                            "freq": 0.02196079209710842,
+                            "code": "010101001100"
+                          },
+                          "right": {
+                            "char": "where",
+                            "freq": 0.022098910286398408,
+                            "code": "010101001101"
+                          }
+                        },
+                        "right": {
+                          "char": "view",
+                          "freq": 0.04447755361439679,
+                          "code": "01010100111"
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "01010101",
+                    "left": {
+                      "code": "010101010",
+                      "left": {
+                        "code": "0101010100",
+                        "left": {
+                          "code": "01010101000",
+                          "left": {
+                            "char": "well",
+                            "freq": 0.02238042506711686,
+                            "code": "010101010000"
+                          },
+                          "right": {
+                            "char": "video",
+                            "freq": 0.022523889330367607,
+                            "code": "010101010001"
+                          }
+                        },
+                        "right": {
+                          "char": "pm",
+                          "freq": 0.04504777866073521,
+                          "code": "01010101001"
+                        }
+                      },
+                      "right": {
+                        "char": "z",
+                        "freq": 0.09007941735655482,
+                        "code": "0101010101"
+                      }
+                    },
+                    "right": {
+                      "code": "010101011",
+                      "left": {
+                        "char": "my",
+                        "freq": 0.09009555732147043,
+                        "code": "0101010110"
+                      },
+                      "right": {
+                        "code": "0101010111",
+                        "left": {
+                          "code": "01010101110",
+                          "left": {
+                            "char": "good",
+                            "freq": 0.02266920474540224,
+                            "code": "010101011100"
+                          },
+                          "right": {
+                            "char": "jan",
+                            "freq": 0.022816407373619136,
+                            "code": "010101011101"
+                          }
+                        },
+                        "right": {
+                          "char": "get",
+                          "freq": 0.04563281474723827,
+                          "code": "01010101111"
+                        }
+                      }
+                    }
+                  }
+                },
+                "right": {
+                  "code": "0101011",
+                  "left": {
+                    "code": "01010110",
+                    "left": {
+                      "code": "010101100",
+                      "left": {
+                        "code": "0101011000",
+                        "left": {
+                          "code": "01010110000",
+                          "left": {
+                            "char": "then",
+                            "freq": 0.022965534219198346,
+                            "code": "010101100000"
+                          },
+                          "right": {
+                            "char": "software",
+                            "freq": 0.023116623260114124,
+                            "code": "010101100001"
+                          }
+                        },
+                        "right": {
+                          "char": "help",
+                          "freq": 0.04623324652022825,
+                          "code": "01010110001"
+                        }
+                      },
+                      "right": {
+                        "char": "page",
+                        "freq": 0.0924664930404565,
+                        "code": "0101011001"
+                      }
+                    },
+                    "right": {
+                      "char": "be",
+                      "freq": 0.184932986080913,
+                      "code": "010101101"
+                    }
+                  },
+                  "right": {
+                    "code": "01010111",
+                    "left": {
+                      "code": "010101110",
+                      "left": {
+                        "code": "0101011100",
+                        "left": {
+                          "code": "01010111000",
+                          "left": {
+                            "char": "best",
+                            "freq": 0.023269713480379782,
+                            "code": "010101110000"
+                          },
+                          "right": {
+                            "char": "after",
+                            "freq": 0.023424844903582313,
+                            "code": "010101110001"
+                          }
+                        },
+                        "right": {
+                          "char": "now",
+                          "freq": 0.04684968980716463,
+                          "code": "01010111001"
+                        }
+                      },
+                      "right": {
+                        "code": "0101011101",
+                        "left": {
+                          "code": "01010111010",
+                          "left": {
+                            "char": "message",
+                            "freq": 0.02358205862776743,
+                            "code": "010101110100"
+                          },
+                          "right": {
+                            "char": "support",
+                            "freq": 0.02374139686173883,
+                            "code": "010101110101"
+                          }
+                        },
+                        "right": {
+                          "char": "also",
+                          "freq": 0.04748279372347766,
+                          "code": "01010111011"
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "010101111",
+                      "left": {
+                        "char": "if",
+                        "freq": 0.09496558744695532,
+                        "code": "0101011110"
+                      },
+                      "right": {
+                        "code": "0101011111",
+                        "left": {
+                          "code": "01010111110",
+                          "left": {
+                            "char": "copyright",
+                            "freq": 0.023902902962839097,
+                            "code": "010101111100"
+                          },
+                          "right": {
+                            "char": "available",
+                            "freq": 0.024066621476283193,
+                            "code": "010101111101"
+                          }
+                        },
+                        "right": {
+                          "char": "web",
+                          "freq": 0.04813324295256639,
+                          "code": "01010111111"
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            },
+            "right": {
+              "char": "d",
+              "freq": 2.9708516663371447,
+              "code": "01011"
+            }
+          }
+        },
+        "right": {
+          "code": "011",
+          "left": {
+            "char": "i",
+            "freq": 6.223948855828598,
+            "code": "0110"
+          },
+          "right": {
+            "code": "0111",
+            "left": {
+              "code": "01110",
+              "left": {
+                "char": "f",
+                "freq": 1.5256591330585383,
+                "code": "011100"
+              },
+              "right": {
+                "code": "011101",
+                "left": {
+                  "code": "0111010",
+                  "left": {
+                    "code": "01110100",
+                    "left": {
+                      "code": "011101000",
+                      "left": {
+                        "code": "0111010000",
+                        "left": {
+                          "code": "01110100000",
+                          "left": {
+                            "char": "please",
+                            "freq": 0.02423259817611963,
+                            "code": "011101000000"
+                          },
+                          "right": {
+                            "char": "such",
+                            "freq": 0.02440088010789824,
+                            "code": "011101000001"
+                          }
+                        },
+                        "right": {
+                          "char": "who",
+                          "freq": 0.04880176021579648,
+                          "code": "01110100001"
+                        }
+                      },
+                      "right": {
+                        "char": "about",
+                        "freq": 0.09760352043159295,
+                        "code": "0111010001"
+                      }
+                    },
+                    "right": {
+                      "char": "or",
+                      "freq": 0.1952070408631859,
+                      "code": "011101001"
+                    }
+                  },
+                  "right": {
+                    "char": "on",
+                    "freq": 0.3904140817263718,
+                    "code": "01110101"
+                  }
+                },
+                "right": {
+                  "code": "0111011",
+                  "left": {
+                    "code": "01110110",
+                    "left": {
+                      "code": "011101100",
+                      "left": {
+                        "code": "0111011000",
+                        "left": {
+                          "code": "01110110000",
+                          "left": {
+                            "char": "number",
+                            "freq": 0.024571515633128302,
+                            "code": "011101100000"
+                          },
+                          "right": {
+                            "char": "policy",
+                            "freq": 0.02474455447561512,
+                            "code": "011101100001"
+                          }
+                        },
+                        "right": {
+                          "char": "business",
+                          "freq": 0.04948910895123024,
+                          "code": "01110110001"
+                        }
+                      },
+                      "right": {
+                        "char": "us",
+                        "freq": 0.10039219244392418,
+                        "code": "0111011001"
+                      }
+                    },
+                    "right": {
+                      "code": "011101101",
+                      "left": {
+                        "code": "0111011010",
+                        "left": {
+                          "char": "here",
+                          "freq": 0.05019609622196209,
+                          "code": "01110110100"
+                        },
+                        "right": {
+                          "code": "01110110101",
+                          "left": {
+                            "char": "add",
+                            "freq": 0.02492004776976842,
+                            "code": "011101101010"
+                          },
+                          "right": {
+                            "char": "city",
+                            "freq": 0.025278609608182356,
+                            "code": "011101101011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "0111011011",
+                        "left": {
+                          "char": "contact",
+                          "freq": 0.05092357587735285,
+                          "code": "01110110110"
+                        },
+                        "right": {
+                          "code": "01110110111",
+                          "left": {
+                            "char": "her",
+                            "freq": 0.025461787938676424,
+                            "code": "011101101110"
+                          },
+                          "right": {
+                            "char": "post",
+                            "freq": 0.025647640405382095,
+                            "code": "011101101111"
+                          }
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "01110111",
+                    "left": {
+                      "code": "011101110",
+                      "left": {
+                        "code": "0111011100",
+                        "left": {
+                          "code": "01110111000",
+                          "left": {
+                            "code": "011101110000",
+                            "left": {
+                              "char": "index",
+                              "freq": 0.012870793903067203,
+                              "code": "0111011100000"
+                            },
+                            "right": {
+                              "char": "prices",
+                              "freq": 0.012918112998299069,
+                              "code": "0111011100001"
+                            }
+                          },
+                          "right": {
+                            "char": "system",
+                            "freq": 0.025836225996598138,
+                            "code": "011101110001"
+                          }
+                        },
+                        "right": {
+                          "char": "when",
+                          "freq": 0.051672451993196276,
+                          "code": "01110111001"
+                        }
+                      },
+                      "right": {
+                        "char": "can",
+                        "freq": 0.10334490398639255,
+                        "code": "0111011101"
+                      }
+                    },
+                    "right": {
+                      "char": "not",
+                      "freq": 0.2066898079727851,
+                      "code": "011101111"
+                    }
+                  }
+                }
+              }
+            },
+            "right": {
+              "char": "c",
+              "freq": 3.1567028448224552,
+              "code": "01111"
+            }
+          }
+        }
+      }
+    },
+    "right": {
+      "code": "1",
+      "left": {
+        "code": "10",
+        "left": {
+          "code": "100",
+          "left": {
+            "char": "t",
+            "freq": 6.572667732766463,
+            "code": "1000"
+          },
+          "right": {
+            "char": "a",
+            "freq": 6.617498425707375,
+            "code": "1001"
+          }
+        },
+        "right": {
+          "code": "101",
+          "left": {
+            "code": "1010",
+            "left": {
+              "code": "10100",
+              "left": {
+                "code": "101000",
+                "left": {
+                  "code": "1010000",
+                  "left": {
+                    "code": "10100000",
+                    "left": {
+                      "code": "101000000",
+                      "left": {
+                        "code": "1010000000",
+                        "left": {
+                          "code": "10100000000",
+                          "left": {
+                            "code": "101000000000",
+                            "left": {
+                              "char": "special",
+                              "freq": 0.012965781311945927,
+                              "code": "1010000000000"
+                            },
+                            "right": {
+                              "char": "check",
+                              "freq": 0.013013802724212396,
+                              "code": "1010000000001"
+                            }
+                          },
+                          "right": {
+                            "char": "product",
+                            "freq": 0.026027605448424793,
+                            "code": "101000000001"
+                          }
+                        },
+                        "right": {
+                          "code": "10100000001",
+                          "left": {
+                            "code": "101000000010",
+                            "left": {
+                              "char": "black",
+                              "freq": 0.013062181173001288,
+                              "code": "1010000000100"
+                            },
+                            "right": {
+                              "char": "even",
+                              "freq": 0.013110920654990098,
+                              "code": "1010000000101"
+                            }
+                          },
+                          "right": {
+                            "char": "should",
+                            "freq": 0.026221841309980197,
+                            "code": "101000000011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1010000001",
+                        "left": {
+                          "char": "his",
+                          "freq": 0.052443682619960394,
+                          "code": "10100000010"
+                        },
+                        "right": {
+                          "code": "10100000011",
+                          "left": {
+                            "char": "them",
+                            "freq": 0.026418998011558996,
+                            "code": "101000000110"
+                          },
+                          "right": {
+                            "code": "101000000111",
+                            "left": {
+                              "char": "show",
+                              "freq": 0.013209499005779498,
+                              "code": "1010000001110"
+                            },
+                            "right": {
+                              "char": "code",
+                              "freq": 0.013259346171839043,
+                              "code": "1010000001111"
+                            }
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "101000001",
+                      "left": {
+                        "char": "home",
+                        "freq": 0.10647656774355595,
+                        "code": "1010000010"
+                      },
+                      "right": {
+                        "code": "1010000011",
+                        "left": {
+                          "char": "so",
+                          "freq": 0.053238283871777974,
+                          "code": "10100000110"
+                        },
+                        "right": {
+                          "code": "10100000111",
+                          "left": {
+                            "char": "make",
+                            "freq": 0.026619141935888987,
+                            "code": "101000001110"
+                          },
+                          "right": {
+                            "code": "101000001111",
+                            "left": {
+                              "char": "based",
+                              "freq": 0.013360177701662914,
+                              "code": "1010000011110"
+                            },
+                            "right": {
+                              "char": "long",
+                              "freq": 0.013411170746325751,
+                              "code": "1010000011111"
+                            }
+                          }
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "10100001",
+                    "left": {
+                      "code": "101000010",
+                      "left": {
+                        "code": "1010000100",
+                        "left": {
+                          "code": "10100001000",
+                          "left": {
+                            "char": "data",
+                            "freq": 0.026822341492651502,
+                            "code": "101000010000"
+                          },
+                          "right": {
+                            "char": "buy",
+                            "freq": 0.02702866719644113,
+                            "code": "101000010001"
+                          }
+                        },
+                        "right": {
+                          "char": "only",
+                          "freq": 0.05405733439288226,
+                          "code": "10100001001"
+                        }
+                      },
+                      "right": {
+                        "code": "1010000101",
+                        "left": {
+                          "code": "10100001010",
+                          "left": {
+                            "code": "101000010100",
+                            "left": {
+                              "char": "family",
+                              "freq": 0.013514333598220565,
+                              "code": "1010000101000"
+                            },
+                            "right": {
+                              "char": "forum",
+                              "freq": 0.013566512492422191,
+                              "code": "1010000101001"
+                            }
+                          },
+                          "right": {
+                            "char": "music",
+                            "freq": 0.02723819174835152,
+                            "code": "101000010101"
+                          }
+                        },
+                        "right": {
+                          "code": "10100001011",
+                          "left": {
+                            "code": "101000010110",
+                            "left": {
+                              "char": "between",
+                              "freq": 0.01361909587417576,
+                              "code": "1010000101100"
+                            },
+                            "right": {
+                              "char": "subject",
+                              "freq": 0.013672088465125862,
+                              "code": "1010000101101"
+                            }
+                          },
+                          "right": {
+                            "char": "products",
+                            "freq": 0.02745099012138552,
+                            "code": "101000010111"
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "char": "it",
+                      "freq": 0.21960792097108417,
+                      "code": "101000011"
+                    }
+                  }
+                },
+                "right": {
+                  "char": "to",
+                  "freq": 0.8784316838843367,
+                  "code": "1010001"
+                }
+              },
+              "right": {
+                "char": "g",
+                "freq": 1.7544354855092337,
+                "code": "101001"
+              }
+            },
+            "right": {
+              "char": "the",
+              "freq": 3.5137267355373467,
+              "code": "10101"
+            }
+          },
+          "right": {
+            "code": "1011",
+            "left": {
+              "char": "l",
+              "freq": 3.554562948871405,
+              "code": "10110"
+            },
+            "right": {
+              "code": "10111",
+              "left": {
+                "char": "of",
+                "freq": 1.7568633677686734,
+                "code": "101110"
+              },
+              "right": {
+                "code": "101111",
+                "left": {
+                  "code": "1011110",
+                  "left": {
+                    "char": "is",
+                    "freq": 0.43921584194216834,
+                    "code": "10111100"
+                  },
+                  "right": {
+                    "code": "10111101",
+                    "left": {
+                      "code": "101111010",
+                      "left": {
+                        "char": "will",
+                        "freq": 0.10980396048554208,
+                        "code": "1011110100"
+                      },
+                      "right": {
+                        "code": "1011110101",
+                        "left": {
+                          "char": "see",
+                          "freq": 0.05490198024277104,
+                          "code": "10111101010"
+                        },
+                        "right": {
+                          "code": "10111101011",
+                          "left": {
+                            "code": "101111010110",
+                            "left": {
+                              "char": "reserved",
+                              "freq": 0.01372549506069276,
+                              "code": "1011110101100"
+                            },
+                            "right": {
+                              "char": "shipping",
+                              "freq": 0.013779320531519007,
+                              "code": "1011110101101"
+                            }
+                          },
+                          "right": {
+                            "char": "most",
+                            "freq": 0.027667139649900363,
+                            "code": "101111010111"
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "101111011",
+                      "left": {
+                        "code": "1011110110",
+                        "left": {
+                          "code": "10111101100",
+                          "left": {
+                            "code": "101111011000",
+                            "left": {
+                              "char": "phone",
+                              "freq": 0.013833569824950182,
+                              "code": "1011110110000"
+                            },
+                            "right": {
+                              "char": "want",
+                              "freq": 0.013888247966550776,
+                              "code": "1011110110001"
+                            }
+                          },
+                          "right": {
+                            "char": "last",
+                            "freq": 0.02788672012331227,
+                            "code": "101111011001"
+                          }
+                        },
+                        "right": {
+                          "char": "there",
+                          "freq": 0.05577344024662454,
+                          "code": "10111101101"
+                        }
+                      },
+                      "right": {
+                        "code": "1011110111",
+                        "left": {
+                          "code": "10111101110",
+                          "left": {
+                            "code": "101111011100",
+                            "left": {
+                              "char": "area",
+                              "freq": 0.013943360061656135,
+                              "code": "1011110111000"
+                            },
+                            "right": {
+                              "char": "states",
+                              "freq": 0.013998911296961541,
+                              "code": "1011110111001"
+                            }
+                          },
+                          "right": {
+                            "char": "work",
+                            "freq": 0.028109813884298774,
+                            "code": "101111011101"
+                          }
+                        },
+                        "right": {
+                          "code": "10111101111",
+                          "left": {
+                            "code": "101111011110",
+                            "left": {
+                              "char": "within",
+                              "freq": 0.014054906942149387,
+                              "code": "1011110111100"
+                            },
+                            "right": {
+                              "char": "community",
+                              "freq": 0.01411135235155561,
+                              "code": "1011110111101"
+                            }
+                          },
+                          "right": {
+                            "code": "101111011111",
+                            "left": {
+                              "char": "address",
+                              "freq": 0.014168252965876399,
+                              "code": "1011110111110"
+                            },
+                            "right": {
+                              "char": "internet",
+                              "freq": 0.014225614313916385,
+                              "code": "1011110111111"
+                            }
+                          }
+                        }
+                      }
+                    }
+                  }
+                },
+                "right": {
+                  "char": "v",
+                  "freq": 0.922298933481778,
+                  "code": "1011111"
+                }
+              }
+            }
+          }
+        }
+      },
+      "right": {
+        "code": "11",
+        "left": {
+          "code": "110",
+          "left": {
+            "code": "1100",
+            "left": {
+              "code": "11000",
+              "left": {
+                "code": "110000",
+                "left": {
+                  "code": "1100000",
+                  "left": {
+                    "code": "11000000",
+                    "left": {
+                      "code": "110000000",
+                      "left": {
+                        "char": "we",
+                        "freq": 0.11334602372701119,
+                        "code": "1100000000"
+                      },
+                      "right": {
+                        "code": "1100000001",
+                        "left": {
+                          "char": "any",
+                          "freq": 0.056673011863505596,
+                          "code": "11000000010"
+                        },
+                        "right": {
+                          "code": "11000000011",
+                          "left": {
+                            "char": "go",
+                            "freq": 0.028566884028758923,
+                            "code": "110000000110"
+                          },
+                          "right": {
+                            "code": "110000000111",
+                            "left": {
+                              "char": "posted",
+                              "freq": 0.014283442014379462,
+                              "code": "1100000001110"
+                            },
+                            "right": {
+                              "char": "take",
+                              "freq": 0.014341741777703459,
+                              "code": "1100000001111"
+                            }
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "110000001",
+                      "left": {
+                        "code": "1100000010",
+                        "left": {
+                          "char": "use",
+                          "freq": 0.057602077631759785,
+                          "code": "11000000100"
+                        },
+                        "right": {
+                          "code": "11000000101",
+                          "left": {
+                            "char": "used",
+                            "freq": 0.028801038815879892,
+                            "code": "110000001010"
+                          },
+                          "right": {
+                            "code": "110000001011",
+                            "left": {
+                              "char": "design",
+                              "freq": 0.014400519407939946,
+                              "code": "1100000010110"
+                            },
+                            "right": {
+                              "char": "car",
+                              "freq": 0.01445978080468044,
+                              "code": "1100000010111"
+                            }
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1100000011",
+                        "left": {
+                          "code": "11000000110",
+                          "left": {
+                            "char": "next",
+                            "freq": 0.02903906393006072,
+                            "code": "110000001100"
+                          },
+                          "right": {
+                            "code": "110000001101",
+                            "left": {
+                              "char": "national",
+                              "freq": 0.01451953196503036,
+                              "code": "1100000011010"
+                            },
+                            "right": {
+                              "char": "education",
+                              "freq": 0.014579778985632142,
+                              "code": "1100000011011"
+                            }
+                          }
+                        },
+                        "right": {
+                          "char": "out",
+                          "freq": 0.05856211225895577,
+                          "code": "11000000111"
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "11000001",
+                    "left": {
+                      "char": "you",
+                      "freq": 0.2342484490358231,
+                      "code": "110000010"
+                    },
+                    "right": {
+                      "char": "x",
+                      "freq": 0.2345155969703717,
+                      "code": "110000011"
+                    }
+                  }
+                },
+                "right": {
+                  "code": "1100001",
+                  "left": {
+                    "code": "11000010",
+                    "left": {
+                      "code": "110000100",
+                      "left": {
+                        "char": "was",
+                        "freq": 0.11712422451791155,
+                        "code": "1100001000"
+                      },
+                      "right": {
+                        "code": "1100001001",
+                        "left": {
+                          "code": "11000010010",
+                          "left": {
+                            "char": "re",
+                            "freq": 0.029281056129477886,
+                            "code": "110000100100"
+                          },
+                          "right": {
+                            "code": "110000100101",
+                            "left": {
+                              "char": "office",
+                              "freq": 0.014640528064738943,
+                              "code": "1100001001010"
+                            },
+                            "right": {
+                              "char": "results",
+                              "freq": 0.014701785504340361,
+                              "code": "1100001001011"
+                            }
+                          }
+                        },
+                        "right": {
+                          "code": "11000010011",
+                          "left": {
+                            "char": "world",
+                            "freq": 0.029527115424683587,
+                            "code": "110000100110"
+                          },
+                          "right": {
+                            "code": "110000100111",
+                            "left": {
+                              "char": "using",
+                              "freq": 0.014763557712341793,
+                              "code": "1100001001110"
+                            },
+                            "right": {
+                              "char": "those",
+                              "freq": 0.014825851204798929,
+                              "code": "1100001001111"
+                            }
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "110000101",
+                      "left": {
+                        "code": "1100001010",
+                        "left": {
+                          "char": "news",
+                          "freq": 0.059554690432836385,
+                          "code": "11000010100"
+                        },
+                        "right": {
+                          "code": "11000010101",
+                          "left": {
+                            "code": "110000101010",
+                            "left": {
+                              "char": "local",
+                              "freq": 0.014888672608209096,
+                              "code": "1100001010100"
+                            },
+                            "right": {
+                              "char": "because",
+                              "freq": 0.01495202866186105,
+                              "code": "1100001010101"
+                            }
+                          },
+                          "right": {
+                            "char": "health",
+                            "freq": 0.030031852440490146,
+                            "code": "110000101011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1100001011",
+                        "left": {
+                          "code": "11000010110",
+                          "left": {
+                            "code": "110000101100",
+                            "left": {
+                              "char": "type",
+                              "freq": 0.015015926220245073,
+                              "code": "1100001011000"
+                            },
+                            "right": {
+                              "char": "right",
+                              "freq": 0.015080372255525096,
+                              "code": "1100001011001"
+                            }
+                          },
+                          "right": {
+                            "char": "two",
+                            "freq": 0.03029074772014954,
+                            "code": "110000101101"
+                          }
+                        },
+                        "right": {
+                          "char": "their",
+                          "freq": 0.06058149544029908,
+                          "code": "11000010111"
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "char": ">",
+                    "freq": 0.4850512069043265,
+                    "code": "11000011"
+                  }
+                }
+              },
+              "right": {
+                "code": "110001",
+                "left": {
+                  "code": "1100010",
+                  "left": {
+                    "code": "11000100",
+                    "left": {
+                      "code": "110001000",
+                      "left": {
+                        "char": "an",
+                        "freq": 0.12116299088059816,
+                        "code": "1100010000"
+                      },
+                      "right": {
+                        "char": "q",
+                        "freq": 0.12233957785056945,
+                        "code": "1100010001"
+                      }
+                    },
+                    "right": {
+                      "code": "110001001",
+                      "left": {
+                        "code": "1100010010",
+                        "left": {
+                          "code": "11000100100",
+                          "left": {
+                            "code": "110001001000",
+                            "left": {
+                              "char": "send",
+                              "freq": 0.01514537386007477,
+                              "code": "1100010010000"
+                            },
+                            "right": {
+                              "char": "did",
+                              "freq": 0.015210938249079424,
+                              "code": "1100010010001"
+                            }
+                          },
+                          "right": {
+                            "char": "email",
+                            "freq": 0.030554145526411714,
+                            "code": "110001001001"
+                          }
+                        },
+                        "right": {
+                          "code": "11000100101",
+                          "left": {
+                            "code": "110001001010",
+                            "left": {
+                              "char": "hotels",
+                              "freq": 0.015277072763205857,
+                              "code": "1100010010100"
+                            },
+                            "right": {
+                              "char": "before",
+                              "freq": 0.015343784871342124,
+                              "code": "1100010010101"
+                            }
+                          },
+                          "right": {
+                            "char": "into",
+                            "freq": 0.030822164346818826,
+                            "code": "110001001011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1100010011",
+                        "left": {
+                          "char": "which",
+                          "freq": 0.06164432869363765,
+                          "code": "11000100110"
+                        },
+                        "right": {
+                          "code": "11000100111",
+                          "left": {
+                            "code": "110001001110",
+                            "left": {
+                              "char": "terms",
+                              "freq": 0.015411082173409413,
+                              "code": "1100010011100"
+                            },
+                            "right": {
+                              "char": "line",
+                              "freq": 0.015478972403248225,
+                              "code": "1100010011101"
+                            }
+                          },
+                          "right": {
+                            "char": "day",
+                            "freq": 0.031094926863162363,
+                            "code": "110001001111"
+                          }
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "char": "for",
+                    "freq": 0.5019609622196209,
+                    "code": "11000101"
+                  }
+                },
+                "right": {
+                  "code": "1100011",
+                  "left": {
+                    "code": "11000110",
+                    "left": {
+                      "code": "110001100",
+                      "left": {
+                        "code": "1100011000",
+                        "left": {
+                          "code": "11000110000",
+                          "left": {
+                            "code": "110001100000",
+                            "left": {
+                              "char": "details",
+                              "freq": 0.015547463431581181,
+                              "code": "1100011000000"
+                            },
+                            "right": {
+                              "char": "member",
+                              "freq": 0.015616563269054876,
+                              "code": "1100011000001"
+                            }
+                          },
+                          "right": {
+                            "char": "year",
+                            "freq": 0.03137256013872631,
+                            "code": "110001100001"
+                          }
+                        },
+                        "right": {
+                          "char": "what",
+                          "freq": 0.06274512027745262,
+                          "code": "11000110001"
+                        }
+                      },
+                      "right": {
+                        "char": "more",
+                        "freq": 0.12549024055490524,
+                        "code": "1100011001"
+                      }
+                    },
+                    "right": {
+                      "code": "110001101",
+                      "left": {
+                        "code": "1100011010",
+                        "left": {
+                          "code": "11000110100",
+                          "left": {
+                            "code": "110001101000",
+                            "left": {
+                              "char": "off",
+                              "freq": 0.015686280069363154,
+                              "code": "1100011010000"
+                            },
+                            "right": {
+                              "char": "report",
+                              "freq": 0.01575662213245447,
+                              "code": "1100011010001"
+                            }
+                          },
+                          "right": {
+                            "char": "state",
+                            "freq": 0.03165519581565177,
+                            "code": "110001101001"
+                          }
+                        },
+                        "right": {
+                          "code": "11000110101",
+                          "left": {
+                            "code": "110001101010",
+                            "left": {
+                              "char": "development",
+                              "freq": 0.015827597907825886,
+                              "code": "1100011010100"
+                            },
+                            "right": {
+                              "char": "made",
+                              "freq": 0.015899215997906547,
+                              "code": "1100011010101"
+                            }
+                          },
+                          "right": {
+                            "char": "over",
+                            "freq": 0.03194297032306679,
+                            "code": "110001101011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1100011011",
+                        "left": {
+                          "char": "may",
+                          "freq": 0.06388594064613358,
+                          "code": "11000110110"
+                        },
+                        "right": {
+                          "code": "11000110111",
+                          "left": {
+                            "code": "110001101110",
+                            "left": {
+                              "char": "comments",
+                              "freq": 0.015971485161533395,
+                              "code": "1100011011100"
+                            },
+                            "right": {
+                              "char": "travel",
+                              "freq": 0.01604441431752213,
+                              "code": "1100011011101"
+                            }
+                          },
+                          "right": {
+                            "char": "just",
+                            "freq": 0.03223602509667291,
+                            "code": "110001101111"
+                          }
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "11000111",
+                    "left": {
+                      "code": "110001110",
+                      "left": {
+                        "code": "1100011100",
+                        "left": {
+                          "code": "11000111000",
+                          "left": {
+                            "code": "110001110000",
+                            "left": {
+                              "char": "store",
+                              "freq": 0.016118012548336454,
+                              "code": "1100011100000"
+                            },
+                            "right": {
+                              "char": "must",
+                              "freq": 0.01619228910385874,
+                              "code": "1100011100001"
+                            }
+                          },
+                          "right": {
+                            "char": "name",
+                            "freq": 0.03253450681053099,
+                            "code": "110001110001"
+                          }
+                        },
+                        "right": {
+                          "char": "up",
+                          "freq": 0.06506901362106197,
+                          "code": "11000111001"
+                        }
+                      },
+                      "right": {
+                        "char": "new",
+                        "freq": 0.13013802724212395,
+                        "code": "1100011101"
+                      }
+                    },
+                    "right": {
+                      "code": "110001111",
+                      "left": {
+                        "code": "1100011110",
+                        "left": {
+                          "code": "11000111100",
+                          "left": {
+                            "code": "110001111000",
+                            "left": {
+                              "char": "center",
+                              "freq": 0.016267253405265494,
+                              "code": "1100011110000"
+                            },
+                            "right": {
+                              "char": "international",
+                              "freq": 0.016342915049010916,
+                              "code": "1100011110001"
+                            }
+                          },
+                          "right": {
+                            "char": "list",
+                            "freq": 0.03283856762184436,
+                            "code": "110001111001"
+                          }
+                        },
+                        "right": {
+                          "code": "11000111101",
+                          "left": {
+                            "code": "110001111010",
+                            "left": {
+                              "char": "item",
+                              "freq": 0.01641928381092218,
+                              "code": "1100011110100"
+                            },
+                            "right": {
+                              "char": "real",
+                              "freq": 0.016574182714798807,
+                              "code": "1100011110101"
+                            }
+                          },
+                          "right": {
+                            "char": "had",
+                            "freq": 0.033148365429597614,
+                            "code": "110001111011"
+                          }
+                        }
+                      },
+                      "right": {
+                        "code": "1100011111",
+                        "left": {
+                          "char": "he",
+                          "freq": 0.06629673085919523,
+                          "code": "11000111110"
+                        },
+                        "right": {
+                          "code": "11000111111",
+                          "left": {
+                            "code": "110001111110",
+                            "left": {
+                              "char": "hotel",
+                              "freq": 0.016652733343778897,
+                              "code": "1100011111100"
+                            },
+                            "right": {
+                              "char": "united",
+                              "freq": 0.01673203207398737,
+                              "code": "1100011111101"
+                            }
+                          },
+                          "right": {
+                            "char": "people",
+                            "freq": 0.03346406414797474,
+                            "code": "110001111111"
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            },
+            "right": {
+              "code": "11001",
+              "left": {
+                "char": "p",
+                "freq": 2.0410820393637827,
+                "code": "110010"
+              },
+              "right": {
+                "char": "m",
+                "freq": 2.1291685599002115,
+                "code": "110011"
+              }
+            }
+          },
+          "right": {
+            "code": "1101",
+            "left": {
+              "code": "11010",
+              "left": {
+                "code": "110100",
+                "left": {
+                  "char": "w",
+                  "freq": 1.0679690045730488,
+                  "code": "1101000"
+                },
+                "right": {
+                  "code": "1101001",
+                  "left": {
+                    "code": "11010010",
+                    "left": {
+                      "code": "110100100",
+                      "left": {
+                        "code": "1101001000",
+                        "left": {
+                          "code": "11010010000",
+                          "left": {
+                            "code": "110100100000",
+                            "left": {
+                              "char": "great",
+                              "freq": 0.01681208964371936,
+                              "code": "1101001000000"
+                            },
+                            "right": {
+                              "char": "could",
+                              "freq": 0.016892916997775703,
+                              "code": "1101001000001"
+                            }
+                          },
+                          "right": {
+                            "char": "top",
+                            "freq": 0.033785833995551406,
+                            "code": "110100100001"
+                          }
+                        },
+                        "right": {
+                          "char": "site",
+                          "freq": 0.06757166799110281,
+                          "code": "11010010001"
+                        }
+                      },
+                      "right": {
+                        "char": "have",
+                        "freq": 0.13514333598220563,
+                        "code": "1101001001"
+                      }
+                    },
+                    "right": {
+                      "char": "with",
+                      "freq": 0.27028667196441125,
+                      "code": "110100101"
+                    }
+                  },
+                  "right": {
+                    "char": "k",
+                    "freq": 0.5450234706995813,
+                    "code": "11010011"
+                  }
+                }
+              },
+              "right": {
+                "char": "u",
+                "freq": 2.2492243770426703,
+                "code": "110101"
+              }
+            },
+            "right": {
+              "code": "11011",
+              "left": {
+                "code": "110110",
+                "left": {
+                  "code": "1101100",
+                  "left": {
+                    "code": "11011000",
+                    "left": {
+                      "code": "110110000",
+                      "left": {
+                        "code": "1101100000",
+                        "left": {
+                          "code": "11011000000",
+                          "left": {
+                            "char": "back",
+                            "freq": 0.034113851801333465,
+                            "code": "110110000000"
+                          },
+                          "right": {
+                            "code": "110110000001",
+                            "left": {
+                              "char": "part",
+                              "freq": 0.01697452529245095,
+                              "code": "1101100000010"
+                            },
+                            "right": {
+                              "char": "management",
+                              "freq": 0.017140130417255352,
+                              "code": "1101100000011"
+                            }
+                          }
+                        },
+                        "right": {
+                          "char": "they",
+                          "freq": 0.06889660265759504,
+                          "code": "11011000001"
+                        }
+                      },
+                      "right": {
+                        "code": "1101100001",
+                        "left": {
+                          "code": "11011000010",
+                          "left": {
+                            "char": "date",
+                            "freq": 0.03444830132879752,
+                            "code": "110110000100"
+                          },
+                          "right": {
+                            "code": "110110000101",
+                            "left": {
+                              "char": "days",
+                              "freq": 0.01722415066439876,
+                              "code": "1101100001010"
+                            },
+                            "right": {
+                              "char": "way",
+                              "freq": 0.01730899869722831,
+                              "code": "1101100001011"
+                            }
+                          }
+                        },
+                        "right": {
+                          "code": "11011000011",
+                          "left": {
+                            "char": "price",
+                            "freq": 0.03478937361918165,
+                            "code": "110110000110"
+                          },
+                          "right": {
+                            "code": "110110000111",
+                            "left": {
+                              "char": "games",
+                              "freq": 0.017394686809590824,
+                              "code": "1101100001110"
+                            },
+                            "right": {
+                              "char": "know",
+                              "freq": 0.0174812275399868,
+                              "code": "1101100001111"
+                            }
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "110110001",
+                      "left": {
+                        "char": "all",
+                        "freq": 0.1405490694214939,
+                        "code": "1101100010"
+                      },
+                      "right": {
+                        "code": "1101100011",
+                        "left": {
+                          "char": "time",
+                          "freq": 0.07027453471074695,
+                          "code": "11011000110"
+                        },
+                        "right": {
+                          "code": "11011000111",
+                          "left": {
+                            "char": "find",
+                            "freq": 0.035137267355373474,
+                            "code": "110110001110"
+                          },
+                          "right": {
+                            "code": "110110001111",
+                            "left": {
+                              "char": "life",
+                              "freq": 0.017568633677686737,
+                              "code": "1101100011110"
+                            },
+                            "right": {
+                              "char": "program",
+                              "freq": 0.01765691826903189,
+                              "code": "1101100011111"
+                            }
+                          }
+                        }
+                      }
+                    }
+                  },
+                  "right": {
+                    "code": "11011001",
+                    "left": {
+                      "code": "110110010",
+                      "left": {
+                        "code": "1101100100",
+                        "left": {
+                          "code": "11011001000",
+                          "left": {
+                            "char": "than",
+                            "freq": 0.035492189247851996,
+                            "code": "110110010000"
+                          },
+                          "right": {
+                            "code": "110110010001",
+                            "left": {
+                              "char": "reviews",
+                              "freq": 0.017746094623925998,
+                              "code": "1101100100010"
+                            },
+                            "right": {
+                              "char": "map",
+                              "freq": 0.017836176322524603,
+                              "code": "1101100100011"
+                            }
+                          }
+                        },
+                        "right": {
+                          "char": "information",
+                          "freq": 0.07170870888851728,
+                          "code": "11011001001"
+                        }
+                      },
+                      "right": {
+                        "code": "1101100101",
+                        "left": {
+                          "code": "11011001010",
+                          "left": {
+                            "code": "110110010100",
+                            "left": {
+                              "char": "full",
+                              "freq": 0.01792717722212932,
+                              "code": "1101100101000"
+                            },
+                            "right": {
+                              "char": "mail",
+                              "freq": 0.018019111464294083,
+                              "code": "1101100101001"
+                            }
+                          },
+                          "right": {
+                            "char": "service",
+                            "freq": 0.03622398696430254,
+                            "code": "110110010101"
+                          }
+                        },
+                        "right": {
+                          "code": "11011001011",
+                          "left": {
+                            "code": "110110010110",
+                            "left": {
+                              "char": "january",
+                              "freq": 0.01811199348215127,
+                              "code": "1101100101100"
+                            },
+                            "right": {
+                              "char": "university",
+                              "freq": 0.018205838007965526,
+                              "code": "1101100101101"
+                            }
+                          },
+                          "right": {
+                            "char": "like",
+                            "freq": 0.03660132016184736,
+                            "code": "110110010111"
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "char": "this",
+                      "freq": 0.2928105612947789,
+                      "code": "110110011"
+                    }
+                  }
+                },
+                "right": {
+                  "char": "b",
+                  "freq": 1.166113558860177,
+                  "code": "1101101"
+                }
+              },
+              "right": {
+                "code": "110111",
+                "left": {
+                  "char": "and",
+                  "freq": 1.1712422451791156,
+                  "code": "1101110"
+                },
+                "right": {
+                  "code": "1101111",
+                  "left": {
+                    "char": "in",
+                    "freq": 0.5856211225895578,
+                    "code": "11011110"
+                  },
+                  "right": {
+                    "code": "11011111",
+                    "left": {
+                      "code": "110111110",
+                      "left": {
+                        "char": "your",
+                        "freq": 0.14640528064738945,
+                        "code": "1101111100"
+                      },
+                      "right": {
+                        "code": "1101111101",
+                        "left": {
+                          "char": "no",
+                          "freq": 0.07320264032369472,
+                          "code": "11011111010"
+                        },
+                        "right": {
+                          "code": "11011111011",
+                          "left": {
+                            "code": "110111110110",
+                            "left": {
+                              "char": "research",
+                              "freq": 0.01830066008092368,
+                              "code": "1101111101100"
+                            },
+                            "right": {
+                              "char": "general",
+                              "freq": 0.018396475055169354,
+                              "code": "1101111101101"
+                            }
+                          },
+                          "right": {
+                            "char": "its",
+                            "freq": 0.036986597216182596,
+                            "code": "110111110111"
+                          }
+                        }
+                      }
+                    },
+                    "right": {
+                      "code": "110111111",
+                      "left": {
+                        "code": "1101111110",
+                        "left": {
+                          "code": "11011111100",
+                          "left": {
+                            "code": "110111111000",
+                            "left": {
+                              "char": "under",
+                              "freq": 0.018493298608091298,
+                              "code": "1101111110000"
+                            },
+                            "right": {
+                              "char": "set",
+                              "freq": 0.01859114674887485,
+                              "code": "1101111110001"
+                            }
+                          },
+                          "right": {
+                            "char": "click",
+                            "freq": 0.037380071654652625,
+                            "code": "110111111001"
+                          }
+                        },
+                        "right": {
+                          "char": "do",
+                          "freq": 0.07476014330930525,
+                          "code": "11011111101"
+                        }
+                      },
+                      "right": {
+                        "code": "1101111111",
+                        "left": {
+                          "code": "11011111110",
+                          "left": {
+                            "code": "110111111100",
+                            "left": {
+                              "char": "does",
+                              "freq": 0.018690035827326312,
+                              "code": "1101111111000"
+                            },
+                            "right": {
+                              "char": "de",
+                              "freq": 0.018789982542980463,
+                              "code": "1101111111001"
+                            }
+                          },
+                          "right": {
+                            "char": "these",
+                            "freq": 0.03778200790900373,
+                            "code": "110111111101"
+                          }
+                        },
+                        "right": {
+                          "code": "11011111111",
+                          "left": {
+                            "code": "110111111110",
+                            "left": {
+                              "char": "said",
+                              "freq": 0.018891003954501866,
+                              "code": "1101111111100"
+                            },
+                            "right": {
+                              "char": "user",
+                              "freq": 0.018993117489391063,
+                              "code": "1101111111101"
+                            }
+                          },
+                          "right": {
+                            "char": "some",
+                            "freq": 0.038192681908014635,
+                            "code": "110111111111"
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        },
+        "right": {
+          "code": "111",
+          "left": {
+            "char": "e",
+            "freq": 9.594006830467405,
+            "code": "1110"
+          },
+          "right": {
+            "char": " ",
+            "freq": 10.594006830467405,
+            "code": "1111"
+          }
+        }
+      }
+    }
+  }
+};